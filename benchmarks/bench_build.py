@@ -0,0 +1,322 @@
+"""
+Build benchmark — PyToExe's own overhead around a stub PyInstaller.
+
+The interpreter setting is pointed at a wrapper script that runs the
+current Python with benchmarks/stub_pyinstaller first on PYTHONPATH, so
+`python -m PyInstaller` is a stand-in that prints a configurable amount
+of log output at a configurable rate and writes a dummy executable.
+Runs offline, on Linux, in a throw-away PYTOEXE_HOME.
+
+Measures:
+  build_command     constructing the PyInstaller command (µs per call)
+  log_pipeline      emit -> BuildLogFile + LogBuffer -> frame-sized drains,
+                    producer and consumer on separate threads (lines/s)
+  ui_responsiveness Tk event-loop lateness while the GUI runs a build
+                    (10 ms heartbeat; display picked as in bench_startup)
+  cache_hit         run_build() answered from the build cache (ms)
+  orchestration     run_build() minus running the same stub command
+                    directly — everything PyToExe adds to a build (ms)
+
+Regression gate:
+  python benchmarks/bench_build.py --save build-baseline.json
+  python benchmarks/bench_build.py --compare build-baseline.json --tolerance 0.15
+exits 1 if any metric's p50 got worse than the baseline by more than the
+tolerance (lower is better, except lines/s) and by more than --min-delta
+(overheads close to zero are mostly noise).
+"""
+
+import os
+import sys
+import json
+import time
+import stat
+import shutil
+import argparse
+import tempfile
+import threading
+import subprocess
+
+HERE    = os.path.dirname(os.path.abspath(__file__))
+ROOT    = os.path.dirname(HERE)
+STUB_PI = os.path.join(HERE, "stub_pyinstaller")
+STUB_TK = os.path.join(HERE, "stub_tk")
+
+sys.path.insert(0, ROOT)
+from bench_startup import percentile, pick_display   # noqa: E402
+
+HIGHER_IS_BETTER = {"log_pipeline_lines_per_s"}
+
+
+def stats(values: list) -> dict:
+    return {"n":   len(values),
+            "p50": round(percentile(values, 50), 3),
+            "p90": round(percentile(values, 90), 3),
+            "p99": round(percentile(values, 99), 3),
+            "max": round(max(values), 3)}
+
+
+def make_stub_python(folder: str) -> str:
+    """Write an 'interpreter' that sees the stub PyInstaller; return its path."""
+    path = os.path.join(folder, "python-stub")
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write("#!/bin/sh\n"
+                 f'PYTHONPATH="{STUB_PI}${{PYTHONPATH:+:$PYTHONPATH}}" '
+                 f'exec "{sys.executable}" "$@"\n')
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return path
+
+
+def make_project(folder: str, extras: int = 5) -> dict:
+    """A script, a local import and a few data files; return its cfg."""
+    proj = os.path.join(folder, "project")
+    os.makedirs(proj, exist_ok=True)
+    with open(os.path.join(proj, "helper.py"), "w") as fh:
+        fh.write("VALUE = 1\n")
+    with open(os.path.join(proj, "app.py"), "w") as fh:
+        fh.write("import helper\nprint(helper.VALUE)\n")
+    extra_files = []
+    for i in range(extras):
+        path = os.path.join(proj, f"data{i}.json")
+        with open(path, "w") as fh:
+            fh.write(json.dumps({"i": i}))
+        extra_files.append(path)
+    import py2exe_converter as core
+    return core.make_config({"script": "app.py", "extra_files": extra_files,
+                             "onefile": True}, proj)
+
+
+# ══════════════════════════════════════════════════════════
+#  BENCHMARKS
+# ══════════════════════════════════════════════════════════
+def bench_build_command(cfg: dict, python: str, n: int) -> dict:
+    import py2exe_converter as core
+    samples = []
+    for _ in range(n):
+        t = time.perf_counter()
+        for _ in range(100):
+            core.build_command(cfg, python)
+        samples.append((time.perf_counter() - t) * 1e6 / 100)
+    return {"build_command_us": stats(samples)}
+
+
+def bench_log_pipeline(lines: int, width: int, n: int) -> dict:
+    import py2exe_converter as core
+    line    = ("1234 INFO: Processing module hook " * 8)[:width - 1] + "\n"
+    rates   = []
+    for _ in range(n):
+        buf  = core.LogBuffer()
+        log  = core.BuildLogFile("bench-pipeline")
+        done = threading.Event()
+
+        def produce():
+            for _ in range(lines):
+                log.write(line)
+                buf.put(line, "")
+            done.set()
+
+        drained = 0
+        t = time.perf_counter()
+        threading.Thread(target=produce, daemon=True).start()
+        while not (done.is_set() and not len(buf)):
+            for text, _tag in buf.drain(256 * 1024):
+                drained += text.count("\n")
+            time.sleep(0.001)
+        for text, _tag in buf.drain():
+            drained += text.count("\n")
+        rates.append(drained / (time.perf_counter() - t))
+        log.close()
+    return {"log_pipeline_lines_per_s": stats(rates)}
+
+
+def bench_cache_hit(cfg: dict, python: str, n: int) -> dict:
+    import py2exe_converter as core
+    cfg = dict(cfg, use_cache=True)
+    core.run_build(cfg, python)                       # prime
+    samples = []
+    for _ in range(n):
+        t = time.perf_counter()
+        result = core.run_build(cfg, python)
+        samples.append((time.perf_counter() - t) * 1000)
+        assert result["cached"], "expected a cache hit"
+    return {"cache_hit_ms": stats(samples)}
+
+
+def bench_orchestration(cfg: dict, python: str, n: int) -> dict:
+    import py2exe_converter as core
+    cfg  = dict(cfg, use_cache=False)
+    cmd, _dist = core.build_command(cfg, python)
+    core.run_build(cfg, python)                       # warm status cache
+    direct, wrapped = [], []
+    for _ in range(n):
+        t = time.perf_counter()
+        subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True)
+        direct.append((time.perf_counter() - t) * 1000)
+        t = time.perf_counter()
+        result = core.run_build(cfg, python)
+        wrapped.append((time.perf_counter() - t) * 1000)
+        assert result["success"], "stub build failed"
+    overhead = [w - d for w, d in zip(wrapped, direct)]
+    return {"stub_build_direct_ms":  stats(direct),
+            "run_build_ms":          stats(wrapped),
+            "orchestration_overhead_ms": stats(overhead)}
+
+
+def bench_ui(display: str, python: str, script: str) -> dict:
+    """Run the GUI part in a child process so the display can be chosen."""
+    env = dict(os.environ)
+    cmd = [sys.executable, os.path.abspath(__file__),
+           "--ui-child", python, script]
+    if display == "stub":
+        env["PYTHONPATH"] = os.pathsep.join(
+            [STUB_TK] + [p for p in [env.get("PYTHONPATH")] if p])
+    elif display == "xvfb":
+        cmd = ["xvfb-run", "-a"] + cmd
+    out = subprocess.run(cmd, env=env, timeout=300, check=True,
+                         stdout=subprocess.PIPE).stdout.decode()
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def ui_child(python: str, script: str) -> int:
+    """Inside the child: start a build from the GUI, time the event loop."""
+    import py2exe_converter as core
+    import py2exe_gui as gui
+
+    tick_ms = 10
+    gaps    = []
+    state   = {"last": None, "building": False}
+    app     = gui.App(splash=False)
+
+    def heartbeat():
+        now = time.perf_counter()
+        if state["building"] and state["last"] is not None:
+            gaps.append(max(0.0, (now - state["last"]) * 1000 - tick_ms))
+        state["last"] = now
+        app.after(tick_ms, heartbeat)
+
+    def start():
+        if app._starting:
+            app.after(20, start)
+            return
+        app._python_exe = python
+        app._pi_status[python] = core.pyinstaller_status(python)
+        app.cache_var.set(False)
+        app.script_var.set(script)
+        state["building"] = True
+        app._start_build()
+
+    finished = app._batch_finished
+
+    def batch_finished():
+        state["building"] = False
+        finished()
+        app.after(0, app.destroy)
+
+    app._batch_finished = batch_finished
+    app.after(0, heartbeat)
+    app.after(0, start)
+    app.mainloop()
+    print(json.dumps({"ui_loop_lateness_ms": stats(gaps or [0.0])}))
+    return 0
+
+
+# ══════════════════════════════════════════════════════════
+#  MAIN
+# ══════════════════════════════════════════════════════════
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    p.add_argument("-n", "--runs", type=int, default=10)
+    p.add_argument("--lines", type=int, default=20000,
+                   help="stub PyInstaller log lines per build (default 20000)")
+    p.add_argument("--rate", type=float, default=0,
+                   help="stub log lines per second, 0 = unlimited")
+    p.add_argument("--line-len", type=int, default=100)
+    p.add_argument("--exe-kb", type=int, default=64,
+                   help="size of the stub's dummy executable")
+    p.add_argument("--only", action="append",
+                   choices=["build_command", "log_pipeline", "ui",
+                            "cache_hit", "orchestration"],
+                   help="run just these benchmarks (repeatable)")
+    p.add_argument("--display", default="auto",
+                   choices=["auto", "stub", "xvfb", "real"])
+    p.add_argument("--json", action="store_true", help="print JSON only")
+    p.add_argument("--save", metavar="FILE", help="write results as baseline")
+    p.add_argument("--compare", metavar="FILE", help="baseline to gate against")
+    p.add_argument("--tolerance", type=float, default=0.15,
+                   help="allowed p50 regression vs baseline (default 0.15 = 15%%)")
+    p.add_argument("--min-delta", type=float, default=1.0,
+                   help="absolute slack per metric, for values near zero")
+    p.add_argument("--ui-child", nargs=2, metavar=("PYTHON", "SCRIPT"),
+                   help=argparse.SUPPRESS)
+    args = p.parse_args(argv)
+
+    if args.ui_child:
+        return ui_child(*args.ui_child)
+    if sys.platform == "win32":
+        p.error("the stub interpreter wrapper is a POSIX shell script")
+
+    tmp = tempfile.mkdtemp(prefix="pytoexe-bench-")
+    os.environ.update(
+        PYTOEXE_HOME=os.path.join(tmp, "state"),
+        STUB_PYI_LINES=str(args.lines), STUB_PYI_RATE=str(args.rate),
+        STUB_PYI_LINE_LEN=str(args.line_len),
+        STUB_PYI_EXE_KB=str(args.exe_kb))
+    only    = set(args.only or ["build_command", "log_pipeline", "ui",
+                                "cache_hit", "orchestration"])
+    display = pick_display(args.display)
+    results = {}
+    try:
+        python = make_stub_python(tmp)
+        cfg    = make_project(tmp)
+        if "build_command" in only:
+            results.update(bench_build_command(cfg, python, args.runs))
+        if "log_pipeline" in only:
+            results.update(bench_log_pipeline(args.lines, args.line_len,
+                                              args.runs))
+        if "cache_hit" in only:
+            results.update(bench_cache_hit(cfg, python, args.runs))
+        if "orchestration" in only:
+            results.update(bench_orchestration(cfg, python, args.runs))
+        if "ui" in only:
+            results.update(bench_ui(display, python, cfg["script"]))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    report = {"display": display, "lines": args.lines, "rate": args.rate,
+              "runs": args.runs, "stats": results}
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"stub PyInstaller: {args.lines} lines x {args.line_len} chars"
+              f" @ {args.rate or 'unlimited'} lines/s  ·  display={display}\n")
+        print(f"  {'metric':<30}{'p50':>12}{'p90':>12}{'p99':>12}{'max':>12}")
+        for name, st in results.items():
+            print(f"  {name:<30}{st['p50']:>12.2f}{st['p90']:>12.2f}"
+                  f"{st['p99']:>12.2f}{st['max']:>12.2f}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fh:
+            base = json.load(fh)["stats"]
+        failed = False
+        for metric, st in results.items():
+            if metric not in base:
+                continue
+            old, new = base[metric]["p50"], st["p50"]
+            slack = max(abs(old) * args.tolerance, args.min_delta)
+            if metric in HIGHER_IS_BETTER:
+                worse = old - new > slack
+            else:
+                worse = new - old > slack
+            failed |= worse
+            print(f"  {metric}: p50 {old:.2f} -> {new:.2f}  "
+                  f"[{'REGRESSION' if worse else 'ok'}]")
+        return 1 if failed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
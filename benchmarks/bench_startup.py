@@ -0,0 +1,152 @@
+"""
+Startup benchmark — launches the GUI N times and reports percentiles.
+
+Every launch runs with PYTOEXE_STARTUP_TRACE pointing at a temp file and
+PYTOEXE_EXIT_AFTER_STARTUP=1, so the app writes its phase timings (tkinter
+import, find_python, _apply_style, _build_ui, each _section_*, splash,
+first interactive frame, background ready) and closes itself.
+
+Display:
+  --display auto   real display if there is one, else xvfb-run if
+                   installed, else the stub tkinter in benchmarks/stub_tk
+  --display stub   always use the stub (no rendering cost measured)
+  --display xvfb   always wrap in xvfb-run
+  --display real   use $DISPLAY as is
+
+Regression gate:
+  python benchmarks/bench_startup.py -n 20 --save baseline.json
+  python benchmarks/bench_startup.py -n 20 --compare baseline.json --tolerance 0.15
+exits 1 if the p50 of first_interactive_frame (or of the whole launch)
+got slower than the baseline by more than the tolerance.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+HERE    = os.path.dirname(os.path.abspath(__file__))
+ROOT    = os.path.dirname(HERE)
+APP     = os.path.join(ROOT, "py2exe_converter.py")
+STUB_TK = os.path.join(HERE, "stub_tk")
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile (no numpy needed)."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[k]
+
+
+def pick_display(mode: str) -> str:
+    if mode != "auto":
+        return mode
+    if sys.platform == "win32" or sys.platform == "darwin" or \
+            os.environ.get("DISPLAY"):
+        return "real"
+    return "xvfb" if shutil.which("xvfb-run") else "stub"
+
+
+def launch(display: str, splash: bool, trace: str, python: str) -> float:
+    """Run the app once; return the wall-clock seconds of the process."""
+    env = dict(os.environ,
+               PYTOEXE_STARTUP_TRACE=trace,
+               PYTOEXE_EXIT_AFTER_STARTUP="1")
+    cmd = [python, APP, "--gui"] + ([] if splash else ["--no-splash"])
+    if display == "stub":
+        env["PYTHONPATH"] = os.pathsep.join(
+            [STUB_TK] + [p for p in [env.get("PYTHONPATH")] if p])
+    elif display == "xvfb":
+        cmd = ["xvfb-run", "-a"] + cmd
+    started = time.perf_counter()
+    subprocess.run(cmd, env=env, timeout=120, check=True,
+                   stdout=subprocess.DEVNULL)
+    return time.perf_counter() - started
+
+
+def summarise(runs: list, walls: list) -> dict:
+    """{metric: {p50, p90, p99, max}} over phases, marks and wall time."""
+    series = {"process_wall_ms": [w * 1000.0 for w in walls]}
+    for run in runs:
+        for ph in run["phases"]:
+            series.setdefault(ph["name"], []).append(ph["ms"])
+        for name, ms in run["marks"].items():
+            if not name.startswith("_"):
+                series.setdefault(name, []).append(ms)
+    return {name: {"n":   len(vals),
+                   "p50": round(percentile(vals, 50), 2),
+                   "p90": round(percentile(vals, 90), 2),
+                   "p99": round(percentile(vals, 99), 2),
+                   "max": round(max(vals), 2)}
+            for name, vals in series.items()}
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    p.add_argument("-n", "--runs", type=int, default=10)
+    p.add_argument("--display", default="auto",
+                   choices=["auto", "stub", "xvfb", "real"])
+    p.add_argument("--splash", action="store_true",
+                   help="measure with the splash screen (default: --no-splash)")
+    p.add_argument("--python", default=sys.executable)
+    p.add_argument("--json", action="store_true", help="print JSON only")
+    p.add_argument("--save", metavar="FILE", help="write results as baseline")
+    p.add_argument("--compare", metavar="FILE", help="baseline to gate against")
+    p.add_argument("--tolerance", type=float, default=0.15,
+                   help="allowed p50 slowdown vs baseline (default 0.15 = 15%%)")
+    args = p.parse_args(argv)
+
+    display = pick_display(args.display)
+    fd, trace = tempfile.mkstemp(suffix=".jsonl", prefix="pytoexe-startup-")
+    os.close(fd)
+    walls = []
+    try:
+        for _ in range(args.runs):
+            walls.append(launch(display, args.splash, trace, args.python))
+        with open(trace, "r", encoding="utf-8") as fh:
+            runs = [json.loads(line) for line in fh if line.strip()]
+    finally:
+        os.remove(trace)
+
+    stats  = summarise(runs, walls)
+    result = {"display": display, "splash": args.splash,
+              "runs": len(runs), "stats": stats}
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{len(runs)} launches  ·  display={display}  ·  "
+              f"splash={'on' if args.splash else 'off'}\n")
+        print(f"  {'phase':<28}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}  (ms)")
+        for name, st in sorted(stats.items(), key=lambda kv: kv[1]["p50"]):
+            print(f"  {name:<28}{st['p50']:>10.1f}{st['p90']:>10.1f}"
+                  f"{st['p99']:>10.1f}{st['max']:>10.1f}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(result, fh, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fh:
+            base = json.load(fh)["stats"]
+        failed = False
+        for metric in ("first_interactive_frame", "process_wall_ms"):
+            if metric not in base or metric not in stats:
+                continue
+            old, new = base[metric]["p50"], stats[metric]["p50"]
+            limit = old * (1.0 + args.tolerance)
+            verdict = "ok" if new <= limit else "REGRESSION"
+            failed |= new > limit
+            print(f"  {metric}: p50 {old:.1f} -> {new:.1f} ms  [{verdict}]")
+        return 1 if failed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
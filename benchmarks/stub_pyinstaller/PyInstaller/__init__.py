@@ -0,0 +1,16 @@
+"""
+Stand-in for PyInstaller, used by benchmarks/bench_build.py.
+
+`python -m PyInstaller ...` accepts the options PyToExe passes, prints a
+PyInstaller-shaped log through the real stages (Analysis, PYZ, PKG, EXE,
+COLLECT) and writes a small dummy executable where the real one would
+go — so everything around PyInstaller can be timed without PyInstaller.
+
+Tuned through the environment (the benchmark sets these):
+  STUB_PYI_LINES     lines of log output             (default 2000)
+  STUB_PYI_RATE      lines per second, 0 = unlimited (default 0)
+  STUB_PYI_LINE_LEN  characters per line             (default 100)
+  STUB_PYI_EXE_KB    size of the dummy executable    (default 64)
+  STUB_PYI_EXIT      exit status                     (default 0)
+"""
+__version__ = "0.0+stub"
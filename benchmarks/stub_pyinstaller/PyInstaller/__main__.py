@@ -0,0 +1,94 @@
+"""python -m PyInstaller — see __init__.py."""
+import os
+import sys
+import time
+import argparse
+
+from PyInstaller import __version__
+
+# (stage, opening line, share of the output lines)
+STAGES = [
+    ("Analysis", "checking Analysis",             0.60),
+    ("PYZ",      "Building PYZ (ZlibArchive) {}", 0.05),
+    ("PKG",      "Building PKG (CArchive) {}",    0.25),
+    ("EXE",      "Building EXE from EXE-00.toc",  0.05),
+    ("COLLECT",  "Building COLLECT COLLECT-00.toc", 0.05),
+]
+FILLER = {
+    "Analysis": "Processing standard module hook 'hook-stub.py' from '/stub/hooks'",
+    "PYZ":      "Adding module to PYZ",
+    "PKG":      "Adding entry to PKG",
+    "EXE":      "Copying bootloader EXE to",
+    "COLLECT":  "Copying file to COLLECT",
+}
+
+
+def _env(name: str, default):
+    return type(default)(os.environ.get(name, default))
+
+
+def _parse(argv):
+    p = argparse.ArgumentParser(prog="pyinstaller")
+    p.add_argument("script")
+    p.add_argument("--name")
+    p.add_argument("--onefile", action="store_true")
+    p.add_argument("--onedir", dest="onefile", action="store_false")
+    p.add_argument("--distpath", default="dist")
+    p.add_argument("--workpath", default="build")
+    p.add_argument("--specpath", default=".")
+    args, _unknown = p.parse_known_args(argv)
+    args.name = args.name or os.path.splitext(os.path.basename(args.script))[0]
+    return args
+
+
+def _write_exe(path: str, kb: int):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    body = b"#!/bin/sh\necho pytoexe-stub-exe\nexit 0\n"
+    with open(path, "wb") as fh:
+        fh.write(body + b"#" * max(0, kb * 1024 - len(body)))
+    os.chmod(path, 0o755)
+
+
+def main(argv=None) -> int:
+    args  = _parse(sys.argv[1:] if argv is None else argv)
+    lines = _env("STUB_PYI_LINES", 2000)
+    rate  = _env("STUB_PYI_RATE", 0.0)
+    width = _env("STUB_PYI_LINE_LEN", 100)
+    out   = sys.stderr          # PyInstaller logs to stderr
+    t0    = time.perf_counter()
+
+    def log(text: str, n: int):
+        if rate > 0:
+            delay = t0 + n / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        ms = int((time.perf_counter() - t0) * 1000)
+        out.write(f"{ms} INFO: {text}"[:width].ljust(width) + "\n")
+
+    os.makedirs(os.path.join(args.workpath, args.name), exist_ok=True)
+    with open(os.path.join(args.specpath, args.name + ".spec"), "w") as fh:
+        fh.write(f"# stub spec for {args.script}\n")
+
+    n = 0
+    log(f"PyInstaller: {__version__}, contrib hooks: stub", n)
+    for stage, opening, share in STAGES:
+        if stage == "COLLECT" and args.onefile:
+            continue
+        log(opening.format(args.name), n)
+        for i in range(int(lines * share)):
+            n += 1
+            log(f"{FILLER[stage]} {i}", n)
+    out.flush()
+
+    exe = os.path.join(args.distpath, args.name)
+    if not args.onefile:
+        exe = os.path.join(exe, args.name)
+    if sys.platform == "win32":
+        exe += ".exe"
+    _write_exe(exe, _env("STUB_PYI_EXE_KB", 64))
+    log("Build complete! The results are available in: " + args.distpath, n)
+    return _env("STUB_PYI_EXIT", 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Display-less stand-in for tkinter, used by the startup benchmark.
+
+Widgets accept any option and any method call; after()/after_idle()
+callbacks run on a tiny event loop so App's own timers, the splash
+animation and background-thread callbacks behave as in real Tk.
+Rendering cost is obviously not measured — use a real (virtual)
+display for that.
+"""
+import heapq
+import itertools
+import os
+import threading
+import time
+
+TclError = RuntimeError
+
+_lock    = threading.Lock()
+_queue   = []
+_counter = itertools.count()
+_quit    = threading.Event()
+
+
+class _Any:
+    """Absorbs every attribute access and call."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Any()
+
+    def __call__(self, *args, **kwargs):
+        return _Any()
+
+    def __getitem__(self, key):
+        return _Any()
+
+    def __iter__(self):
+        return iter(())
+
+    def __bool__(self):
+        return True
+
+
+class Misc(_Any):
+    def after(self, ms, func=None, *args):
+        if func is None:
+            time.sleep(ms / 1000.0)
+            return None
+        with _lock:
+            heapq.heappush(_queue, (time.perf_counter() + ms / 1000.0,
+                                    next(_counter), func, args))
+        return "after#stub"
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, ident):
+        pass
+
+    def winfo_screenwidth(self):
+        return 1920
+
+    def winfo_screenheight(self):
+        return 1080
+
+    def winfo_exists(self):
+        return 1
+
+    def update(self):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+    def destroy(self):
+        pass
+
+    def mainloop(self, n=0):
+        deadline = time.perf_counter() + \
+            float(os.environ.get("STUB_TK_TIMEOUT", "60"))
+        while not _quit.is_set() and time.perf_counter() < deadline:
+            with _lock:
+                item = heapq.heappop(_queue) if _queue else None
+            if item is None:
+                time.sleep(0.001)
+                continue
+            due, _n, func, args = item
+            delay = due - time.perf_counter()
+            if delay > 0:
+                with _lock:
+                    heapq.heappush(_queue, item)
+                time.sleep(min(delay, 0.005))
+                continue
+            func(*args)
+
+
+class Tk(Misc):
+    def destroy(self):
+        _quit.set()
+
+
+class Toplevel(Misc):
+    pass
+
+
+class Text(Misc):
+    def __init__(self, *args, **kwargs):
+        self._chars = []
+
+    def insert(self, index, *chunks):
+        self._chars.extend(chunks[0::2])
+
+    def index(self, index):
+        return f"{sum(c.count(chr(10)) for c in self._chars) + 1}.0"
+
+    def get(self, start, end=None):
+        return ""
+
+    def yview(self, *args):
+        return (0.0, 1.0)
+
+
+class Listbox(Misc):
+    def curselection(self):
+        return ()
+
+
+class Variable:
+    _default = None
+
+    def __init__(self, master=None, value=None, name=None):
+        self._value = self._default if value is None else value
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+
+    def trace_add(self, *args):
+        return "trace#stub"
+
+
+class StringVar(Variable):
+    _default = ""
+
+
+class BooleanVar(Variable):
+    _default = False
+
+
+class IntVar(Variable):
+    _default = 0
+
+
+class DoubleVar(Variable):
+    _default = 0.0
+
+
+Frame = Label = Button = Canvas = Entry = Checkbutton = Radiobutton = \
+    Scrollbar = Spinbox = Menu = Menubutton = OptionMenu = Misc
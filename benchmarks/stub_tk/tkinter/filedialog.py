@@ -0,0 +1,14 @@
+def askopenfilename(**kwargs):
+    return ""
+
+
+def askopenfilenames(**kwargs):
+    return ()
+
+
+def askdirectory(**kwargs):
+    return ""
+
+
+def asksaveasfilename(**kwargs):
+    return ""
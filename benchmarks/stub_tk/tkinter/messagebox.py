@@ -0,0 +1,5 @@
+def _answer(*args, **kwargs):
+    return True
+
+
+showinfo = showwarning = showerror = askyesno = askokcancel = _answer
@@ -0,0 +1,5 @@
+from tkinter import Text
+
+
+class ScrolledText(Text):
+    pass
@@ -0,0 +1,8 @@
+from tkinter import Misc, _Any
+
+
+class Style(_Any):
+    pass
+
+
+Progressbar = Scrollbar = Treeview = Combobox = Notebook = Spinbox = Misc
@@ -4,6 +4,16 @@ Author  : Instagram @x404ctl  |  GitHub @MAliX
 Requires: Python 3.6+, PyInstaller (auto-installed if missing), tkinter (built-in)
 Compatible: Windows 7, 8, 10, 11
 
+This module holds the build core (interpreter discovery, PyInstaller
+command assembly, headless build runner) and the command-line entry
+point.  The tkinter GUI lives in py2exe_gui.py and is only imported when
+the window is actually requested, so batch / CI builds never touch Tk.
+
+    python py2exe_converter.py                     -> GUI
+    python py2exe_converter.py app.py tool.py -j 4 -> headless builds
+    python py2exe_converter.py --manifest jobs.json
+    python py2exe_converter.py --daemon -j 6       -> shared build daemon
+
 FIXES IN v2.1
 ─────────────
 - CRITICAL: detect real Python interpreter even when this app is itself
@@ -20,48 +30,62 @@ FIXES IN v2.1
 
 import os
 import sys
+import re
+import ast
+import glob
+import gzip
+import json
+import zlib
+import struct
+import marshal
 import time
 import shutil
+import stat
+import hashlib
+import difflib
+import posixpath
+import tempfile
+import shlex
+import argparse
+import itertools
+import collections
+import atexit
+import signal
 import threading
 import subprocess
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import (
+    ProcessPoolExecutor, ThreadPoolExecutor, as_completed,
+)
 from pathlib import Path
 
-# ══════════════════════════════════════════════════════════
-#  THEME
-# ══════════════════════════════════════════════════════════
-T = {
-    "bg":         "#0d1117",
-    "panel":      "#161b22",
-    "border":     "#30363d",
-    "accent":     "#238636",
-    "accent_hov": "#2ea043",
-    "accent_dim": "#1a5c28",
-    "blue":       "#1f6feb",
-    "blue_hov":   "#388bfd",
-    "text":       "#e6edf3",
-    "text_dim":   "#8b949e",
-    "danger":     "#da3633",
-    "warn":       "#d29922",
-    "ok":         "#3fb950",
-    "log_bg":     "#010409",
-    "log_fg":     "#c9d1d9",
-    "entry_bg":   "#21262d",
-    "entry_fg":   "#e6edf3",
-    "select_bg":  "#1f6feb",
-    "btn_bg":     "#21262d",
-    "btn_fg":     "#e6edf3",
-    "btn_hov":    "#30363d",
-    "splash_bg":  "#010409",
-    "splash_fg":  "#3fb950",
-}
 
-FONT_UI    = ("Consolas", 9)
-FONT_MONO  = ("Consolas", 9)
-FONT_HEAD  = ("Consolas", 10, "bold")
-FONT_SPLASH = ("Consolas", 11)
-PAD = 10
+# Default values for every key of a build config ("cfg").  The GUI fills
+# these from its form, the CLI from flags or a manifest entry.
+DEFAULT_CONFIG = {
+    "script":      "",
+    "output_dir":  None,
+    "icon":        None,
+    "onefile":     True,
+    "windowed":    False,
+    "extra_files": [],
+    "use_cache":   True,
+    "import_scan": True,
+    "auto_exclude": False,      # drop unused AUTO_EXCLUDES, see IMPORT SCAN
+    "python":      None,        # interpreter for this job (None = default)
+    "timeout":     0,           # wall-clock limit in seconds (0 = none)
+    "nice":        0,           # niceness added to PyInstaller (POSIX)
+    "cpus":        None,        # CPU numbers it may run on (Linux)
+    "memory_mb":   0,           # address-space cap in MiB (Linux)
+    "bench_runs":  0,           # startup benchmark launches (0 = off)
+    "bench_args":  None,        # run with these args (None = stop at main)
+    "profile":     "default",   # name in PROFILES, or a dict of overrides
+    "warm":        True,        # fork builds from a warm worker (POSIX)
+    "bytecode_cache": True,     # precompile local modules, see BYTECODE CACHE
+    "dedupe":      False,       # share one-folder files, see ARTIFACT STORE
+    "spec":        False,       # build from <name>.spec, see SPEC FILES
+}
 
 
 # ══════════════════════════════════════════════════════════
@@ -69,14 +93,155 @@ PAD = 10
 #  When this .py is packaged as a .exe by PyInstaller,
 #  sys.executable becomes the frozen app itself, NOT python.exe.
 #  We must locate the actual python.exe to run PyInstaller.
+#
+#  Probing an interpreter means launching it, so results are
+#  cached in <state>/interpreters.json and revalidated with a
+#  stat() of the executable: after the first run discovery is
+#  a handful of stats and globs.  New candidates are probed
+#  concurrently.
 # ══════════════════════════════════════════════════════════
+PROBE_WORKERS = 8
+
+_PROBE_CODE = ("import sys; print(sys.version.split()[0], "
+               "sys.implementation.cache_tag or '')")
+
+
+def _newest_first(paths) -> list:
+    """Sort paths by the version number they contain, highest first."""
+    def key(p):
+        m = re.search(r"(\d+)\.(\d+)(?:\.(\d+))?", os.path.basename(p)) or \
+            re.search(r"(\d+)\.?(\d+)(?:\.(\d+))?", p)
+        return tuple(int(g or 0) for g in m.groups()) if m else (0,)
+    return sorted(paths, key=key, reverse=True)
+
+
+def _python_candidates() -> list:
+    """Every plausible interpreter path, most preferred first."""
+    home  = os.path.expanduser("~")
+    found = []
+
+    # PATH first
+    for name in ("python", "python3", "py"):
+        p = shutil.which(name)
+        if p:
+            found.append(p)
+
+    if sys.platform == "win32":
+        for d in ("C", "D"):
+            for pattern in [
+                f"{d}:\\Python3*\\python.exe",
+                f"{d}:\\Program Files\\Python3*\\python.exe",
+                f"{d}:\\Users\\*\\AppData\\Local\\Programs\\Python\\Python3*\\python.exe",
+            ]:
+                found += _newest_first(glob.glob(pattern))
+        venv_bin, exe = "Scripts", "python.exe"
+    else:
+        for folder in ("/usr/local/bin", "/usr/bin", "/opt/homebrew/bin"):
+            found += _newest_first(p for p in glob.glob(folder + "/python3*")
+                                   if re.search(r"python3(\.\d+)?$", p))
+        found += _newest_first(
+            glob.glob(home + "/.pyenv/versions/*/bin/python3"))
+        venv_bin, exe = "bin", "python"
+
+    # Virtual environments (active one, common managers, project-local)
+    if os.environ.get("VIRTUAL_ENV"):
+        found.append(os.path.join(os.environ["VIRTUAL_ENV"], venv_bin, exe))
+    for pattern in (home + "/.virtualenvs/*",
+                    home + "/.local/share/virtualenvs/*",
+                    os.path.join(os.getcwd(), ".venv"),
+                    os.path.join(os.getcwd(), "venv")):
+        found += sorted(os.path.join(v, venv_bin, exe)
+                        for v in glob.glob(pattern))
+
+    # Symlinks (python -> python3 -> python3.11) collapse to one entry
+    unique, seen = [], set()
+    for p in found:
+        key = os.path.normcase(os.path.realpath(p))
+        if key not in seen and os.path.isfile(p):
+            seen.add(key)
+            unique.append(os.path.abspath(p))
+    return unique
+
+
+def _probe_python(path: str) -> dict:
+    """Launch path once and record its version ("" if not a Python 3)."""
+    st  = os.stat(path)
+    rec = {"path": path, "version": "", "cache_tag": "",
+           "mtime": st.st_mtime, "size": st.st_size}
+    try:
+        out = subprocess.check_output(
+            [path, "-c", _PROBE_CODE],
+            stderr=subprocess.DEVNULL,
+            timeout=5,
+        ).decode().split()
+        if out and out[0].startswith("3."):
+            rec["version"]   = out[0]
+            rec["cache_tag"] = out[1] if len(out) > 1 else ""
+    except Exception:
+        pass
+    return rec
+
+
+def _load_json(path: str, default):
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return default
+
+
+def _save_json(path: str, data):
+    """Write atomically so concurrent processes never read half a file."""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2)
+    os.replace(tmp, path)
+
+
+def discover_pythons(refresh: bool = False) -> list:
+    """
+    Return [{"path", "version", "cache_tag", "mtime", "size"}, ...] for
+    every working Python 3 found, most preferred first.  Cached entries
+    whose executable still has the same mtime and size are trusted
+    without launching it; refresh=True re-probes everything.
+    """
+    cache_file = os.path.join(state_dir(), "interpreters.json")
+    cache      = {} if refresh else _load_json(cache_file, {})
+    candidates = _python_candidates()
+    records, stale = {}, []
+    for path in candidates:
+        rec = cache.get(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if rec and rec["mtime"] == st.st_mtime and rec["size"] == st.st_size:
+            records[path] = rec
+        else:
+            stale.append(path)
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as pool:
+            for rec in pool.map(_probe_python, stale):
+                records[rec["path"]] = rec
+    if stale or set(records) != set(cache):
+        try:
+            _save_json(cache_file, records)
+        except OSError:
+            pass
+
+    return [records[p] for p in candidates
+            if p in records and records[p]["version"]]
+
+
 def find_python() -> str:
     """
     Return the path to a working python.exe.
     Priority:
       1. sys.executable  (works when running as .py directly)
       2. 'python' / 'python3' on PATH
-      3. Common install locations on Windows
+      3. Common install locations (Windows), /usr/bin/python3.*,
+         pyenv, virtual environments
     Returns empty string if none found.
     """
     # If NOT frozen (running as plain .py), sys.executable is python.exe
@@ -84,90 +249,269 @@ def find_python() -> str:
         return sys.executable
 
     # Frozen — sys.executable is the packed .exe, useless for subprocess.
-    # Try PATH first.
-    for name in ("python", "python3", "py"):
-        found = shutil.which(name)
-        if found:
-            # Quick sanity check
-            try:
-                out = subprocess.check_output(
-                    [found, "--version"],
-                    stderr=subprocess.STDOUT,
-                    timeout=5,
-                )
-                if b"Python 3" in out:
-                    return found
-            except Exception:
-                pass
+    found = discover_pythons()
+    return found[0]["path"] if found else ""
 
-    # Try common Windows install locations
-    drives = ["C", "D"]
-    candidates = []
-    for d in drives:
-        for pattern in [
-            f"{d}:\\Python3*\\python.exe",
-            f"{d}:\\Program Files\\Python3*\\python.exe",
-            f"{d}:\\Users\\*\\AppData\\Local\\Programs\\Python\\Python3*\\python.exe",
-        ]:
-            import glob
-            candidates.extend(glob.glob(pattern))
-
-    for exe in candidates:
-        if os.path.isfile(exe):
-            try:
-                out = subprocess.check_output(
-                    [exe, "--version"],
-                    stderr=subprocess.STDOUT,
-                    timeout=5,
-                )
-                if b"Python 3" in out:
-                    return exe
-            except Exception:
-                pass
 
-    return ""
+# ══════════════════════════════════════════════════════════
+#  PYINSTALLER  CHECK  (cached per interpreter)
+#  Asking an interpreter whether it can import PyInstaller
+#  costs 0.5–3 s.  The answer is kept in <state>/pyinstaller.json
+#  together with the mtimes of the interpreter and of its
+#  site-packages folders; pip install / uninstall / upgrade
+#  touches those folders, which invalidates the entry.
+# ══════════════════════════════════════════════════════════
+_STATUS_CODE = r"""
+import sys, json, os, site
+dirs = [p for p in sys.path
+        if os.path.basename(p) in ("site-packages", "dist-packages")]
+try:
+    # May not exist yet — 'pip install --user' creating it must still count
+    if site.getusersitepackages() not in dirs:
+        dirs.append(site.getusersitepackages())
+except Exception:
+    pass
+try:
+    import PyInstaller
+    ver = PyInstaller.__version__
+    dirs.append(os.path.dirname(PyInstaller.__file__))
+except Exception:
+    ver = ""
+try:
+    from importlib import metadata
+    pkgs = sorted({"%s==%s" % (d.metadata["Name"], d.version)
+                   for d in metadata.distributions()})
+except Exception:                       # Python < 3.8
+    pkgs = sorted(f for d in dirs if os.path.isdir(d) for f in os.listdir(d)
+                  if f.endswith((".dist-info", ".egg-info")))
+print(json.dumps({"python_version": sys.version.split()[0],
+                  "version": ver, "dirs": dirs, "packages": pkgs}))
+"""
+
+_status_lock = threading.Lock()
 
 
-def ensure_pyinstaller(python_exe: str) -> bool:
-    """Check PyInstaller is importable via python_exe; offer to install."""
+def _stamps(paths) -> dict:
+    out = {}
+    for p in paths:
+        try:
+            out[p] = os.stat(p).st_mtime
+        except OSError:
+            out[p] = None
+    return out
+
+
+def pyinstaller_status(python_exe: str, refresh: bool = False) -> dict:
+    """
+    Return {"available", "version", "python_version", "packages"} for
+    python_exe, "packages" being a digest of the installed
+    distributions and their versions.  Served from the on-disk cache while the interpreter and its
+    site-packages are unchanged; otherwise the interpreter is asked.
+    Raises FileNotFoundError if python_exe cannot be launched at all.
+    """
+    python_exe = os.path.abspath(python_exe)
+    cache_file = os.path.join(state_dir(), "pyinstaller.json")
+    with _status_lock:
+        cache = _load_json(cache_file, {})
+    rec = cache.get(python_exe)
+    if rec and not refresh and "packages" in rec and \
+            rec["stamps"] == _stamps([python_exe] + rec["dirs"]):
+        return rec
+
     try:
-        subprocess.check_call(
-            [python_exe, "-c", "import PyInstaller"],
-            stdout=subprocess.DEVNULL,
+        out = subprocess.check_output(
+            [python_exe, "-c", _STATUS_CODE],
             stderr=subprocess.DEVNULL,
-            timeout=15,
-        )
-        return True
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-        pass
-    except FileNotFoundError:
-        messagebox.showerror(
-            "Python Not Found",
-            f"Could not run:\n{python_exe}\n\n"
-            "Make sure Python 3 is installed and added to PATH.",
+            timeout=30,
         )
-        return False
+        info = json.loads(out.decode().strip().splitlines()[-1])
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired,
+            ValueError, IndexError):
+        # Broken interpreter — report missing, but do not cache it
+        return {"available": False, "version": "", "python_version": "",
+                "packages": ""}
+
+    rec = {
+        "available":      bool(info["version"]),
+        "version":        info["version"],
+        "python_version": info["python_version"],
+        "packages":       hashlib.sha256(
+            "\n".join(info["packages"]).encode("utf-8")).hexdigest(),
+        "dirs":           info["dirs"],
+        "stamps":         _stamps([python_exe] + info["dirs"]),
+    }
+    with _status_lock:
+        cache = _load_json(cache_file, {})
+        cache[python_exe] = rec
+        try:
+            _save_json(cache_file, cache)
+        except OSError:
+            pass
+    return rec
+
+
+def pyinstaller_available(python_exe: str) -> bool:
+    """
+    Return True if PyInstaller is importable via python_exe.
+    Raises FileNotFoundError if python_exe cannot be launched at all.
+    """
+    return pyinstaller_status(python_exe)["available"]
+
+
+# ══════════════════════════════════════════════════════════
+#  OPTIMISATION  PROFILES
+#  Named sets of size / startup trade-offs, cfg["profile"]:
+#    optimize       bytecode level; 2 also strips docstrings
+#                   (--optimize on PyInstaller 6+, -O / -OO on
+#                   the interpreter running older versions)
+#    strip          strip symbol tables (not on Windows)
+#    upx            None = PyInstaller's default (UPX if found),
+#                   False = --noupx, True = compress
+#    upx_level      options for UPX, passed in the UPX env var
+#    exclude_tests  --exclude-module for test suites that ship
+#                   inside the standard library and packages
+#  A dict instead of a name overrides single settings of
+#  "default".
+# ══════════════════════════════════════════════════════════
+PROFILES = {
+    "default":  {"optimize": 0, "strip": False, "upx": None,
+                 "upx_level": "", "exclude_tests": False},
+    "fast":     {"optimize": 1, "strip": False, "upx": False,
+                 "upx_level": "", "exclude_tests": True},
+    "balanced": {"optimize": 2, "strip": True, "upx": False,
+                 "upx_level": "", "exclude_tests": True},
+    "small":    {"optimize": 2, "strip": True, "upx": True,
+                 "upx_level": "--best", "exclude_tests": True},
+    "smallest": {"optimize": 2, "strip": True, "upx": True,
+                 "upx_level": "--best --lzma", "exclude_tests": True},
+}
+
+TEST_MODULES = ("test", "tests", "unittest.test", "tkinter.test",
+                "ctypes.test", "sqlite3.test", "lib2to3.tests",
+                "distutils.tests", "idlelib.idle_test", "pytest", "_pytest")
 
-    if not messagebox.askyesno(
-        "PyInstaller Missing",
-        "PyInstaller is not installed.\n\nInstall it now via pip?",
-    ):
-        return False
 
+def profile_settings(cfg: dict) -> dict:
+    """The effective settings of cfg["profile"] (name or dict)."""
+    prof = cfg.get("profile") or "default"
+    if isinstance(prof, dict):
+        return dict(PROFILES["default"], **prof)
+    if prof not in PROFILES:
+        raise ValueError(f"unknown profile {prof!r} "
+                         f"(choose from {', '.join(PROFILES)})")
+    return dict(PROFILES[prof])
+
+
+def _pyinstaller_major(python_exe: str) -> int:
     try:
-        subprocess.check_call(
-            [python_exe, "-m", "pip", "install", "pyinstaller"],
-            timeout=120,
-        )
-        return True
-    except Exception as exc:
-        messagebox.showerror(
-            "Install Failed",
-            f"Could not install PyInstaller automatically.\n\n"
-            f"Run this manually in a terminal:\n"
-            f"  pip install pyinstaller\n\nError: {exc}",
-        )
-        return False
+        return int(pyinstaller_status(python_exe)["version"].split(".")[0])
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def profile_args(cfg: dict, python_exe: str) -> tuple:
+    """
+    (interpreter flags, PyInstaller options) for cfg's profile.
+    Its test-module excludes come from excluded_modules().
+    """
+    prof  = profile_settings(cfg)
+    flags, opts = [], []
+    if prof["optimize"]:
+        if _pyinstaller_major(python_exe) >= 6:
+            opts += ["--optimize", str(prof["optimize"])]
+        else:
+            flags.append("-" + "O" * prof["optimize"])
+    if prof["strip"] and sys.platform != "win32":
+        opts.append("--strip")
+    if prof["upx"] is False:
+        opts.append("--noupx")
+    return flags, opts
+
+
+def describe_profile(cfg: dict) -> str:
+    """'optimize 2 · strip · UPX --best · no tests' — for logs and tables."""
+    prof  = profile_settings(cfg)
+    parts = [f"optimize {prof['optimize']}"] if prof["optimize"] else []
+    if prof["strip"]:
+        parts.append("strip")
+    if prof["upx"] is not None:
+        parts.append(f"UPX {prof['upx_level'] or 'on'}" if prof["upx"]
+                     else "no UPX")
+    if prof["exclude_tests"]:
+        parts.append("no tests")
+    return "  ·  ".join(parts) or "PyInstaller defaults"
+
+
+def build_env(cfg: dict):
+    """Environment for the PyInstaller process (None = inherit)."""
+    prof  = profile_settings(cfg)
+    extra = {}
+    if prof["upx"] and prof["upx_level"]:
+        extra["UPX"] = prof["upx_level"]
+    if cfg.get("spec") and cfg.get("bench_runs"):
+        extra[SPEC_HOOK_ENV] = startup_hook_path()
+    return dict(os.environ, **extra) if extra else None
+
+
+# ══════════════════════════════════════════════════════════
+#  PYINSTALLER  COMMAND
+# ══════════════════════════════════════════════════════════
+def dist_dir(cfg: dict) -> str:
+    """Absolute output folder for cfg (default: <script dir>/dist)."""
+    if cfg["output_dir"]:
+        return os.path.abspath(cfg["output_dir"])
+    return os.path.join(os.path.dirname(os.path.abspath(cfg["script"])), "dist")
+
+
+def work_dir_for(cfg: dict, python_exe: str) -> str:
+    """
+    Work/spec folder for one script + configuration:
+      <script dir>/__pybuild_tmp__/<name>-<config hash>
+    Every distinct configuration keeps its own PyInstaller state, so
+    Analysis/PYZ results are reused on rebuilds, switching onefile <->
+    onedir does not throw them away, and two scripts (or two configs of
+    the same script) in one folder can build at the same time.
+    """
+    script = os.path.abspath(cfg["script"])
+    digest = hashlib.sha1(json.dumps({
+        "python":      os.path.abspath(python_exe),
+        "onefile":     bool(cfg["onefile"]),
+        "windowed":    bool(cfg["windowed"]),
+        "icon":        os.path.abspath(cfg["icon"]) if cfg["icon"] else "",
+        "extra_files": [os.path.abspath(f) for f in cfg["extra_files"]],
+        "dist":        dist_dir(cfg),
+        "profile":     profile_settings(cfg),
+    }, sort_keys=True).encode()).hexdigest()[:10]
+    return os.path.join(os.path.dirname(script), "__pybuild_tmp__",
+                        f"{Path(script).stem}-{digest}")
+
+
+def _used_names(script: str) -> set:
+    """Top-level names script imports, its own modules included."""
+    scan = scan_imports(script)
+    root = os.path.dirname(script)
+    return set(scan["modules"]) | {
+        Path(os.path.relpath(f, root).split(os.sep)[0]).stem
+        for f in scan["local"]}
+
+
+def excluded_modules(cfg: dict) -> list:
+    """
+    The --exclude-module list for cfg: unused AUTO_EXCLUDES (with
+    cfg["auto_exclude"]) and the profile's unused test modules.  A
+    non-empty list ends in "__main__": PyInstaller appends that to
+    the list it stores for Analysis, so without it the next build
+    sees "excludes changed" and redoes the whole Analysis.
+    """
+    script = os.path.abspath(cfg["script"])
+    mods   = []
+    if cfg.get("import_scan", True) and cfg.get("auto_exclude"):
+        mods += scan_imports(script)["excludes"]
+    if profile_settings(cfg)["exclude_tests"]:
+        used  = _used_names(script)
+        mods += [m for m in TEST_MODULES if m.split(".")[0] not in used]
+    mods = list(dict.fromkeys(mods))
+    return mods + ["__main__"] if mods else []
 
 
 def build_command(cfg: dict, python_exe: str) -> list:
@@ -176,12 +520,20 @@ def build_command(cfg: dict, python_exe: str) -> list:
     All paths are converted to absolute strings.
     """
     script   = os.path.abspath(cfg["script"])
-    out_dir  = os.path.abspath(cfg["output_dir"]) if cfg["output_dir"] \
-               else os.path.join(os.path.dirname(script), "dist")
-    work_dir = os.path.join(os.path.dirname(script), "__pybuild_tmp__")
+    out_dir  = dist_dir(cfg)
+    work_dir = work_dir_for(cfg, python_exe)
     sep      = ";" if sys.platform == "win32" else ":"
 
-    cmd = [python_exe, "-m", "PyInstaller"]
+    # Optimisation profile — see OPTIMISATION PROFILES
+    flags, prof_opts = profile_args(cfg, python_exe)
+
+    cmd = [python_exe] + flags + ["-m", "PyInstaller"]
+
+    # Everything else is in the spec — see SPEC FILES
+    if cfg.get("spec"):
+        cmd += ["--distpath", out_dir, "--workpath", work_dir,
+                "--noconfirm", spec_path(cfg)]
+        return cmd, out_dir
 
     # Name (avoids issues with spaces in filename)
     cmd += ["--name", Path(script).stem]
@@ -196,11 +548,23 @@ def build_command(cfg: dict, python_exe: str) -> list:
     if cfg["icon"]:
         cmd += ["--icon", os.path.abspath(cfg["icon"])]
 
-    # Extra data files
-    for f in cfg["extra_files"]:
-        src  = os.path.abspath(f)
-        dest = os.path.basename(f)
-        cmd += ["--add-data", f"{src}{sep}{dest}"]
+    # Extra files and folders — staged into one tree, see ASSET TREES
+    if cfg["extra_files"]:
+        assets = os.path.join(work_dir, "assets")
+        cmd += ["--add-data", f"{assets}{sep}."]
+
+    # Pre-scanned imports — see IMPORT SCAN
+    if cfg.get("import_scan", True):
+        for mod in scan_imports(script)["hidden"]:
+            cmd += ["--hidden-import", mod]
+    for mod in excluded_modules(cfg):
+        cmd += ["--exclude-module", mod]
+
+    cmd += prof_opts
+
+    # Time-to-main marker for the startup benchmark
+    if cfg.get("bench_runs"):
+        cmd += ["--runtime-hook", startup_hook_path()]
 
     # Output / work paths (absolute)
     cmd += ["--distpath",  out_dir]
@@ -216,6 +580,19 @@ def build_command(cfg: dict, python_exe: str) -> list:
     return cmd, out_dir   # return cmd + resolved dist path
 
 
+def artifact_path(cfg: dict, abs_dist: str) -> str:
+    """
+    Return where PyInstaller puts the executable for cfg.
+    One-file builds land directly in dist, one-folder builds in
+    dist/<name>/.  Only Windows appends .exe.
+    """
+    stem = Path(cfg["script"]).stem
+    name = stem + (".exe" if sys.platform == "win32" else "")
+    if cfg["onefile"]:
+        return os.path.join(abs_dist, name)
+    return os.path.join(abs_dist, stem, name)
+
+
 def open_folder(path: str):
     if sys.platform == "win32":
         os.startfile(path)
@@ -226,758 +603,4336 @@ def open_folder(path: str):
 
 
 # ══════════════════════════════════════════════════════════
-#  SPLASH  SCREEN
-# ══════════════════════════════════════════════════════════
-class SplashScreen(tk.Toplevel):
-    LINES = [
-        ("",                                                             0.00),
-        ("  ██████╗ ██╗   ██╗    ██████╗     ███████╗██╗  ██╗███████╗", 0.03),
-        ("  ██╔══██╗╚██╗ ██╔╝    ╚════██╗    ██╔════╝╚██╗██╔╝██╔════╝", 0.03),
-        ("  ██████╔╝ ╚████╔╝      █████╔╝    █████╗   ╚███╔╝ █████╗  ", 0.03),
-        ("  ██╔═══╝   ╚██╔╝       ╚═══██╗    ██╔══╝   ██╔██╗ ██╔══╝  ", 0.03),
-        ("  ██║        ██║        ██████╔╝    ███████╗██╔╝ ██╗███████╗", 0.03),
-        ("  ╚═╝        ╚═╝        ╚═════╝     ╚══════╝╚═╝  ╚═╝╚══════╝",0.05),
-        ("",                                                             0.03),
-        ("  Python  -->  EXE  Converter   v2.1",                        0.04),
-        ("  Author  :  Instagram @x404ctl   |   GitHub @MAliX",         0.04),
-        ("",                                                             0.02),
-        ("  " + "─" * 62,                                               0.02),
-        ("",                                                             0.03),
-        ("  [ * ]  Initializing runtime environment ...",               0.06),
-        ("  [ * ]  Locating Python interpreter ...",                    0.07),
-        ("  [ * ]  Loading PyInstaller interface ...",                   0.07),
-        ("  [ * ]  Configuring build workspace ...",                    0.07),
-        ("  [ * ]  All systems ready.",                                  0.08),
-        ("",                                                             0.04),
-        ("  " + "─" * 62,                                               0.02),
-        ("",                                                             0.05),
-        ("        Press any key to continue ...",                        0.00),
-    ]
-
-    def __init__(self, master):
-        super().__init__(master)
-        self.master = master
-        self._done  = False
-        self._line  = 0
-
-        sw, sh = self.winfo_screenwidth(), self.winfo_screenheight()
-        w, h   = 740, 490
-        self.geometry(f"{w}x{h}+{(sw-w)//2}+{(sh-h)//2}")
-        self.configure(bg=T["splash_bg"])
-        self.overrideredirect(True)
-        self.lift()
-        self.focus_force()
-
-        border = tk.Frame(self, bg=T["splash_fg"], padx=2, pady=2)
-        border.pack(fill="both", expand=True, padx=6, pady=6)
-        inner  = tk.Frame(border, bg=T["splash_bg"])
-        inner.pack(fill="both", expand=True)
-
-        self._txt = tk.Text(
-            inner,
-            bg=T["splash_bg"], fg=T["splash_fg"],
-            font=FONT_SPLASH,
-            relief="flat", bd=0,
-            state="disabled", cursor="none",
-            wrap="none", highlightthickness=0,
-        )
-        self._txt.pack(fill="both", expand=True, padx=10, pady=10)
-        self._txt.tag_configure("logo",  foreground="#58d68d",
-                                font=("Consolas", 11, "bold"))
-        self._txt.tag_configure("info",  foreground="#aed6f1")
-        self._txt.tag_configure("dim",   foreground=T["text_dim"])
-        self._txt.tag_configure("ready", foreground="#f0e68c",
-                                font=("Consolas", 11, "bold"))
-        self._txt.tag_configure("press", foreground="#ffffff",
-                                font=("Consolas", 11, "bold"))
-
-        self.bind("<Key>",    self._dismiss)
-        self.bind("<Button>", self._dismiss)
-        self.after(250, self._type_line)
-
-    def _write(self, text, tag=""):
-        self._txt.configure(state="normal")
-        if tag:
-            self._txt.insert("end", text, tag)
+#  SPEC  FILES
+#  With cfg["spec"] the build options become a PyInstaller
+#  spec next to the script, <name>.spec, and PyInstaller runs
+#  from it.  The command line shrinks to the spec plus the
+#  dist and work folders.  Extra files become one datas entry
+#  per file, so no staged tree and no argument limit.  The
+#  file is rewritten only when the text generated from the
+#  options differs; the log shows the change as a diff.  A
+#  spec that does not start with SPEC_HEADER was written by
+#  someone else: it is built as it is and never overwritten.
+#  Deleting the header line of a generated spec keeps edits
+#  made to it.  Paths are written relative to the spec's
+#  folder, and the benchmark hook is read from the environment
+#  when the spec runs, so the file is the same on every
+#  checkout and does not change with the options of one run.
+#  Matrix and auto-tune variants keep building from the
+#  command line, since they would all rewrite the same file.
+# ══════════════════════════════════════════════════════════
+SPEC_HEADER     = "# Generated by PyToExe from the build options."
+SPEC_DIFF_LINES = 40          # diff lines shown in the log
+SPEC_HOOK_ENV   = "PYTOEXE_RUNTIME_HOOK"   # startup-benchmark hook
+
+
+def spec_path(cfg: dict) -> str:
+    """<script dir>/<name>.spec"""
+    script = os.path.abspath(cfg["script"])
+    return os.path.join(os.path.dirname(script), Path(script).stem + ".spec")
+
+
+def _spec_relpath(path: str, base: str) -> str:
+    """path relative to base with '/', as specs resolve it; else absolute."""
+    try:
+        return os.path.relpath(path, base).replace(os.sep, "/")
+    except ValueError:                # another drive on Windows
+        return path
+
+
+def _spec_list(name: str, items: list) -> list:
+    """Spec lines for `name=[...]`, one item per line."""
+    if not items:
+        return [f"    {name}=[],"]
+    return [f"    {name}=["] + [f"        {i!r}," for i in items] + ["    ],"]
+
+
+def spec_text(cfg: dict, python_exe: str) -> str:
+    """The spec PyInstaller would need for cfg, as build_command() builds."""
+    script = os.path.abspath(cfg["script"])
+    name   = Path(script).stem
+    prof   = profile_settings(cfg)
+    major  = _pyinstaller_major(python_exe)
+    hidden = scan_imports(script)["hidden"] \
+        if cfg.get("import_scan", True) else []
+    excludes = excluded_modules(cfg)
+    base  = os.path.dirname(script)
+    datas = [(_spec_relpath(src, base), posixpath.dirname(dest) or ".")
+             for src, dest in asset_files(cfg)]
+    icon  = [_spec_relpath(os.path.abspath(cfg["icon"]), base)] \
+        if cfg["icon"] else None
+    strip = bool(prof["strip"]) and sys.platform != "win32"
+    upx   = prof["upx"] is not False
+
+    lines = [SPEC_HEADER,
+             "# Delete the line above to keep your own edits: PyToExe then",
+             "# builds from this file as it is and never rewrites it.",
+             "# Paths are relative to this file's folder.",
+             "import os",
+             "",
+             "a = Analysis(",
+             f"    [{_spec_relpath(script, base)!r}],",
+             "    pathex=[],",
+             "    binaries=[],"]
+    lines += _spec_list("datas", datas)
+    lines += _spec_list("hiddenimports", hidden)
+    lines += ["    hookspath=[],", "    hooksconfig={},"]
+    lines += [f"    runtime_hooks=[os.environ[h] for h in [{SPEC_HOOK_ENV!r}]",
+              "                   if h in os.environ],"]
+    lines += _spec_list("excludes", excludes)
+    lines += ["    noarchive=False,"]
+    if major >= 6:
+        lines += [f"    optimize={prof['optimize']},"]
+    lines += [")",
+              "pyz = PYZ(a.pure)" if major >= 6 else
+              "pyz = PYZ(a.pure, a.zipped_data)",
+              "",
+              "exe = EXE(",
+              "    pyz,",
+              "    a.scripts,"]
+    if cfg["onefile"]:
+        lines += ["    a.binaries,", "    a.datas,", "    [],"]
+    else:
+        lines += ["    [],", "    exclude_binaries=True,"]
+    lines += [f"    name={name!r},",
+              "    debug=False,",
+              "    bootloader_ignore_signals=False,",
+              f"    strip={strip},",
+              f"    upx={upx},",
+              "    upx_exclude=[],"]
+    if cfg["onefile"]:
+        lines += ["    runtime_tmpdir=None,"]
+    lines += [f"    console={not cfg['windowed']},",
+              f"    icon={icon!r},",
+              ")"]
+    target = "exe"
+    if not cfg["onefile"]:
+        target = "coll"
+        lines += ["coll = COLLECT(",
+                  "    exe,",
+                  "    a.binaries,",
+                  "    a.datas,",
+                  f"    strip={strip},",
+                  f"    upx={upx},",
+                  "    upx_exclude=[],",
+                  f"    name={name!r},",
+                  ")"]
+    if sys.platform == "darwin" and cfg["windowed"]:
+        lines += [f"app = BUNDLE({target}, name={name + '.app'!r}, "
+                  f"icon={icon[0] if icon else None!r}, "
+                  "bundle_identifier=None)"]
+    return "\n".join(lines) + "\n"
+
+
+def write_spec(cfg: dict, python_exe: str) -> dict:
+    """
+    Bring cfg's spec up to date.  Returns {"path", "state", "diff"};
+    state is "written", "updated", "unchanged" or "own" (no
+    SPEC_HEADER, left alone), diff the unified diff of an update.
+    """
+    path = spec_path(cfg)
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            old = fh.read()
+    except FileNotFoundError:
+        old = None
+    if old is not None and not old.startswith(SPEC_HEADER):
+        return {"path": path, "state": "own", "diff": []}
+    text = spec_text(cfg, python_exe)
+    if old == text:
+        return {"path": path, "state": "unchanged", "diff": []}
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        fh.write(text)
+    os.replace(tmp, path)
+    if old is None:
+        return {"path": path, "state": "written", "diff": []}
+    diff = difflib.unified_diff(old.splitlines(), text.splitlines(),
+                                "before", "now", n=1, lineterm="")
+    return {"path": path, "state": "updated", "diff": list(diff)[2:]}
+
+
+def _emit_spec(spec: dict, emit):
+    """Log lines for a write_spec() result."""
+    if spec["state"] == "own":
+        emit(f"Spec       : {spec['path']}  (no PyToExe header — built as "
+             "it is; the form's bundle options do not apply)\n", "warn")
+        return
+    emit(f"Spec       : {spec['path']}  ({spec['state']})\n", "dim")
+    diff = spec["diff"]
+    for line in diff[:SPEC_DIFF_LINES]:
+        tag = "ok" if line.startswith("+") else \
+              "err" if line.startswith("-") else "dim"
+        emit(f"             {line}\n", tag)
+    if len(diff) > SPEC_DIFF_LINES:
+        emit(f"             ... {len(diff) - SPEC_DIFF_LINES} more diff "
+             "line(s)\n", "dim")
+
+
+# ══════════════════════════════════════════════════════════
+#  PER-USER  STATE  FOLDER
+#  Caches, logs and indexes live outside the project tree:
+#    Windows : %LOCALAPPDATA%\PyToExe
+#    Others  : $XDG_CACHE_HOME/pytoexe  (~/.cache/pytoexe)
+#  PYTOEXE_HOME overrides both.
+# ══════════════════════════════════════════════════════════
+def state_dir(*parts: str) -> str:
+    """Return (and create) a folder below the per-user state folder."""
+    root = os.environ.get("PYTOEXE_HOME")
+    if not root:
+        if sys.platform == "win32":
+            base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+            root = os.path.join(base, "PyToExe")
         else:
-            self._txt.insert("end", text)
-        self._txt.see("end")
-        self._txt.configure(state="disabled")
-
-    def _type_line(self):
-        if self._done or self._line >= len(self.LINES):
-            if not self._done:
-                self._blink(True)
-            return
-        text, delay = self.LINES[self._line]
-        self._line += 1
-        if "██" in text:
-            tag = "logo"
-        elif text.strip().startswith("[ * ]"):
-            tag = "dim"
-        elif "Python  -->" in text or "Author" in text:
-            tag = "info"
-        elif "All systems ready" in text:
-            tag = "ready"
-        elif "Press any key" in text:
-            tag = "press"
+            base = os.environ.get("XDG_CACHE_HOME") or \
+                   os.path.join(os.path.expanduser("~"), ".cache")
+            root = os.path.join(base, "pytoexe")
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def file_digest(path: str) -> str:
+    """sha256 of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# ══════════════════════════════════════════════════════════
+#  IMPORT  SCAN
+#  Walks the entry script and the .py files next to it (the
+#  user's own modules and packages) with ast, without running
+#  anything.  Gives the build cache its list of local sources
+#  and build_command() its --hidden-import / --exclude-module
+#  lists; dynamic imports it cannot resolve are reported for
+#  review.  Results are cached per file in
+#  <state>/import-scan.json, revalidated by mtime+size, then
+#  by content hash.
+# ══════════════════════════════════════════════════════════
+IMPORT_SCAN_VERSION = 1
+
+# Heavy packages PyInstaller tends to pull in through optional imports
+# of other packages.  With cfg["auto_exclude"] they are excluded unless
+# the scanned code imports the package itself or one of the packages
+# listed next to it.  Opt-in: third-party code is not scanned, so a
+# dependency that needs one of them at run time would break.
+AUTO_EXCLUDES = {
+    "tkinter":    ("tkinter", "_tkinter", "turtle", "idlelib", "matplotlib",
+                   "PIL", "PySimpleGUI", "FreeSimpleGUI", "customtkinter",
+                   "ttkbootstrap", "pygubu"),
+    "matplotlib": ("matplotlib", "mpl_toolkits", "seaborn", "plotnine",
+                   "pylab"),
+    "IPython":    ("IPython", "ipykernel", "ipywidgets", "jupyter_client"),
+    "PyQt5":      ("PyQt5", "qtpy", "pyqtgraph"),
+    "PyQt6":      ("PyQt6", "qtpy", "pyqtgraph"),
+    "PySide2":    ("PySide2", "qtpy", "pyqtgraph"),
+    "PySide6":    ("PySide6", "qtpy", "pyqtgraph"),
+    "pytest":     ("pytest", "_pytest"),
+    "test":       ("test",),
+}
+
+# Calls that load modules by name at run time
+_IMPORT_CALLS  = {"__import__", "import_module"}
+_LOADER_CALLS  = {"spec_from_file_location", "load_source", "run_module",
+                  "run_path", "load_module"}
+
+_scan_lock    = threading.Lock()
+_scan_cache   = None         # path -> record, loaded on first use
+_scan_changed = set()
+
+
+def _resolve_local(root: str, dotted: str) -> list:
+    """Files making up local module `dotted` below root (packages + module)."""
+    found = []
+    path  = root
+    for part in dotted.split("."):
+        path = os.path.join(path, part)
+        init = os.path.join(path, "__init__.py")
+        if os.path.isfile(init):
+            found.append(init)
+        elif os.path.isfile(path + ".py"):
+            found.append(path + ".py")
+            break
         else:
-            tag = ""
-        self._write(text + "\n", tag)
-        self.after(max(int(delay * 1000), 10), self._type_line)
+            break
+    return found
 
-    def _blink(self, state: bool):
-        if self._done:
-            return
-        self._txt.configure(state="normal")
-        idx = self._txt.index("end-1c")
-        last = self._txt.get("end-2c", "end-1c")
-        if last in ("_", " "):
-            self._txt.delete("end-2c", "end-1c")
-        self._txt.insert("end-1c", "_" if state else " ", "press")
-        self._txt.configure(state="disabled")
-        self.after(500, self._blink, not state)
-
-    def _dismiss(self, event=None):
-        if self._done:
+
+def _literal(node):
+    """The str value of a string-literal node, else None."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if sys.version_info < (3, 8) and isinstance(node, ast.Str):
+        return node.s
+    return None
+
+
+def _parse_imports(path: str) -> dict:
+    """
+    {"imports": [(level, dotted, from-names)],
+     "literal": [names passed as literals to __import__/import_module],
+     "dynamic": [(line, call)] loads whose target is not a literal}
+    """
+    rec = {"imports": [], "literal": [], "dynamic": []}
+    try:
+        with open(path, "rb") as fh:
+            tree = ast.parse(fh.read(), path)
+    except (OSError, SyntaxError, ValueError):
+        return rec
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            rec["imports"] += [(0, a.name, []) for a in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            rec["imports"].append((node.level, node.module or "",
+                                   [a.name for a in node.names]))
+        elif isinstance(node, ast.Call):
+            func = node.func
+            name = func.id if isinstance(func, ast.Name) else \
+                   func.attr if isinstance(func, ast.Attribute) else ""
+            if name in _IMPORT_CALLS:
+                target = _literal(node.args[0]) if node.args else None
+                if target and not target.startswith("."):
+                    rec["literal"].append(target)
+                else:
+                    rec["dynamic"].append((node.lineno, f"{name}(...)"))
+            elif name in _LOADER_CALLS:
+                rec["dynamic"].append((node.lineno, f"{name}(...)"))
+    return rec
+
+
+def _scan_file(path: str) -> dict:
+    """Cached _parse_imports(path)."""
+    global _scan_cache
+    st = os.stat(path)
+    with _scan_lock:
+        if _scan_cache is None:
+            _scan_cache = _load_json(
+                os.path.join(state_dir(), "import-scan.json"), {})
+        rec = _scan_cache.get(path)
+    if rec and rec.get("v") == IMPORT_SCAN_VERSION:
+        if rec["mtime"] == st.st_mtime_ns and rec["size"] == st.st_size:
+            return rec
+        digest = file_digest(path)
+        rec = dict(rec, mtime=st.st_mtime_ns, size=st.st_size) \
+            if rec["sha256"] == digest else None
+    else:
+        digest, rec = file_digest(path), None
+    if rec is None:
+        rec = dict(_parse_imports(path), v=IMPORT_SCAN_VERSION,
+                   mtime=st.st_mtime_ns, size=st.st_size, sha256=digest)
+    with _scan_lock:
+        _scan_cache[path] = rec
+        _scan_changed.add(path)
+    return rec
+
+
+def _save_scan_cache():
+    """Merge this process's new records into the on-disk cache."""
+    cache_file = os.path.join(state_dir(), "import-scan.json")
+    with _scan_lock:
+        if not _scan_changed:
             return
-        self._done = True
-        self.destroy()
-        self.master.deiconify()
-        self.master.lift()
-        self.master.focus_force()
+        disk = _load_json(cache_file, {})
+        disk.update({p: _scan_cache[p] for p in _scan_changed})
+        _scan_changed.clear()
+        try:
+            _save_json(cache_file, disk)
+        except OSError:
+            pass
+
+
+def scan_imports(script: str) -> dict:
+    """
+    Statically scan script and the local modules it imports.  Returns
+      local    : sorted local source files (script excluded)
+      modules  : sorted top-level names of non-local static imports
+      hidden   : modules only loaded via literal __import__/import_module
+      excludes : AUTO_EXCLUDES entries nothing in the scanned code needs
+      dynamic  : ["file:line: call"] loads that need a human to review
+    """
+    script  = os.path.abspath(script)
+    root    = os.path.dirname(script)
+    seen    = {script}
+    todo    = [script]
+    modules = set()
+    hidden  = set()
+    dynamic = []
+    while todo:
+        current = todo.pop()
+        rec     = _scan_file(current)
+        imports = [tuple(i) for i in rec["imports"]]
+        imports += [(0, name, []) for name in rec["literal"]]
+        for line, call in rec["dynamic"]:
+            dynamic.append(f"{os.path.relpath(current, root)}:{line}: {call}")
+        for level, name, names in imports:
+            if level:
+                # Relative import — anchor at the importing file's package
+                base = os.path.dirname(current)
+                for _ in range(level - 1):
+                    base = os.path.dirname(base)
+            else:
+                base = root
+            candidates = _resolve_local(base, name) if name else []
+            for sub in names:
+                dotted = f"{name}.{sub}" if name else sub
+                candidates += _resolve_local(base, dotted)
+            if not level and not candidates:
+                modules.add(name.split(".")[0])
+            for f in candidates:
+                f = os.path.abspath(f)
+                if f not in seen:
+                    seen.add(f)
+                    todo.append(f)
+        hidden.update(rec["literal"])
+    _save_scan_cache()
+
+    # A kept package keeps what it needs (seaborn -> matplotlib -> tkinter)
+    kept = modules | {h.split(".")[0] for h in hidden}
+    kept |= {Path(os.path.relpath(f, root)).parts[0].split(".")[0]
+             for f in seen}
+    grew = True
+    while grew:
+        grew = False
+        for mod, keepers in AUTO_EXCLUDES.items():
+            if mod not in kept and kept.intersection(keepers):
+                kept.add(mod)
+                grew = True
+    seen.discard(script)
+    return {
+        "local":    sorted(seen),
+        "modules":  sorted(modules),
+        "hidden":   sorted(hidden),
+        "excludes": [m for m in AUTO_EXCLUDES if m not in kept],
+        "dynamic":  sorted(dynamic),
+    }
+
+
+def local_imports(script: str) -> list:
+    """Return the sorted local source files transitively imported by script."""
+    return scan_imports(script)["local"]
 
 
 # ══════════════════════════════════════════════════════════
-#  MAIN  APPLICATION
+#  ASSET  TREES
+#  Extra files and whole folders are staged into one tree,
+#  <work>/assets, that PyInstaller gets as a single --add-data
+#  — a folder of thousands of files no longer means thousands
+#  of arguments.  A folder keeps its relative structure below
+#  its own name; a file lands at the bundle root.  Staging
+#  hard-links (or copies) only what changed: a target that is
+#  the source's inode, or has its size and mtime, is left
+#  alone, and files no longer listed are removed.  Content
+#  hashes for the build cache come from <work>/assets.json,
+#  an index revalidated by mtime and size.
 # ══════════════════════════════════════════════════════════
-class App(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.withdraw()
-
-        self.title("PyToExe Converter  //  @x404ctl  |  @MAliX")
-        w, h = 820, 740
-        sw, sh = self.winfo_screenwidth(), self.winfo_screenheight()
-        self.geometry(f"{w}x{h}+{(sw-w)//2}+{(sh-h)//2}")
-        self.minsize(750, 640)
-        self.configure(bg=T["bg"])
-        self.resizable(True, True)
-
-        # Locate real Python ONCE at startup
-        self._python_exe = find_python()
-
-        # State
-        self.script_var   = tk.StringVar()
-        self.output_var   = tk.StringVar()
-        self.icon_var     = tk.StringVar()
-        self.onefile_var  = tk.BooleanVar(value=True)
-        self.windowed_var = tk.BooleanVar(value=False)
-        self.extra_files  = []
-        self._thread      = None
-        self._last_out    = ""
-        self._open_visible = False
-
-        self._apply_style()
-        self._build_ui()
-        SplashScreen(self)
-
-        # Warn early if Python not found
-        if not self._python_exe:
-            self.after(800, self._warn_no_python)
-
-    def _warn_no_python(self):
-        messagebox.showerror(
-            "Python Not Found",
-            "PyToExe could not locate a Python 3 interpreter.\n\n"
-            "Make sure Python 3 is installed and added to your system PATH.\n\n"
-            "Download from: https://python.org/downloads\n"
-            "(Check 'Add Python to PATH' during installation)",
-        )
+ASSET_INDEX_VERSION = 1
+ASSET_SKIP = {"__pycache__", ".git", ".hg", ".svn", ".DS_Store", "Thumbs.db"}
 
-    # ══════════════════════════════════════════
-    #  STYLE
-    # ══════════════════════════════════════════
-    def _apply_style(self):
-        s = ttk.Style(self)
-        s.theme_use("clam")
-        s.configure(".",
-                    background=T["bg"], foreground=T["text"],
-                    font=FONT_UI, borderwidth=0)
-        s.configure("TFrame",       background=T["bg"])
-        s.configure("TLabel",       background=T["bg"],
-                    foreground=T["text"], font=FONT_UI)
-        s.configure("TCheckbutton", background=T["bg"],
-                    foreground=T["text"], font=FONT_UI,
-                    focuscolor=T["bg"])
-        s.map("TCheckbutton",
-              background=[("active", T["bg"])],
-              foreground=[("active", T["accent_hov"])])
-        s.configure("TEntry",
-                    fieldbackground=T["entry_bg"],
-                    foreground=T["entry_fg"],
-                    insertcolor=T["text"],
-                    bordercolor=T["border"],
-                    font=FONT_MONO)
-        s.map("TEntry", bordercolor=[("focus", T["blue"])])
-        s.configure("TProgressbar",
-                    troughcolor=T["panel"],
-                    background=T["accent"],
-                    bordercolor=T["border"],
-                    lightcolor=T["accent"],
-                    darkcolor=T["accent"])
-        s.configure("TScrollbar",
-                    background=T["border"],
-                    troughcolor=T["panel"],
-                    arrowcolor=T["text_dim"])
-
-    # ══════════════════════════════════════════
-    #  UI LAYOUT
-    # ══════════════════════════════════════════
-    def _build_ui(self):
-        self._make_titlebar()
-
-        wrap   = tk.Frame(self, bg=T["bg"])
-        wrap.pack(fill="both", expand=True)
-
-        canvas = tk.Canvas(wrap, bg=T["bg"], highlightthickness=0)
-        vsb    = ttk.Scrollbar(wrap, orient="vertical", command=canvas.yview)
-        canvas.configure(yscrollcommand=vsb.set)
-        vsb.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
-
-        self._sf = tk.Frame(canvas, bg=T["bg"])
-        wid = canvas.create_window((0, 0), window=self._sf, anchor="nw")
-
-        def _resize(e):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas.itemconfig(wid, width=canvas.winfo_width())
-
-        self._sf.bind("<Configure>", _resize)
-        canvas.bind("<Configure>",
-                    lambda e: canvas.itemconfig(wid, width=e.width))
-        canvas.bind_all("<MouseWheel>",
-                        lambda e: canvas.yview_scroll(
-                            -1 * (e.delta // 120), "units"))
-
-        self._section_files(self._sf)
-        self._section_options(self._sf)
-        self._section_extras(self._sf)
-        self._section_python_info(self._sf)   # shows detected Python path
-        self._section_convert(self._sf)
-        self._section_log(self._sf)
-        self._make_statusbar()
-
-    # ── Title bar ─────────────────────────────
-    def _make_titlebar(self):
-        bar = tk.Frame(self, bg=T["blue"], height=54)
-        bar.pack(fill="x")
-        bar.pack_propagate(False)
-        tk.Label(bar, text=" PY ",
-                 bg=T["accent"], fg="#fff",
-                 font=("Consolas", 13, "bold"),
-                 padx=4).pack(side="left", padx=(14, 0), pady=12)
-        tk.Label(bar, text="  PyToExe  Converter",
-                 bg=T["blue"], fg="#ffffff",
-                 font=("Consolas", 15, "bold")).pack(side="left")
-        tk.Label(bar, text="Instagram @x404ctl   |   GitHub @MAliX   ",
-                 bg=T["blue"], fg="#93c5fd",
-                 font=("Consolas", 8)).pack(side="right", padx=14)
-
-    # ── Status bar ────────────────────────────
-    def _make_statusbar(self):
-        sb = tk.Frame(self, bg=T["panel"], height=28)
-        sb.pack(fill="x", side="bottom")
-        sb.pack_propagate(False)
-        tk.Frame(sb, bg=T["border"], width=1).pack(side="left", fill="y")
-        self._dot = tk.Label(sb, text="  ●  ",
-                             bg=T["panel"], fg=T["text_dim"],
-                             font=("Consolas", 9, "bold"))
-        self._dot.pack(side="left")
-        self._status = tk.Label(
-            sb,
-            text="Ready.   Select a Python script then press CONVERT.",
-            bg=T["panel"], fg=T["text_dim"],
-            font=("Consolas", 8), anchor="w",
-        )
-        self._status.pack(side="left", fill="x", expand=True)
-        tk.Label(sb, text="  PyToExe v2.1  by @x404ctl   ",
-                 bg=T["panel"], fg=T["border"],
-                 font=("Consolas", 8)).pack(side="right")
-
-    # ── Card helper ───────────────────────────
-    def _card(self, parent, title: str) -> tk.Frame:
-        outer = tk.Frame(parent, bg=T["border"], padx=1, pady=1)
-        outer.pack(fill="x", padx=PAD, pady=(0, PAD))
-        hdr = tk.Frame(outer, bg="#1c2128")
-        hdr.pack(fill="x")
-        tk.Label(hdr, text=f"  {title}",
-                 bg="#1c2128", fg=T["blue_hov"],
-                 font=FONT_HEAD, anchor="w").pack(
-            side="left", padx=8, pady=6)
-        tk.Frame(outer, bg=T["border"], height=1).pack(fill="x")
-        body = tk.Frame(outer, bg=T["panel"])
-        body.pack(fill="x")
-        return body
-
-    # ── File-row helper ───────────────────────
-    def _file_row(self, parent, label, row, var, cmd):
-        tk.Label(parent, text=label,
-                 bg=T["panel"], fg=T["text_dim"],
-                 font=FONT_UI, width=17, anchor="e"
-                 ).grid(row=row, column=0, padx=(PAD, 6), pady=6, sticky="e")
-        e = tk.Entry(parent,
-                     textvariable=var,
-                     bg=T["entry_bg"], fg=T["entry_fg"],
-                     insertbackground=T["text"],
-                     relief="flat", font=FONT_MONO,
-                     highlightthickness=1,
-                     highlightbackground=T["border"],
-                     highlightcolor=T["blue"])
-        e.grid(row=row, column=1, sticky="ew", pady=6)
-        tk.Button(parent, text="Browse",
-                  bg=T["btn_bg"], fg=T["btn_fg"],
-                  activebackground=T["btn_hov"],
-                  activeforeground=T["text"],
-                  relief="flat", font=FONT_UI,
-                  cursor="hand2", padx=10,
-                  command=cmd).grid(
-            row=row, column=2, padx=(6, PAD), pady=6)
-
-    # ── Sections ─────────────────────────────
-    def _section_files(self, p):
-        tk.Frame(p, bg=T["bg"], height=PAD).pack()
-        body = self._card(p, "01  /  Select Files")
-        body.columnconfigure(1, weight=1)
-        self._file_row(body, "Python Script  *", 0,
-                       self.script_var, self._browse_script)
-        self._file_row(body, "Output Folder",    1,
-                       self.output_var, self._browse_output)
-        self._file_row(body, "Icon  (.ico)",      2,
-                       self.icon_var,   self._browse_icon)
-        tk.Frame(body, bg=T["panel"], height=6).grid(
-            row=3, column=0, columnspan=3)
-
-    def _section_options(self, p):
-        body = self._card(p, "02  /  Build Options")
-        row  = tk.Frame(body, bg=T["panel"])
-        row.pack(anchor="w", padx=PAD, pady=10)
-
-        def cb(txt, var):
-            return tk.Checkbutton(
-                row, text=txt, variable=var,
-                bg=T["panel"], fg=T["text"],
-                activebackground=T["panel"],
-                activeforeground=T["accent_hov"],
-                selectcolor=T["entry_bg"],
-                font=FONT_UI, cursor="hand2",
-                relief="flat", bd=0,
-            )
-
-        cb("One-File  ( single .exe )",       self.onefile_var ).pack(side="left", padx=(0, 30))
-        cb("Windowed  ( no console window )", self.windowed_var).pack(side="left")
-
-    def _section_extras(self, p):
-        body  = self._card(p, "03  /  Additional Files  ( optional )")
-        inner = tk.Frame(body, bg=T["panel"])
-        inner.pack(fill="x", padx=PAD, pady=10)
-
-        lbf = tk.Frame(inner, bg=T["border"], padx=1, pady=1)
-        lbf.pack(side="left", fill="both", expand=True)
-
-        self._extras_lb = tk.Listbox(
-            lbf, height=3,
-            bg=T["log_bg"], fg=T["log_fg"],
-            selectbackground=T["select_bg"],
-            selectforeground="#fff",
-            font=FONT_MONO,
-            relief="flat", bd=0, activestyle="none",
-        )
-        self._extras_lb.pack(side="left", fill="both", expand=True)
-        sb = tk.Scrollbar(lbf, orient="vertical",
-                          command=self._extras_lb.yview,
-                          bg=T["border"], troughcolor=T["panel"])
-        sb.pack(side="right", fill="y")
-        self._extras_lb.configure(yscrollcommand=sb.set)
-
-        bcol = tk.Frame(inner, bg=T["panel"])
-        bcol.pack(side="left", padx=(8, 0))
-        for txt, fn in [("+ Add", self._add_extra),
-                        ("- Remove", self._remove_extra)]:
-            tk.Button(bcol, text=txt,
-                      bg=T["btn_bg"], fg=T["btn_fg"],
-                      activebackground=T["btn_hov"],
-                      activeforeground=T["text"],
-                      relief="flat", font=FONT_UI,
-                      cursor="hand2", width=10,
-                      command=fn).pack(pady=2)
-
-    def _section_python_info(self, p):
-        """Shows which Python will be used — critical for transparency."""
-        body = self._card(p, "04  /  Python Interpreter  ( detected automatically )")
-        row  = tk.Frame(body, bg=T["panel"])
-        row.pack(fill="x", padx=PAD, pady=8)
-
-        color  = T["ok"]   if self._python_exe else T["danger"]
-        status = self._python_exe if self._python_exe else \
-                 "NOT FOUND — install Python 3 and add it to PATH"
-
-        self._py_lbl = tk.Label(
-            row,
-            text=f"  {status}",
-            bg=T["panel"], fg=color,
-            font=FONT_MONO, anchor="w",
-        )
-        self._py_lbl.pack(side="left", fill="x", expand=True)
-
-        tk.Button(row, text="Change",
-                  bg=T["btn_bg"], fg=T["btn_fg"],
-                  activebackground=T["btn_hov"],
-                  activeforeground=T["text"],
-                  relief="flat", font=FONT_UI,
-                  cursor="hand2", padx=8,
-                  command=self._browse_python).pack(side="right")
-
-    def _section_convert(self, p):
-        wrapper = tk.Frame(p, bg=T["bg"])
-        wrapper.pack(fill="x", padx=PAD, pady=(0, PAD))
-
-        self._conv_btn = tk.Button(
-            wrapper,
-            text="  CONVERT   .py  -->  .exe  ",
-            font=("Consolas", 14, "bold"),
-            bg=T["accent"],
-            fg="#ffffff",
-            activebackground=T["accent_hov"],
-            activeforeground="#ffffff",
-            relief="flat", cursor="hand2",
-            pady=16, bd=0,
-            command=self._start_build,
-        )
-        self._conv_btn.pack(fill="x")
-
-        prow = tk.Frame(wrapper, bg=T["bg"])
-        prow.pack(fill="x", pady=(6, 0))
-        self._progress = ttk.Progressbar(prow, mode="indeterminate")
-        self._progress.pack(side="left", fill="x", expand=True, padx=(0, 6))
-        tk.Button(prow, text="Clear Log",
-                  bg=T["btn_bg"], fg=T["text_dim"],
-                  activebackground=T["btn_hov"],
-                  activeforeground=T["text"],
-                  relief="flat", font=FONT_UI,
-                  cursor="hand2", padx=10, pady=3,
-                  command=self._clear_log).pack(side="right")
-
-        # Hidden until success
-        self._open_btn = tk.Button(
-            wrapper,
-            text="  Open Output Folder  ",
-            font=("Consolas", 10, "bold"),
-            bg="#0d3321", fg=T["ok"],
-            activebackground="#1a5c38",
-            activeforeground="#fff",
-            relief="flat", cursor="hand2",
-            pady=8, bd=0,
-            command=self._open_output,
-        )
 
-    def _section_log(self, p):
-        body = self._card(p, "05  /  Build Log")
-        self._log = scrolledtext.ScrolledText(
-            body,
-            font=FONT_MONO,
-            bg=T["log_bg"], fg=T["log_fg"],
-            insertbackground=T["text"],
-            selectbackground=T["select_bg"],
-            relief="flat", bd=0,
-            state="disabled", wrap="none",
-            height=14,
-        )
-        self._log.pack(fill="both", expand=True, padx=1, pady=(0, 1))
-        self._log.tag_configure("ok",   foreground=T["ok"])
-        self._log.tag_configure("err",  foreground=T["danger"])
-        self._log.tag_configure("warn", foreground=T["warn"])
-        self._log.tag_configure("cmd",  foreground="#79c0ff")
-        self._log.tag_configure("head", foreground="#e3b341",
-                                font=("Consolas", 9, "bold"))
-        self._log.tag_configure("dim",  foreground=T["text_dim"])
-        tk.Frame(p, bg=T["bg"], height=PAD).pack()
-
-    # ══════════════════════════════════════════
-    #  BROWSE  DIALOGS
-    # ══════════════════════════════════════════
-    def _browse_script(self):
-        p = filedialog.askopenfilename(
-            title="Select Python Script",
-            filetypes=[("Python files", "*.py *.pyw"), ("All files", "*.*")],
-        )
-        if p:
-            self.script_var.set(p)
-            if not self.output_var.get():
-                self.output_var.set(str(Path(p).parent / "dist"))
+def asset_files(cfg: dict) -> list:
+    """[(source path, bundle path with '/')] for every extra file."""
+    out = []
+    for item in cfg["extra_files"]:
+        src  = os.path.abspath(item)
+        name = os.path.basename(src.rstrip("\\/"))
+        if not os.path.isdir(src):
+            out.append((src, name))
+        else:
+            out += _asset_folder(src, name)[0]
+    return out
 
-    def _browse_output(self):
-        p = filedialog.askdirectory(title="Select Output Folder")
-        if p:
-            self.output_var.set(p)
 
-    def _browse_icon(self):
-        p = filedialog.askopenfilename(
-            title="Select Icon File",
-            filetypes=[("Icon files", "*.ico"), ("All files", "*.*")],
-        )
-        if p:
-            self.icon_var.set(p)
+def _asset_folder(src: str, name: str) -> tuple:
+    """([(source, bundle path)] below folder src, [its folders walked])."""
+    out, folders = [], []
+    for root, dirs, files in os.walk(src):
+        folders.append(root)
+        dirs[:] = sorted(d for d in dirs if d not in ASSET_SKIP)
+        rel = os.path.relpath(root, src).replace(os.sep, "/")
+        base = name if rel == "." else f"{name}/{rel}"
+        out += [(os.path.join(root, f), f"{base}/{f}")
+                for f in sorted(files) if f not in ASSET_SKIP]
+    return out, folders
 
-    def _browse_python(self):
-        p = filedialog.askopenfilename(
-            title="Select python.exe",
-            filetypes=[("Python executable", "python*.exe"), ("All files", "*.*")],
-        )
-        if p:
-            self._python_exe = p
-            self._py_lbl.configure(text=f"  {p}", fg=T["ok"])
-
-    def _add_extra(self):
-        for p in filedialog.askopenfilenames(title="Select Files to Bundle"):
-            if p not in self.extra_files:
-                self.extra_files.append(p)
-                self._extras_lb.insert("end", f"  {os.path.basename(p)}")
-
-    def _remove_extra(self):
-        for i in reversed(self._extras_lb.curselection()):
-            self._extras_lb.delete(i)
-            self.extra_files.pop(i)
-
-    # ══════════════════════════════════════════
-    #  LOG  UTILITIES
-    # ══════════════════════════════════════════
-    def _log_write(self, text: str, tag: str = ""):
-        self._log.configure(state="normal")
-        if tag:
-            self._log.insert("end", text, tag)
+
+def asset_digests(cfg: dict, work_dir: str) -> list:
+    """[(bundle path, sha256)], hashing only files changed since last time."""
+    path  = os.path.join(work_dir, "assets.json")
+    index = {}
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        if data.get("version") == ASSET_INDEX_VERSION:
+            index = data["files"]
+    except (OSError, ValueError, KeyError):
+        pass
+    fresh, out = {}, []
+    for src, dest in asset_files(cfg):
+        st   = os.stat(src)
+        prev = index.get(src)
+        if prev and prev[0] == st.st_mtime_ns and prev[1] == st.st_size:
+            digest = prev[2]
         else:
-            self._log.insert("end", text)
-        self._log.see("end")
-        self._log.configure(state="disabled")
-
-    def _clear_log(self):
-        self._log.configure(state="normal")
-        self._log.delete("1.0", "end")
-        self._log.configure(state="disabled")
-
-    def _set_status(self, text: str, dot: str = T["text_dim"]):
-        self._status.configure(text=f"  {text}")
-        self._dot.configure(fg=dot)
-
-    def _unlock_ui(self):
-        """Always re-enable the convert button — called on any build exit."""
-        self._progress.stop()
-        self._conv_btn.configure(
-            state="normal",
-            text="  CONVERT   .py  -->  .exe  ",
-            bg=T["accent"],
-        )
+            digest = file_digest(src)
+        fresh[src] = [st.st_mtime_ns, st.st_size, digest]
+        out.append((dest, digest))
+    if fresh != index:
+        os.makedirs(work_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"version": ASSET_INDEX_VERSION, "files": fresh}, fh)
+        os.replace(tmp, path)
+    return out
 
-    # ══════════════════════════════════════════
-    #  VALIDATION
-    # ══════════════════════════════════════════
-    def _validate(self) -> bool:
-        if not self._python_exe:
-            messagebox.showerror(
-                "Python Not Found",
-                "No Python interpreter was detected.\n\n"
-                "Use the 'Change' button in section 04 to manually\n"
-                "locate your python.exe file.",
-            )
-            return False
-        s = self.script_var.get().strip()
-        if not s:
-            messagebox.showwarning("No Script",
-                                   "Please select a .py file first.")
-            return False
-        if not os.path.isfile(s):
-            messagebox.showerror("Not Found", f"File not found:\n{s}")
-            return False
-        ico = self.icon_var.get().strip()
-        if ico and not os.path.isfile(ico):
-            messagebox.showerror("Icon Not Found",
-                                 f"Icon file not found:\n{ico}")
-            return False
+
+def _same_file(a: os.stat_result, b: os.stat_result) -> bool:
+    if (a.st_dev, a.st_ino) == (b.st_dev, b.st_ino) and a.st_ino:
         return True
+    return a.st_size == b.st_size and a.st_mtime_ns == b.st_mtime_ns
 
-    # ══════════════════════════════════════════
-    #  BUILD  PIPELINE
-    # ══════════════════════════════════════════
-    def _start_build(self):
-        if self._thread and self._thread.is_alive():
-            messagebox.showinfo("Busy", "A build is already running.")
-            return
-        if not self._validate():
-            return
-        if not ensure_pyinstaller(self._python_exe):
-            return
 
-        cfg = {
-            "script":      self.script_var.get().strip(),
-            "output_dir":  self.output_var.get().strip() or None,
-            "icon":        self.icon_var.get().strip() or None,
-            "onefile":     self.onefile_var.get(),
-            "windowed":    self.windowed_var.get(),
-            "extra_files": list(self.extra_files),
-        }
-
-        if self._open_visible:
-            self._open_btn.pack_forget()
-            self._open_visible = False
-
-        self._conv_btn.configure(
-            state="disabled",
-            text="  Building  ...  please wait  ",
-            bg=T["accent_dim"],
-        )
-        self._progress.start(8)
-        self._set_status("Building  ...  compiling your script.", T["blue"])
-        self._clear_log()
+def stage_assets(cfg: dict, work_dir: str) -> dict:
+    """
+    Bring <work>/assets in line with cfg["extra_files"].  Returns
+    {"files", "staged", "unchanged", "removed", "bytes"}.
+    """
+    stage  = os.path.join(work_dir, "assets")
+    stats  = dict.fromkeys(("files", "staged", "unchanged", "removed",
+                            "bytes"), 0)
+    wanted = set()
+    for src, dest in asset_files(cfg):
+        target = os.path.join(stage, *dest.split("/"))
+        wanted.add(os.path.normcase(target))
+        st = os.stat(src)
+        stats["files"] += 1
+        stats["bytes"] += st.st_size
+        try:
+            if _same_file(st, os.stat(target)):
+                stats["unchanged"] += 1
+                continue
+            os.remove(target)
+        except OSError:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+        _link_or_copy(src, target)
+        stats["staged"] += 1
+    for root, dirs, files in os.walk(stage, topdown=False):
+        for f in files:
+            path = os.path.join(root, f)
+            if os.path.normcase(path) not in wanted:
+                os.remove(path)
+                stats["removed"] += 1
+        if root != stage and not os.listdir(root):
+            os.rmdir(root)
+    os.makedirs(stage, exist_ok=True)
+    return stats
+
+
+# ══════════════════════════════════════════════════════════
+#  BUILD  CACHE
+#  Content-addressed: the key is a hash of every input that
+#  can change the produced executable.  A hit copies the
+#  stored artifact into the output folder instead of running
+#  PyInstaller.  Output and cache never share a writable file
+#  — signing, UPX or strip on the delivered exe would rewrite
+#  the cached copy — so files are reflinked (copy-on-write)
+#  where the filesystem can, else copied; only read-only
+#  files, i.e. artifact-store blobs, are hard-linked.
+# ══════════════════════════════════════════════════════════
+BUILD_CACHE_MAX_ENTRIES = 30
+
+def interpreter_fingerprint(python_exe: str) -> str:
+    """'Python <version> | PyInstaller <version>' for python_exe."""
+    st = pyinstaller_status(python_exe)
+    if not st["available"]:
+        raise RuntimeError(f"PyInstaller not importable by {python_exe}")
+    return f"Python {st['python_version']} | PyInstaller {st['version']}"
+
+
+def build_cache_key(cfg: dict, python_exe: str) -> str:
+    """
+    Hash of script, local imports, extras, icon, options, toolchain
+    and the interpreter's installed packages.
+    """
+    script = os.path.abspath(cfg["script"])
+    h = hashlib.sha256()
+    h.update(json.dumps({
+        "name":        Path(script).stem,
+        "onefile":     bool(cfg["onefile"]),
+        "windowed":    bool(cfg["windowed"]),
+        "import_scan": bool(cfg.get("import_scan", True)),
+        "auto_exclude": bool(cfg.get("auto_exclude")),
+        "bench_hook":  bool(cfg.get("bench_runs")),
+        "profile":     profile_settings(cfg),
+        "python":      os.path.abspath(python_exe),
+        "toolchain":   interpreter_fingerprint(python_exe),
+        # Upgrading a bundled dependency must not hit the old exe
+        "packages":    pyinstaller_status(python_exe)["packages"],
+        "platform":    sys.platform,
+    }, sort_keys=True).encode())
+
+    root = os.path.dirname(script)
+    inputs = [("script", script)]
+    inputs += [("import:" + os.path.relpath(f, root), f)
+               for f in local_imports(script)]
+    if cfg["icon"]:
+        inputs.append(("icon", os.path.abspath(cfg["icon"])))
+    if cfg.get("spec") and os.path.isfile(spec_path(cfg)):
+        inputs.append(("spec", spec_path(cfg)))
+    for role, path in inputs:
+        h.update(f"\0{role}\0".encode())
+        h.update(file_digest(path).encode())
+    for dest, digest in asset_digests(cfg, work_dir_for(cfg, python_exe)):
+        h.update(f"\0data:{dest}\0{digest}".encode())
+    return h.hexdigest()
 
-        self._thread = threading.Thread(
-            target=self._run_build, args=(cfg,), daemon=True)
-        self._thread.start()
 
-    def _run_build(self, cfg: dict):
-        # Build command — get cmd list AND resolved dist dir
+def _link_or_copy(src: str, dst: str):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _cache_copy(src: str, dst: str):
+    """Hard-link a read-only src, else reflink, else copy it."""
+    if not os.stat(src).st_mode & 0o222:
         try:
-            cmd, abs_dist = build_command(cfg, self._python_exe)
-        except Exception as exc:
-            self.after(0, self._log_write,
-                       f"\nFailed to build command: {exc}\n", "err")
-            self.after(0, self._unlock_ui)
-            self.after(0, self._set_status,
-                       "Build failed.  See log.", T["danger"])
+            os.link(src, dst)
             return
+        except OSError:
+            pass
+    try:
+        _reflink(src, dst)
+        shutil.copystat(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _link_tree(src: str, dst: str, link=_link_or_copy):
+    """Recreate the folder src at dst, hard-linking files where possible."""
+    for dirpath, _dirs, files in os.walk(src):
+        target = os.path.join(dst, os.path.relpath(dirpath, src))
+        os.makedirs(target, exist_ok=True)
+        for f in files:
+            link(os.path.join(dirpath, f), os.path.join(target, f))
+
+
+def _remove_path(path: str):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+def _artifact_root(cfg: dict, exe: str) -> str:
+    """The file (onefile) or folder (onedir) that makes up the artifact."""
+    return exe if cfg["onefile"] else os.path.dirname(exe)
+
 
-        ts = time.strftime("%H:%M:%S")
-        self.after(0, self._log_write, f"[ {ts} ]  Build started\n", "head")
-        self.after(0, self._log_write,
-                   f"Python     : {self._python_exe}\n", "dim")
-        self.after(0, self._log_write,
-                   f"Script     : {cfg['script']}\n", "dim")
-        self.after(0, self._log_write,
-                   f"Output dir : {abs_dist}\n", "dim")
-        self.after(0, self._log_write,
-                   "\nCommand:\n  " + " ".join(cmd) + "\n\n", "cmd")
+def cache_restore(key: str, cfg: dict, exe: str) -> bool:
+    """Materialise a cached artifact at its output location. True on a hit."""
+    entry  = os.path.join(state_dir("build-cache"), key)
+    stored = os.path.join(entry, "artifact")
+    if not os.path.lexists(stored):
+        return False
+    target = _artifact_root(cfg, exe)
+    _remove_path(target)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    if os.path.isdir(stored):
+        _link_tree(stored, target, _cache_copy)
+    else:
+        _cache_copy(stored, target)
+    os.utime(entry)   # LRU bookkeeping
+    return os.path.isfile(exe)
 
-        # Ensure dist folder exists
+
+def cache_store(key: str, cfg: dict, exe: str):
+    """Copy a freshly built artifact into the cache, then prune old entries."""
+    cache  = state_dir("build-cache")
+    entry  = os.path.join(cache, key)
+    tmp    = tempfile.mkdtemp(dir=cache, prefix=key[:16] + "-", suffix=".tmp")
+    source = _artifact_root(cfg, exe)
+    try:
+        if os.path.isdir(source):
+            _link_tree(source, os.path.join(tmp, "artifact"), _cache_copy)
+        else:
+            _cache_copy(source, os.path.join(tmp, "artifact"))
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as fh:
+            json.dump({"script": cfg["script"], "exe": exe,
+                       "created": time.time()}, fh, indent=2)
         try:
-            os.makedirs(abs_dist, exist_ok=True)
-        except OSError as exc:
-            self.after(0, self._log_write,
-                       f"\nCannot create output folder:\n{exc}\n", "err")
-            self.after(0, self._unlock_ui)
-            self.after(0, self._set_status,
-                       "Build failed.  See log.", T["danger"])
-            return
+            os.rename(tmp, entry)
+        except OSError:
+            # Same key, same artifact: keep the entry already stored
+            # (possibly by a concurrent build) instead of swapping it
+            if not os.path.isdir(entry):
+                raise
+            try:
+                os.utime(entry)
+            except FileNotFoundError:
+                pass
+    finally:
+        _remove_path(tmp)
 
-        success = False
-        try:
-            flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-            proc  = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                creationflags=flags,
-                # NO cwd override — use absolute paths throughout
-            )
-            for line in proc.stdout:
-                self.after(0, self._log_write, line)
-            proc.wait()
-            success = proc.returncode == 0
+    # Other builds' *.tmp folders are still being written — leave them
+    entries = []
+    for name in os.listdir(cache):
+        if name.endswith(".tmp"):
+            continue
+        try:
+            entries.append((os.path.getmtime(os.path.join(cache, name)),
+                            name))
         except FileNotFoundError:
-            self.after(0, self._log_write,
-                       f"\nERROR: Could not launch:\n  {self._python_exe}\n\n"
-                       "Make sure Python is installed and on PATH.\n", "err")
-        except Exception as exc:
-            self.after(0, self._log_write,
-                       f"\nUnexpected error: {exc}\n", "err")
-
-        # Pass resolved dist path back via cfg dict
-        cfg["_abs_dist"] = abs_dist
-        self.after(0, self._build_finished, success, cfg)
-
-    def _build_finished(self, success: bool, cfg: dict):
-        self._unlock_ui()
-        ts   = time.strftime("%H:%M:%S")
-        out  = cfg.get("_abs_dist", "")
-        name = Path(cfg["script"]).stem + ".exe"
-        exe  = os.path.join(out, name)
-
-        if success and os.path.isfile(exe):
-            # Real success — exe exists on disk
-            self._last_out = out
-            self._log_write(f"\n[ {ts} ]  Build succeeded\n", "ok")
-            self._log_write(f"  Executable : {exe}\n", "ok")
-            self._set_status(f"Done.   {name}  -->  {out}", T["ok"])
-            self._open_btn.pack(fill="x", pady=(8, 0))
-            self._open_visible = True
-            messagebox.showinfo(
-                "Build Successful",
-                f"'{name}' was created successfully.\n\n"
-                f"Location:\n{exe}",
-            )
-
-        elif success and not os.path.isfile(exe):
-            # PyInstaller said OK but no file found — common with antivirus
-            self._log_write(
-                f"\n[ {ts} ]  PyInstaller finished OK but .exe was NOT found.\n"
-                f"  Expected: {exe}\n", "warn")
-            self._log_write(
-                "\n  Most likely causes:\n"
-                "  1. Antivirus deleted the .exe immediately after creation\n"
-                "     --> Add your output folder to antivirus exclusions\n"
-                "  2. The output folder was changed mid-build\n"
-                "  3. A previous .spec file conflict (delete __pybuild_tmp__)\n",
-                "warn")
-            self._set_status(
-                "Build finished but .exe not found.  Antivirus?", T["warn"])
-            messagebox.showwarning(
-                "EXE Not Found",
-                f"PyInstaller finished without errors but\n"
-                f"'{name}' was not found at:\n{exe}\n\n"
-                "Most likely cause: Antivirus deleted it.\n\n"
-                "Fix: Add your output folder to antivirus exclusions,\n"
-                "then build again.",
-            )
+            pass
+    entries.sort(reverse=True)
+    for _mtime, name in entries[BUILD_CACHE_MAX_ENTRIES:]:
+        try:
+            _remove_path(os.path.join(cache, name))
+        except FileNotFoundError:
+            pass
 
-        else:
-            # Real failure
-            self._log_write(f"\n[ {ts} ]  Build FAILED.  See log above.\n",
-                            "err")
-            self._set_status(
-                "Build failed.  See the Build Log for details.", T["danger"])
-            messagebox.showerror(
-                "Build Failed",
-                "PyInstaller encountered errors.\n"
-                "Read the Build Log carefully — the first red line\n"
-                "is usually the root cause.",
-            )
-
-    def _open_output(self):
-        if self._last_out and os.path.isdir(self._last_out):
-            open_folder(self._last_out)
-        else:
-            messagebox.showwarning("Not Found",
-                                   "Output folder no longer exists.")
+
+def _cached_links(exe: str) -> collections.Counter:
+    """(st_dev, st_ino) -> links held by the cached builds of exe."""
+    links = collections.Counter()
+    cache = state_dir("build-cache")
+    for name in os.listdir(cache):
+        entry = os.path.join(cache, name)
+        try:
+            if name.endswith(".tmp"):
+                continue
+            with open(os.path.join(entry, "meta.json"), "r",
+                      encoding="utf-8") as fh:
+                if json.load(fh).get("exe") != exe:
+                    continue
+        except (OSError, ValueError):
+            continue
+        for root, _dirs, files in os.walk(os.path.join(entry, "artifact")):
+            for f in files:
+                try:
+                    st = os.lstat(os.path.join(root, f))
+                except OSError:
+                    continue
+                links[(st.st_dev, st.st_ino)] += 1
+    return links
+
+
+def clear_build_cache() -> int:
+    """Delete every cached artifact. Returns the number of entries removed."""
+    cache   = state_dir("build-cache")
+    entries = os.listdir(cache)
+    for e in entries:
+        _remove_path(os.path.join(cache, e))
+    return len(entries)
+
+
+def _detach_artifact(cfg: dict, exe: str):
+    """
+    PyInstaller rewrites the exe in place; if it is a hard link into the
+    cache that would corrupt the cached copy, so drop the link first.
+    """
+    target = _artifact_root(cfg, exe)
+    if os.path.isfile(target) and os.stat(target).st_nlink > 1:
+        os.remove(target)
+    elif os.path.isdir(target):
+        _remove_path(target)
 
 
 # ══════════════════════════════════════════════════════════
-#  ENTRY  POINT
+#  ARTIFACT  STORE
+#  Every one-folder build carries its own copy of the Python
+#  runtime, the shared libraries and the common packages.
+#  With cfg["dedupe"] each output file is hashed and kept once
+#  in <state>/store (or $PYTOEXE_STORE) as a blob named by its
+#  sha256 (plus "x" if executable), and the output file becomes
+#  a hard link to that blob.  Where a hard link is refused (for
+#  example the link limit) a reflink is used on Linux
+#  filesystems that have them (btrfs, XFS).  Blobs are made
+#  read-only, so editing one output in place cannot change the
+#  others.  A blob whose only link is the store's own belongs to
+#  no output any more; gc_store() deletes those, after a dedupe
+#  at most once every STORE_GC_HOURS and on `--store-gc`.
+#  Nothing is shared when the store and the output are on
+#  different filesystems — the log counts such files.
 # ══════════════════════════════════════════════════════════
-def main():
-    app = App()
-    app.mainloop()
+STORE_GC_HOURS = 24
+_FICLONE       = 0x40049409    # linux/fs.h: clone a whole file
 
 
-if __name__ == "__main__":
-    main()
+def store_dir() -> str:
+    """The blob store folder (created on demand)."""
+    path = os.environ.get("PYTOEXE_STORE")
+    if not path:
+        return state_dir("store")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _reflink(src: str, dst: str):
+    """Copy-on-write clone of src at dst; OSError where unsupported."""
+    if not sys.platform.startswith("linux"):
+        raise OSError("reflinks are not supported here")
+    import fcntl
+    try:
+        with open(src, "rb") as fin, open(dst, "wb") as fout:
+            fcntl.ioctl(fout.fileno(), _FICLONE, fin.fileno())
+        shutil.copymode(src, dst)
+    except OSError:
+        _remove_path(dst)
+        raise
+
+
+def _share_blob(blob: str, path: str):
+    """Atomically replace path by a hard link (else reflink) to blob."""
+    tmp = path + ".pytoexe-tmp"
+    _remove_path(tmp)
+    try:
+        os.link(blob, tmp)
+    except OSError:
+        _reflink(blob, tmp)
+    os.replace(tmp, path)
+
+
+def dedupe_artifact(folder: str, own_links=None) -> dict:
+    """
+    Move every file below folder into the store and link it back.
+    own_links ((st_dev, st_ino) -> count, see _cached_links) are links
+    that do not make a blob shared, e.g. this tool's cached builds.
+    Returns {"files", "bytes", "own", "shared", "saved", "unshared"}:
+    files whose blob no other output links to (added, or left behind
+    by an output since deleted), files sharing a blob with another
+    output, the bytes that saves, and files that could not be linked.
+    """
+    store = store_dir()
+    stats = dict.fromkeys(("files", "bytes", "own", "shared", "saved",
+                           "unshared"), 0)
+    for root, _dirs, files in os.walk(folder):
+        for name in files:
+            path = os.path.join(root, name)
+            st   = os.lstat(path)
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            stats["files"] += 1
+            stats["bytes"] += st.st_size
+            digest = file_digest(path)
+            blob   = os.path.join(store, digest[:2], digest[2:] +
+                                  ("x" if st.st_mode & 0o111 else ""))
+            try:
+                os.makedirs(os.path.dirname(blob), exist_ok=True)
+                os.link(path, blob)
+                if sys.platform != "win32":
+                    os.chmod(blob, stat.S_IMODE(st.st_mode) & ~0o222)
+                stats["own"] += 1
+                continue
+            except FileExistsError:
+                pass
+            except OSError:
+                stats["unshared"] += 1
+                continue
+            try:
+                bst = os.stat(blob)
+                if (bst.st_dev, bst.st_ino) == (st.st_dev, st.st_ino):
+                    continue
+                if bst.st_size != st.st_size:
+                    raise OSError("blob size mismatch")
+                # Only the store's own link (and this tool's cached
+                # builds): e.g. its previous output, removed before the
+                # rebuild — nothing saved
+                shared = bst.st_nlink - 1 > (own_links or {}).get(
+                    (bst.st_dev, bst.st_ino), 0)
+                _share_blob(blob, path)
+                if shared:
+                    stats["shared"] += 1
+                    stats["saved"]  += st.st_size
+                else:
+                    stats["own"] += 1
+            except OSError:
+                stats["unshared"] += 1
+    return stats
+
+
+def gc_store() -> dict:
+    """Delete blobs no output links to.  {"removed", "freed", "kept"}"""
+    store = store_dir()
+    stats = dict.fromkeys(("removed", "freed", "kept"), 0)
+    for sub in os.listdir(store):
+        folder = os.path.join(store, sub)
+        if not os.path.isdir(folder):
+            continue
+        for name in os.listdir(folder):
+            blob = os.path.join(folder, name)
+            try:
+                st = os.stat(blob)
+                if st.st_nlink > 1:
+                    stats["kept"] += 1
+                    continue
+                if sys.platform == "win32":
+                    os.chmod(blob, stat.S_IWRITE)
+                os.remove(blob)
+            except OSError:
+                continue
+            stats["removed"] += 1
+            stats["freed"]   += st.st_size
+        try:
+            os.rmdir(folder)
+        except OSError:
+            pass
+    with open(os.path.join(store, "gc.stamp"), "w") as fh:
+        fh.write(time.strftime("%Y-%m-%d %H:%M:%S\n"))
+    return stats
+
+
+def maybe_gc_store():
+    """gc_store() if the last one is STORE_GC_HOURS old, else None."""
+    try:
+        age = time.time() - os.path.getmtime(
+            os.path.join(store_dir(), "gc.stamp"))
+    except OSError:
+        age = float("inf")
+    return gc_store() if age > STORE_GC_HOURS * 3600 else None
+
+
+# ══════════════════════════════════════════════════════════
+#  LOG  TRANSPORT
+#  Build threads produce output far faster than a UI can
+#  render it line by line.  LogBuffer decouples the two: the
+#  worker appends, the UI drains whole coalesced chunks on
+#  its own fixed frame clock.
+# ══════════════════════════════════════════════════════════
+class LogBuffer:
+    """Thread-safe FIFO of (text, tag) chunks, drained in merged runs."""
+
+    def __init__(self):
+        self._lock  = threading.Lock()
+        self._items = []
+
+    def put(self, text: str, tag: str = ""):
+        with self._lock:
+            self._items.append((text, tag))
+
+    def clear(self):
+        with self._lock:
+            self._items = []
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def drain(self, max_chars: int = 0) -> list:
+        """
+        Remove and return pending output as [(text, tag), ...] with
+        consecutive chunks of the same tag joined into one.
+        max_chars (0 = unlimited) caps one drain so a huge backlog is
+        rendered over several frames instead of stalling one.
+        """
+        with self._lock:
+            if not max_chars:
+                items, self._items = self._items, []
+            else:
+                size = 0
+                for n, (text, _tag) in enumerate(self._items):
+                    size += len(text)
+                    if size >= max_chars:
+                        n += 1
+                        break
+                else:
+                    n = len(self._items)
+                items, self._items = self._items[:n], self._items[n:]
+
+        runs = []
+        for text, tag in items:
+            if runs and runs[-1][1] == tag:
+                runs[-1][0].append(text)
+            else:
+                runs.append(([text], tag))
+        return [("".join(parts), tag) for parts, tag in runs]
+
+
+# ══════════════════════════════════════════════════════════
+#  BUILD  LOG  FILES
+#  The window only keeps the newest lines; the complete log
+#  of every build is streamed to <state>/logs/.  An index of
+#  byte offsets every LOG_PAGE_LINES lines lets the UI page
+#  older sections back in without re-reading the file.
+# ══════════════════════════════════════════════════════════
+LOG_PAGE_LINES      = 500
+LOG_KEEP_PER_SCRIPT = int(os.environ.get("PYTOEXE_LOG_KEEP", "10"))
+LOG_COMPRESS        = os.environ.get("PYTOEXE_LOG_GZIP", "") == "1"
+
+
+class BuildLogFile:
+    """Append-only log of one build, optionally gzip-compressed."""
+
+    def __init__(self, name: str, compress: bool = LOG_COMPRESS):
+        folder = state_dir("logs")
+        ext    = ".log.gz" if compress else ".log"
+        stamp  = time.strftime("%Y%m%d-%H%M%S")
+        self.path  = os.path.join(folder, f"{name}-{stamp}-{os.getpid()}{ext}")
+        n = 1
+        while os.path.exists(self.path):      # same name, same second
+            n += 1
+            self.path = os.path.join(
+                folder, f"{name}-{stamp}-{os.getpid()}-{n}{ext}")
+        self.lines = 0
+        self.index = [0]          # uncompressed offset of line k*LOG_PAGE_LINES
+        self._size = 0
+        self._lock = threading.Lock()
+        self._gz   = compress
+        self._fh   = gzip.open(self.path, "wb") if compress \
+                     else open(self.path, "wb")
+        _rotate_logs(folder, name, ext)
+
+    def write(self, text: str):
+        data = text.encode("utf-8", "replace")
+        with self._lock:
+            if self._fh is None:
+                return
+            self._fh.write(data)
+            pos = data.find(b"\n")
+            while pos != -1:
+                self.lines += 1
+                if self.lines % LOG_PAGE_LINES == 0:
+                    self.index.append(self._size + pos + 1)
+                pos = data.find(b"\n", pos + 1)
+            self._size += len(data)
+
+    def read_lines(self, start: int, stop: int) -> str:
+        """Return lines [start, stop) of the log (0-based, end-exclusive)."""
+        start = max(0, start)
+        stop  = min(stop, self.lines)
+        if start >= stop:
+            return ""
+        with self._lock:
+            if self._fh is not None and self._gz:
+                self._fh.flush(zlib.Z_SYNC_FLUSH)
+            elif self._fh is not None:
+                self._fh.flush()
+            page = start // LOG_PAGE_LINES
+            opener = gzip.open if self._gz else open
+            with opener(self.path, "rb") as fh:
+                fh.seek(self.index[page])
+                out = []
+                for n in range(page * LOG_PAGE_LINES, stop):
+                    line = fh.readline()
+                    if n >= start:
+                        out.append(line)
+        return b"".join(out).decode("utf-8", "replace")
+
+    def close(self):
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+def _rotate_logs(folder: str, name: str, ext: str,
+                 keep: int = LOG_KEEP_PER_SCRIPT):
+    """Keep only the newest `keep` files <name>-<stamp>...<ext> in folder."""
+    prefix = name + "-"
+    logs   = sorted((f for f in os.listdir(folder)
+                     if f.startswith(prefix) and f.endswith(ext)),
+                    reverse=True)
+    for old in logs[keep:]:
+        try:
+            os.remove(os.path.join(folder, old))
+        except OSError:
+            pass
+
+
+# ══════════════════════════════════════════════════════════
+#  BUILD  TIMELINE
+#  Splits a build into phases — our own steps plus the
+#  PyInstaller stages recognised in its streamed output — and
+#  saves them as a Chrome trace-event file per build
+#  (<state>/traces/, open in chrome://tracing or Perfetto).
+#
+#  Tracks:  pytoexe  our steps (command, makedirs, cache, exe check)
+#           stage    Analysis / PYZ / PKG / EXE / COLLECT
+#           detail   module graph / hooks / binaries inside Analysis
+# ══════════════════════════════════════════════════════════
+TRACE_KEEP_PER_SCRIPT = LOG_KEEP_PER_SCRIPT
+
+_TRACKS = {"pytoexe": 1, "stage": 2, "detail": 3}
+
+# (track, phase, pattern) — first match wins, checked for every line
+_PHASE_RULES = [
+    ("stage",  "Analysis",     r"checking Analysis|Building Analysis|Running Analysis"),
+    ("stage",  "PYZ",          r"checking PYZ|Building PYZ"),
+    ("stage",  "PKG",          r"checking PKG|Building PKG"),
+    ("stage",  "EXE",          r"checking EXE|Building EXE|Copying bootloader"),
+    ("stage",  "COLLECT",      r"checking COLLECT|Building COLLECT"),
+    ("stage",  "BUNDLE",       r"checking BUNDLE|Building BUNDLE"),
+    ("detail", "module graph", r"Initializing module dependency graph|"
+                               r"Analyzing modules for base_library|"
+                               r"Caching module dependency graph|Analyzing /|"
+                               r"Analyzing [A-Za-z]:\\"),
+    ("detail", "hooks",        r"module hook|Processing module hooks|"
+                               r"run-time hook"),
+    ("detail", "binaries",     r"Looking for ctypes DLLs|"
+                               r"Looking for dynamic libraries|"
+                               r"binary vs\. data reclassification"),
+]
+_PHASE_RULES = [(t, n, re.compile(p)) for t, n, p in _PHASE_RULES]
+
+
+class BuildTimeline:
+    """Spans on three tracks, exportable as Chrome trace events."""
+
+    def __init__(self):
+        self.t0     = time.perf_counter()
+        self.events = []          # (track, name, start_s, end_s)
+        self._open  = {}          # track -> (name, start_s)
+
+    def _now(self) -> float:
+        return time.perf_counter() - self.t0
+
+    def begin(self, track: str, name: str):
+        self.end(track)
+        if track == "stage":
+            self.end("detail")
+        self._open[track] = (name, self._now())
+
+    def end(self, track: str):
+        if track in self._open:
+            name, start = self._open.pop(track)
+            self.events.append((track, name, start, self._now()))
+
+    @contextmanager
+    def step(self, name: str):
+        """One of our own steps on the pytoexe track."""
+        start = self._now()
+        try:
+            yield
+        finally:
+            self.events.append(("pytoexe", name, start, self._now()))
+
+    def feed(self, line: str):
+        """Advance the PyInstaller phases from one line of its output."""
+        for track, name, rx in _PHASE_RULES:
+            if rx.search(line):
+                current = self._open.get(track)
+                if not current or current[0] != name:
+                    self.begin(track, name)
+                return
+
+    def close(self):
+        for track in ("detail", "stage", "pytoexe"):
+            self.end(track)
+
+    def stage_seconds(self) -> list:
+        """[(stage, seconds)] in build order, repeated stages summed."""
+        totals = {}
+        for track, name, start, end in self.events:
+            if track == "stage":
+                totals[name] = totals.get(name, 0.0) + (end - start)
+        return list(totals.items())
+
+    def to_chrome(self, **meta) -> dict:
+        events = [{"name": "thread_name", "ph": "M", "pid": 1, "tid": tid,
+                   "args": {"name": track}}
+                  for track, tid in _TRACKS.items()]
+        for track, name, start, end in sorted(self.events,
+                                              key=lambda e: e[2]):
+            events.append({
+                "name": name, "cat": track, "ph": "X", "pid": 1,
+                "tid":  _TRACKS[track],
+                "ts":   round(start * 1e6), "dur": round((end - start) * 1e6),
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": meta}
+
+    def save(self, name: str, **meta) -> str:
+        folder = state_dir("traces")
+        stamp  = time.strftime("%Y%m%d-%H%M%S")
+        path   = os.path.join(folder,
+                              f"{name}-{stamp}-{os.getpid()}.trace.json")
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.to_chrome(**meta), fh)
+        _rotate_logs(folder, name, ".trace.json", TRACE_KEEP_PER_SCRIPT)
+        return path
+
+
+# ══════════════════════════════════════════════════════════
+#  BUNDLE  SIZE  REPORT
+#  What the produced executable is made of.  A one-file exe
+#  is read through the table of contents of the CArchive that
+#  PyInstaller appends to the bootloader (and of the PYZ of
+#  compiled modules inside it); a one-folder build is walked
+#  on disk, expanding the exe's own archive the same way.
+#  Bytes are attributed to top-level packages, stand-alone
+#  native libraries and data files, and saved as
+#  <dist>/<name>.size.json next to the artifact.
+# ══════════════════════════════════════════════════════════
+SIZE_REPORT_TOP = 25
+
+_CARCHIVE_MAGIC = b"MEI\014\013\012\013\016"
+_CARCHIVE_COOKIE = struct.Struct("!8sIIII64s")
+_CARCHIVE_ENTRY  = struct.Struct("!IIIIBc")
+_NATIVE_SUFFIXES = (".so", ".pyd", ".dll", ".dylib")
+_PYI_INTERNAL    = ("pyimod", "pyiboot", "pyi_rth_", "pyi_splash")
+_STDLIB = set(getattr(sys, "stdlib_module_names", ())) | {"lib-dynload",
+                                                          "base_library"}
+
+
+def _read_carchive(path: str) -> tuple:
+    """([(name, stored bytes, typecode, absolute offset)], archive bytes)."""
+    with open(path, "rb") as fh:
+        fh.seek(0, os.SEEK_END)
+        end  = fh.tell()
+        tail = min(end, 1 << 20)     # cookie sits at the end (+ signature)
+        fh.seek(end - tail)
+        at = fh.read(tail).rfind(_CARCHIVE_MAGIC)
+        if at < 0:
+            raise ValueError("no PyInstaller archive found")
+        cookie_at = end - tail + at
+        fh.seek(cookie_at)
+        _magic, length, toc_off, toc_len, _pyver, _lib = \
+            _CARCHIVE_COOKIE.unpack(fh.read(_CARCHIVE_COOKIE.size))
+        start = cookie_at + _CARCHIVE_COOKIE.size - length
+        fh.seek(start + toc_off)
+        toc = fh.read(toc_len)
+    entries, pos = [], 0
+    while pos + _CARCHIVE_ENTRY.size <= len(toc):
+        size, off, stored, _full, _flag, code = \
+            _CARCHIVE_ENTRY.unpack_from(toc, pos)
+        name = toc[pos + _CARCHIVE_ENTRY.size:pos + size].rstrip(b"\0")
+        entries.append((name.decode("utf-8", "replace"), stored,
+                        code.decode("ascii", "replace"), start + off))
+        pos += size or len(toc)
+    return entries, length
+
+
+def _read_pyz(path: str, offset: int) -> list:
+    """[(module, stored bytes)] from the PYZ archive at offset in path."""
+    with open(path, "rb") as fh:
+        fh.seek(offset)
+        if fh.read(4) != b"PYZ\0":
+            raise ValueError("not a PYZ archive")
+        fh.read(4)                                   # bytecode magic
+        toc_off = struct.unpack("!i", fh.read(4))[0]
+        fh.seek(offset + toc_off)
+        toc = dict(marshal.load(fh))
+    return [(name, entry[2]) for name, entry in toc.items()]
+
+
+def _size_group(name: str, category: str) -> str:
+    """Top-level package, library or file a bundle entry belongs to."""
+    parts = name.replace("\\", "/").split("/")
+    if category == "python":
+        parts = name.split(".") if len(parts) == 1 else parts
+    top = parts[0]
+    if top.startswith(_PYI_INTERNAL):
+        return "pyinstaller"
+    for suffix in (".libs", ".dylibs", ".dist-info", ".egg-info"):
+        if top.endswith(suffix):
+            top = top[:-len(suffix)].split("-")[0]
+    module = top.split(".")[0]
+    if module in _STDLIB or module.startswith("_sysconfigdata") or \
+            re.match(r"python\d+(\.\d+)?$", top):
+        return "stdlib"
+    if len(parts) == 1 and category == "native" and \
+            module.lstrip("_") in _STDLIB:
+        return "stdlib"                  # _ssl.pyd & co. on Windows
+    if len(parts) == 1 and category != "python":
+        return top                       # stand-alone library / data file
+    return module
+
+
+def _entry_category(name: str, code: str = "") -> str:
+    if code in ("m", "M", "s"):
+        return "python"
+    lower = name.lower()
+    if code == "b" or lower.endswith(_NATIVE_SUFFIXES) or ".so." in lower:
+        return "native"
+    if lower.endswith((".pyc", ".py", ".pyz")) or \
+            os.path.basename(lower) == "base_library.zip":
+        return "python"
+    return "data"
+
+
+def _archive_items(path: str) -> list:
+    """[(name, bytes, category)] for an exe, incl. its bootloader/overhead."""
+    entries, length = _read_carchive(path)
+    items = []
+    for name, stored, code, offset in entries:
+        if code in ("o", "d", "n"):
+            continue
+        if code == "z":
+            try:
+                modules = _read_pyz(path, offset)
+            except (OSError, ValueError, EOFError, TypeError):
+                modules = []       # written by a newer Python's marshal
+            inner = sum(size for _m, size in modules)
+            items += [(m, size, "python") for m, size in modules]
+            items.append((name, stored - inner, "python" if not modules
+                          else "other"))
+            continue
+        items.append((name, stored, _entry_category(name, code)))
+    listed = sum(size for _n, size, _c in items)
+    items.append(("bootloader", os.path.getsize(path) - listed, "other"))
+    return items
+
+
+def size_report_path(cfg: dict, abs_dist: str) -> str:
+    return os.path.join(abs_dist, Path(cfg["script"]).stem + ".size.json")
+
+
+def bundle_report(cfg: dict, exe: str) -> dict:
+    """Size breakdown of the artifact built for cfg (exe = artifact_path)."""
+    items = []
+    if cfg["onefile"]:
+        items = _archive_items(exe)
+    else:
+        root = os.path.dirname(exe)
+        for folder, _dirs, files in os.walk(root):
+            for f in files:
+                full = os.path.join(folder, f)
+                rel  = os.path.relpath(full, root).replace(os.sep, "/")
+                if full == exe:
+                    items += _archive_items(full)
+                    continue
+                if rel.startswith("_internal/"):        # PyInstaller 6
+                    rel = rel[len("_internal/"):]
+                items.append((rel, os.path.getsize(full),
+                              _entry_category(rel)))
+
+    cats   = {"python": 0, "native": 0, "data": 0, "other": 0}
+    groups = {}
+    for name, size, cat in items:
+        cats[cat] += size
+        g = groups.setdefault(_size_group(name, cat) if cat != "other"
+                              else "pyinstaller",
+                              dict(dict.fromkeys(cats, 0), bytes=0, files=0))
+        g[cat]     += size
+        g["bytes"] += size
+        g["files"] += 1
+    total = sum(cats.values())
+    return {
+        "artifact":    exe,
+        "mode":        "onefile" if cfg["onefile"] else "onedir",
+        "created":     time.strftime("%Y-%m-%d %H:%M:%S"),
+        "total_bytes": total,
+        "categories":  cats,
+        "groups":      [dict(groups[n], name=n,
+                             share=round(groups[n]["bytes"] / total, 4)
+                             if total else 0.0)
+                        for n in sorted(groups, key=lambda n: -groups[n]["bytes"])],
+        "largest":     [{"name": n, "bytes": s, "category": c}
+                        for n, s, c in sorted(items, key=lambda i: -i[1])
+                        [:SIZE_REPORT_TOP]],
+    }
+
+
+def format_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024.0
+    return f"{n:.1f} GB"
+
+
+# ══════════════════════════════════════════════════════════
+#  STARTUP  INSTRUMENTATION
+#  PhaseTimer records named spans relative to its creation
+#  (the start of main()).  With PYTOEXE_STARTUP_TRACE (or
+#  --startup-trace) set, the GUI writes one JSON object per
+#  launch: "-" prints to stderr, anything else is a file that
+#  gets one line appended per run (see benchmarks/).
+# ══════════════════════════════════════════════════════════
+class PhaseTimer:
+    """Collects (name, start, duration) spans and instant marks."""
+
+    def __init__(self):
+        self.t0     = time.perf_counter()
+        self.phases = []
+        self.marks  = {}
+        self._lock  = threading.Lock()
+
+    def _ms(self, t: float) -> float:
+        return round((t - self.t0) * 1000.0, 3)
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.phases.append({
+                    "name":     name,
+                    "start_ms": self._ms(start),
+                    "ms":       round((end - start) * 1000.0, 3),
+                    "thread":   threading.current_thread().name,
+                })
+
+    def mark(self, name: str):
+        with self._lock:
+            self.marks.setdefault(name, self._ms(time.perf_counter()))
+
+    def report(self, **extra) -> dict:
+        with self._lock:
+            data = {"pid": os.getpid(), "python": sys.version.split()[0],
+                    "platform": sys.platform,
+                    "phases": list(self.phases), "marks": dict(self.marks)}
+        data.update(extra)
+        return data
+
+    def emit(self, target: str, **extra):
+        """Write report() as one JSON line to target ("-" = stderr)."""
+        line = json.dumps(self.report(**extra))
+        if target in ("-", "1"):
+            sys.stderr.write(line + "\n")
+            sys.stderr.flush()
+        else:
+            with open(target, "a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+
+
+# ══════════════════════════════════════════════════════════
+#  BUILD  PROCESS  CONTROL
+#  PyInstaller runs in its own process group / session with
+#  everything it starts (isolated hook subprocesses, binary
+#  dependency scans), so a cancel or a timeout stops the whole
+#  tree, not just the top process.  Niceness, CPU affinity and
+#  the memory cap are applied to the top process right after
+#  it starts — before it spawns anything — and are inherited
+#  by its children.  (preexec_fn would apply them earlier but
+#  is unsafe in the threaded GUI.)  Builds still running when
+#  PyToExe exits are stopped too.
+# ══════════════════════════════════════════════════════════
+TERM_GRACE_SECONDS = 3.0
+_LIVE_BUILDS       = set()     # Popen objects of running PyInstallers
+_live_lock         = threading.Lock()
+
+
+def parse_cpus(spec) -> list:
+    """'0-3,6' (or an iterable of ints) -> [0, 1, 2, 3, 6]."""
+    if not spec:
+        return []
+    if not isinstance(spec, str):
+        return sorted({int(c) for c in spec})
+    cpus = set()
+    for part in spec.replace(" ", "").split(","):
+        lo, _, hi = part.partition("-")
+        cpus.update(range(int(lo), int(hi or lo) + 1))
+    return sorted(cpus)
+
+
+def _spawn_options(cfg: dict) -> dict:
+    """Popen keyword arguments that put the build in its own tree."""
+    if sys.platform != "win32":
+        return {"start_new_session": True}
+    flags = subprocess.CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP
+    nice  = int(cfg.get("nice") or 0)
+    if nice >= 15:
+        flags |= subprocess.IDLE_PRIORITY_CLASS
+    elif nice > 0:
+        flags |= subprocess.BELOW_NORMAL_PRIORITY_CLASS
+    return {"creationflags": flags}
+
+
+def apply_limits(proc, cfg: dict) -> list:
+    """
+    Apply cfg's nice / cpus / memory_mb to a just-started process.
+    Returns log lines describing what was applied or refused.
+    """
+    notes = []
+    nice  = int(cfg.get("nice") or 0)
+    if nice and hasattr(os, "setpriority"):
+        try:
+            os.setpriority(os.PRIO_PROCESS, proc.pid, nice)
+            notes.append((f"nice {nice:+d}", "dim"))
+        except OSError as exc:
+            notes.append((f"nice {nice:+d} refused ({exc.strerror})", "warn"))
+    elif nice and sys.platform == "win32":
+        notes.append(("below-normal priority" if nice < 15
+                      else "idle priority", "dim"))
+    cpus = parse_cpus(cfg.get("cpus"))
+    if cpus:
+        try:
+            os.sched_setaffinity(proc.pid, cpus)
+            notes.append((f"CPUs {','.join(map(str, cpus))}", "dim"))
+        except AttributeError:
+            notes.append(("CPU affinity is Linux-only — ignored", "warn"))
+        except (OSError, ValueError) as exc:
+            notes.append((f"CPU affinity refused ({exc})", "warn"))
+    mem = int(cfg.get("memory_mb") or 0)
+    if mem:
+        try:
+            import resource
+            limit = mem << 20
+            resource.prlimit(proc.pid, resource.RLIMIT_AS, (limit, limit))
+            notes.append((f"memory cap {mem} MiB", "dim"))
+        except (ImportError, AttributeError):
+            notes.append(("memory cap is Linux-only — ignored", "warn"))
+        except (OSError, ValueError) as exc:
+            notes.append((f"memory cap refused ({exc})", "warn"))
+    return notes
+
+
+def kill_process_tree(proc, grace: float = TERM_GRACE_SECONDS):
+    """Stop proc and every process it started; waits for proc."""
+    if sys.platform == "win32":
+        subprocess.run(["taskkill", "/T", "/F", "/PID", str(proc.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       creationflags=subprocess.CREATE_NO_WINDOW)
+        try:
+            proc.kill()
+        except OSError:
+            pass
+        proc.wait()
+        return
+    _signal_tree(proc, signal.SIGTERM)
+    try:
+        proc.wait(timeout=grace)
+    except subprocess.TimeoutExpired:
+        pass
+    # Also reaches grandchildren that outlived the top process
+    _signal_tree(proc, signal.SIGKILL)
+    proc.wait()
+
+
+def _signal_tree(proc, sig: int):
+    """Signal proc's process group, or proc alone if it has none (yet)."""
+    try:
+        os.killpg(proc.pid, sig)
+    except OSError:
+        if proc.poll() is None:         # never a reaped, reusable pid
+            try:
+                os.kill(proc.pid, sig)
+            except OSError:
+                pass
+
+
+def _supervise(proc, cancel, timeout: float, stopped: dict):
+    """Watcher thread: kill proc's tree on cancel or after timeout seconds."""
+    deadline = time.time() + timeout if timeout else None
+    while proc.poll() is None:
+        if cancel.wait(0.1):
+            stopped["why"] = "cancelled"
+        elif deadline and time.time() > deadline:
+            stopped["why"] = "timed out"
+        else:
+            continue
+        kill_process_tree(proc)
+        return
+
+
+@atexit.register
+def _stop_live_builds():
+    with _live_lock:
+        procs = list(_LIVE_BUILDS)
+    for proc in procs:
+        if proc.poll() is None:
+            kill_process_tree(proc, grace=1.0)
+
+
+def _clean_work_dir(work: str, since: float) -> int:
+    """
+    Remove what an interrupted build wrote to its work folder.  Only
+    files changed since the build was launched go — possibly
+    half-written — so earlier, complete incremental state survives.
+    """
+    removed = 0
+    for root, dirs, files in os.walk(work):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                if os.path.getmtime(path) >= since - 1:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+# ══════════════════════════════════════════════════════════
+#  STARTUP  BENCHMARK  +  BUILD  HISTORY
+#  Optional post-build step (cfg["bench_runs"] > 0) that
+#  launches the artifact and times it.  A PyInstaller runtime
+#  hook — it runs once the bootloader has unpacked and started
+#  Python, right before the entry script — writes the wall
+#  clock to $PYTOEXE_T_MAIN: time-to-main.  Without
+#  cfg["bench_args"] the hook also exits there, so windowed
+#  programs can be measured; with them the program runs to
+#  completion and total runtime means something.
+#  "Cold" runs first drop the artifact's files from the OS
+#  page cache (posix_fadvise); where that is not available
+#  only the first launch after the build counts as cold.
+#  Every successful build is appended to
+#  <state>/history/<name>.jsonl; startup numbers are compared
+#  with the previous build of the same name that has them.
+# ══════════════════════════════════════════════════════════
+BENCH_RUN_TIMEOUT = float(os.environ.get("PYTOEXE_BENCH_TIMEOUT", "60"))
+BENCH_REGRESSION  = 0.10      # warn when a p50 got this much slower
+HISTORY_KEEP      = 200       # records kept per name
+
+_STARTUP_HOOK = """\
+# Generated by PyToExe for its startup benchmark.
+# Does nothing unless PYTOEXE_T_MAIN is set.
+import os as _os
+import time as _time
+
+if _os.environ.get("PYTOEXE_T_MAIN"):
+    with open(_os.environ["PYTOEXE_T_MAIN"], "w") as _fh:
+        _fh.write(repr(_time.time()))
+    if _os.environ.get("PYTOEXE_EXIT_AT_MAIN"):
+        _os._exit(0)
+"""
+
+
+def _hook_script(name: str, text: str) -> str:
+    """Path of <state>/hooks/name, (re)written if its text differs."""
+    path = os.path.join(state_dir("hooks"), name)
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            current = fh.read() == text
+    except OSError:
+        current = False
+    if not current:
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(text)
+    return path
+
+
+def startup_hook_path() -> str:
+    """The runtime hook passed to PyInstaller when benchmarking."""
+    return _hook_script("pytoexe_startup_hook.py", _STARTUP_HOOK)
+
+
+def _percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    k = int(round(pct / 100.0 * len(ordered))) - 1
+    return ordered[max(0, min(len(ordered) - 1, k))]
+
+
+def _drop_page_cache(root: str) -> bool:
+    """Evict root's files from the page cache.  False if unsupported."""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    paths = [root] if os.path.isfile(root) else \
+        [os.path.join(d, f) for d, _dirs, files in os.walk(root) for f in files]
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.fsync(fd)                 # dirty pages cannot be dropped
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return True
+
+
+def _launch_once(exe: str, args) -> tuple:
+    """Run exe once: (ms to main or None, total ms, exit code)."""
+    fd, marker = tempfile.mkstemp(prefix="pytoexe-main-")
+    os.close(fd)
+    env = dict(os.environ, PYTOEXE_T_MAIN=marker)
+    if args is None:
+        env["PYTOEXE_EXIT_AT_MAIN"] = "1"
+    launched = time.time()
+    t0   = time.perf_counter()
+    proc = subprocess.Popen([exe] + list(args or []), env=env,
+                            cwd=os.path.dirname(exe),
+                            stdin=subprocess.DEVNULL,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL,
+                            **_spawn_options({}))
+    try:
+        proc.wait(timeout=BENCH_RUN_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        kill_process_tree(proc)
+    total = (time.perf_counter() - t0) * 1000.0
+    try:
+        with open(marker, "r") as fh:
+            to_main = (float(fh.read()) - launched) * 1000.0
+    except (OSError, ValueError):
+        to_main = None
+    finally:
+        try:
+            os.remove(marker)
+        except OSError:
+            pass
+    return to_main, total, proc.returncode
+
+
+def startup_bench(cfg: dict, exe: str, runs: int, args=None,
+                  cancel=None) -> dict:
+    """
+    Launch exe `runs` times cold and `runs` times warm (1 cold run
+    where the page cache cannot be dropped).  Returns
+    {"cold"|"warm": {"n", "failed", "to_main_ms", "total_ms"}}
+    with {"p50", "p90", "max"} per measure.
+    """
+    root    = _artifact_root(cfg, exe)
+    evicts  = hasattr(os, "posix_fadvise")
+    plan    = ["cold"] * (runs if evicts else 1) + ["warm"] * runs
+    samples = {"cold": [], "warm": []}
+    for kind in plan:
+        if cancel is not None and cancel.is_set():
+            break
+        if kind == "cold":
+            _drop_page_cache(root)
+        samples[kind].append(_launch_once(exe, args))
+
+    stats = {}
+    for kind, rows in samples.items():
+        if not rows:
+            continue
+        stats[kind] = {"n": len(rows),
+                       "failed": sum(1 for row in rows if row[2] != 0)}
+        for measure, vals in (("to_main_ms", [r[0] for r in rows
+                                              if r[0] is not None]),
+                              ("total_ms",   [r[1] for r in rows])):
+            if vals:
+                stats[kind][measure] = {
+                    "p50": round(_percentile(vals, 50), 1),
+                    "p90": round(_percentile(vals, 90), 1),
+                    "max": round(max(vals), 1)}
+    return stats
+
+
+def history_path(name: str) -> str:
+    return os.path.join(state_dir("history"), f"{name}.jsonl")
+
+
+def load_history(name: str) -> list:
+    """Build records of name, oldest first."""
+    try:
+        with open(history_path(name), "r", encoding="utf-8") as fh:
+            return [json.loads(line) for line in fh if line.strip()]
+    except (OSError, ValueError):
+        return []
+
+
+def _record_build(cfg: dict, python_exe: str, result: dict):
+    name = cfg.get("name") or Path(cfg["script"]).stem
+    path = history_path(name)
+    rec  = {"time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "script": os.path.abspath(cfg["script"]),
+            "python": python_exe, "onefile": bool(cfg["onefile"]),
+            "windowed": bool(cfg["windowed"]), "cached": result["cached"],
+            "seconds": round(result["seconds"], 2), "size": result["size"],
+            "exe": result["exe"], "startup": result.get("startup") or None,
+            "bench_args": cfg.get("bench_args")}
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write(json.dumps(rec) + "\n")
+    records = load_history(name)
+    if len(records) > 2 * HISTORY_KEEP:
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.writelines(json.dumps(r) + "\n" for r in records[-HISTORY_KEEP:])
+
+
+def _run_startup_bench(cfg: dict, emit, result: dict, cancel):
+    runs  = int(cfg["bench_runs"])
+    args  = cfg.get("bench_args")
+    stats = startup_bench(cfg, result["exe"], runs, args, cancel)
+    result["startup"] = stats
+    if not stats:
+        return
+    mode   = "stop at main" if args is None else "full run"
+    counts = " + ".join(f"{s['n']} {kind}" for kind, s in stats.items())
+    emit(f"\nStartup    : {counts} runs, {mode}\n", "head")
+    for kind, s in stats.items():
+        parts = [f"{label} p50 {s[m]['p50']:.0f} ms  p90 {s[m]['p90']:.0f}"
+                 for m, label in (("to_main_ms", "to main"),
+                                  ("total_ms", "total")) if m in s]
+        if s["failed"]:
+            parts.append(f"{s['failed']} failed")
+        emit(f"  {kind:<5}  " + "  ·  ".join(parts) + "\n",
+             "warn" if s["failed"] or "to_main_ms" not in s else "dim")
+
+    name = cfg.get("name") or Path(cfg["script"]).stem
+    prev = next((r for r in reversed(load_history(name))
+                 if r.get("startup") and r["onefile"] == bool(cfg["onefile"])
+                 and r.get("bench_args") == args), None)
+    if prev is None:
+        return
+    deltas, slower = [], False
+    for kind, s in stats.items():
+        old = prev["startup"].get(kind, {}).get("to_main_ms")
+        if old and "to_main_ms" in s and old["p50"]:
+            change = s["to_main_ms"]["p50"] / old["p50"] - 1.0
+            slower |= change > BENCH_REGRESSION
+            deltas.append(f"{kind} to main {old['p50']:.0f} -> "
+                          f"{s['to_main_ms']['p50']:.0f} ms ({change:+.1%})")
+    if deltas:
+        emit(f"  vs {prev['time']}  " + "  ·  ".join(deltas) + "\n",
+             "warn" if slower else "dim")
+
+
+# ══════════════════════════════════════════════════════════
+#  BYTECODE  CACHE
+#  PyInstaller compiles every module it collects from source,
+#  each build again: modulegraph turns the parsed AST into a
+#  code object, and with a target optimisation level other
+#  than its own (profiles "fast" and up) the PYZ stage
+#  compiles the source a second time.  Before a build the
+#  script and its local imports are compiled by the build
+#  interpreter — in parallel processes once there are enough
+#  stale files — into <state>/bytecode, a mirror of their
+#  folders holding hash-checked .pyc files (PEP 552), one per
+#  optimisation level; the cache_tag in the name keeps
+#  interpreter versions apart.  PyInstaller then runs with a
+#  compile() that serves a cached code object whenever the
+#  .pyc's source hash matches the file, so only new or edited
+#  modules are compiled at all.  Parsing for the import scan
+#  still happens — modulegraph needs the AST.  The project's
+#  own __pycache__ folders are never touched.  Needs Python
+#  3.7+ as the build interpreter; cfg["bytecode_cache"] =
+#  False or PYTOEXE_BYTECODE=0 turns it off.
+# ══════════════════════════════════════════════════════════
+BYTECODE_PER_WORKER = 8       # stale .pyc files per compile process
+BYTECODE_TIMEOUT    = 300.0   # seconds for the precompile step
+
+_BYTECODE_PATCH = """
+
+def cached_pyc(prefix, source, level):
+    head, tail = os.path.split(os.path.abspath(source))
+    drive, head = os.path.splitdrive(head)
+    name = "%s.%s%s.pyc" % (os.path.splitext(tail)[0],
+                            sys.implementation.cache_tag,
+                            ".opt-%d" % level if level else "")
+    return os.path.join(prefix, drive.replace(":", "").lstrip("\\\\/"),
+                        head.lstrip("\\\\/"), name)
+
+
+def install_bytecode_cache():
+    # Serve PyInstaller's compile() calls from $PYTOEXE_PYC_PREFIX.
+    import builtins
+    import marshal
+    import importlib
+    import importlib.util
+
+    def cached(source, filename, optimize):
+        prefix = os.environ.get("PYTOEXE_PYC_PREFIX")
+        if not prefix or not isinstance(filename, str) \\
+                or not filename.endswith(".py"):
+            return None
+        level = sys.flags.optimize if optimize < 0 else optimize
+        try:
+            with open(cached_pyc(prefix, filename, level), "rb") as fh:
+                data = fh.read()
+            if not isinstance(source, bytes):
+                with open(filename, "rb") as fh:
+                    source = fh.read()
+        except (OSError, ValueError):
+            return None
+        if data[:4] != importlib.util.MAGIC_NUMBER or \\
+                data[4:8] != b"\\x03\\x00\\x00\\x00" or \\
+                data[8:16] != importlib.util.source_hash(source):
+            return None
+        return marshal.loads(data[16:])
+
+    def compile(source, filename, mode, flags=0, dont_inherit=False,
+                optimize=-1, **kwargs):
+        if mode == "exec" and not flags and not kwargs and \\
+                not isinstance(source, str):
+            code = cached(source, filename, optimize)
+            if code is not None:
+                return code
+        return builtins.compile(source, filename, mode, flags,
+                                dont_inherit, optimize, **kwargs)
+
+    for name in ("PyInstaller.building.utils",
+                 "PyInstaller.lib.modulegraph.modulegraph"):
+        try:
+            importlib.import_module(name).compile = compile
+        except ImportError:
+            pass
+"""
+
+_PRECOMPILE = """\
+# Generated by PyToExe: fills the bytecode cache before a build.
+# argv: cache folder, levels ("0,2"), files per process; stdin: a JSON
+# list of sources.  Prints {"compiled", "fresh", "failed", "workers"}.
+import os
+import sys
+import json
+import py_compile
+import importlib.util
+""" + _BYTECODE_PATCH + """
+
+def compile_one(job):
+    source, pyc, level = job
+    try:
+        py_compile.compile(
+            source, pyc, doraise=True, optimize=level,
+            invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH)
+    except (py_compile.PyCompileError, OSError):
+        return source
+    return None
+
+
+def fresh(pyc, digest):
+    try:
+        with open(pyc, "rb") as fh:
+            head = fh.read(16)
+    except OSError:
+        return False
+    return head == importlib.util.MAGIC_NUMBER + b"\\x03\\x00\\x00\\x00" + digest
+
+
+def main():
+    prefix, per_worker = sys.argv[1], int(sys.argv[3])
+    levels = [int(level) for level in sys.argv[2].split(",")]
+    jobs, cached = [], 0
+    for source in json.load(sys.stdin):
+        try:
+            with open(source, "rb") as fh:
+                digest = importlib.util.source_hash(fh.read())
+        except OSError:
+            continue
+        for level in levels:
+            pyc = cached_pyc(prefix, source, level)
+            if fresh(pyc, digest):
+                cached += 1
+            else:
+                jobs.append((source, pyc, level))
+    workers = max(1, min(os.cpu_count() or 1, len(jobs) // per_worker))
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(workers) as pool:
+            failed = list(pool.map(compile_one, jobs, chunksize=per_worker))
+    else:
+        failed = [compile_one(job) for job in jobs]
+    print(json.dumps({"compiled": failed.count(None), "fresh": cached,
+                      "failed": sorted(set(filter(None, failed))),
+                      "workers": workers}))
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+_PYINSTALLER_LAUNCHER = """\
+# Generated by PyToExe: `python -m PyInstaller` with the bytecode cache.
+import os
+import sys
+
+sys.path[0] = os.getcwd()
+""" + _BYTECODE_PATCH + """
+
+
+import runpy
+
+install_bytecode_cache()
+runpy.run_module("PyInstaller", run_name="__main__", alter_sys=True)
+"""
+
+
+def bytecode_enabled(cfg: dict, python_exe: str) -> bool:
+    if not cfg.get("bytecode_cache", True) or \
+            os.environ.get("PYTOEXE_BYTECODE", "1") == "0":
+        return False
+    try:
+        version = pyinstaller_status(python_exe)["python_version"]
+        return tuple(int(v) for v in version.split(".")[:2]) >= (3, 7)
+    except (OSError, ValueError):
+        return False
+
+
+def bytecode_levels(cfg: dict, python_exe: str) -> list:
+    """Optimisation levels PyInstaller compiles cfg's modules at."""
+    flags, _ = profile_args(cfg, python_exe)
+    runtime  = sum(f.count("O") for f in flags)
+    return sorted({runtime, profile_settings(cfg)["optimize"]})
+
+
+def precompile_modules(cfg: dict, python_exe: str) -> dict:
+    """
+    Bring the script's and its local imports' cached bytecode up to
+    date.  Returns {"files", "levels", "compiled", "fresh", "failed",
+    "workers", "prefix"}; raises OSError if the step itself failed.
+    """
+    script = os.path.abspath(cfg["script"])
+    files  = [script] + local_imports(script)
+    levels = bytecode_levels(cfg, python_exe)
+    prefix = state_dir("bytecode")
+    extra  = {"creationflags": subprocess.CREATE_NO_WINDOW} \
+        if sys.platform == "win32" else {}
+    try:
+        proc = subprocess.run(
+            [python_exe, _hook_script("pytoexe_precompile.py", _PRECOMPILE),
+             prefix, ",".join(map(str, levels)), str(BYTECODE_PER_WORKER)],
+            input=json.dumps(files), stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE, text=True, timeout=BYTECODE_TIMEOUT,
+            **extra)
+    except subprocess.TimeoutExpired:
+        raise OSError(f"timed out after {BYTECODE_TIMEOUT:g}s")
+    if proc.returncode:
+        lines = proc.stderr.strip().splitlines()
+        raise OSError(lines[-1] if lines else f"exit code {proc.returncode}")
+    try:
+        st = json.loads(proc.stdout)
+    except ValueError:
+        raise OSError("unreadable precompile report")
+    st.update(files=len(files), levels=levels, prefix=prefix)
+    return st
+
+
+# ══════════════════════════════════════════════════════════
+#  WARM  WORKERS
+#  `python -m PyInstaller` pays interpreter startup and the
+#  PyInstaller / modulegraph / hook-API imports on every build.
+#  On Linux and the BSDs a warm worker per interpreter does
+#  that once: a small fork server that imports PyInstaller and
+#  then forks one child per build.  The child starts its own
+#  session (so cancel / timeout / limits work exactly as for a
+#  spawned build), writes its output into a FIFO the builder
+#  reads, and exits — builds never share a process, only the
+#  already-imported modules.  A worker is replaced after
+#  WARM_BUILDS builds or once it grows past WARM_RSS_MB, so an
+#  upgraded PyInstaller or a bloated server does not stick.
+#  Builds whose command needs interpreter flags (-O on old
+#  PyInstallers), cfg["warm"] = False, PYTOEXE_WARM=0, macOS
+#  (fork without exec is unsafe there) and Windows spawn a
+#  fresh PyInstaller as before.
+# ══════════════════════════════════════════════════════════
+WARM_SUPPORTED     = hasattr(os, "fork") and hasattr(os, "mkfifo") and \
+                     sys.platform != "darwin"
+WARM_BUILDS        = int(os.environ.get("PYTOEXE_WARM_BUILDS", "25") or 25)
+WARM_RSS_MB        = int(os.environ.get("PYTOEXE_WARM_RSS_MB", "400") or 400)
+WARM_START_TIMEOUT = 30.0     # seconds for a worker / a fork to answer
+WARM_RETRY_SECONDS = 60.0     # after a worker failed to start
+
+_WARM_WORKER = """\
+# Generated by PyToExe: a warm PyInstaller fork server.
+# Reads one JSON request per line on stdin, forks a build per
+# request and reports {"id", "pid"} and {"exit", "pid"} on stdout.
+import os
+import sys
+import json
+import select
+import signal
+import traceback
+
+import PyInstaller
+import PyInstaller.__main__
+import PyInstaller.building.build_main  # noqa: F401  (the expensive part)
+""" + _BYTECODE_PATCH + """
+
+
+install_bytecode_cache()
+
+
+def send(msg):
+    try:
+        sys.stdout.write(json.dumps(msg) + "\\n")
+    except (BrokenPipeError, ValueError):
+        pass
+
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as fh:
+            pages = int(fh.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def build(req, out, ready):
+    code = 1
+    try:
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        os.setsid()
+        os.close(ready)                  # the pid now names a process group
+        null = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(null, 0)
+        os.dup2(out, 1)
+        os.dup2(out, 2)
+        os.close(null)
+        os.close(out)
+        os.chdir(req["cwd"])
+        sys.path[0] = req["cwd"]         # as for `python -m PyInstaller`
+        os.environ.clear()
+        os.environ.update(req["env"])
+        sys.argv = ["pyinstaller"] + req["argv"]
+        try:
+            PyInstaller.__main__.run(req["argv"])
+            code = 0
+        except SystemExit as exc:
+            if isinstance(exc.code, int) or exc.code is None:
+                code = exc.code or 0
+            else:
+                sys.stderr.write(str(exc.code) + "\\n")
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        os._exit(code)
+
+
+def main():
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_w, False)
+    signal.set_wakeup_fd(wake_w)
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+    send({"ready": os.getpid(), "version": PyInstaller.__version__})
+    children, pending, eof = set(), b"", False
+    while not (eof and not children):
+        ready = select.select([wake_r] if eof else [0, wake_r], [], [])[0]
+        if wake_r in ready:
+            os.read(wake_r, 512)
+        while children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if not pid:
+                break
+            children.discard(pid)
+            code = os.WEXITSTATUS(status) if os.WIFEXITED(status) \\
+                else -os.WTERMSIG(status)
+            send({"exit": code, "pid": pid, "rss_kb": rss_kb()})
+        if 0 not in ready:
+            continue
+        data = os.read(0, 65536)
+        eof, pending = not data, pending + data
+        while b"\\n" in pending:
+            line, pending = pending.split(b"\\n", 1)
+            req = json.loads(line.decode("utf-8"))
+            try:
+                out = os.open(req["fifo"], os.O_WRONLY)
+            except OSError as exc:
+                send({"id": req["id"], "error": str(exc)})
+                continue
+            ready_r, ready_w = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                os.close(wake_r)
+                os.close(wake_w)
+                os.close(ready_r)
+                build(req, out, ready_w)
+            os.close(out)
+            os.close(ready_w)
+            # Report the pid only once killpg() can reach the build:
+            # EOF when the child has called setsid() (or died)
+            os.read(ready_r, 1)
+            os.close(ready_r)
+            children.add(pid)
+            send({"id": req["id"], "pid": pid})
+
+
+main()
+"""
+
+
+def warm_worker_path() -> str:
+    """The fork-server script run by every WarmWorker."""
+    return _hook_script("pytoexe_warm_worker.py", _WARM_WORKER)
+
+
+def warm_enabled(cfg: dict) -> bool:
+    return WARM_SUPPORTED and cfg.get("warm", True) and \
+        os.environ.get("PYTOEXE_WARM", "1") != "0"
+
+
+class WarmBuild:
+    """Popen look-alike for one build forked by a WarmWorker."""
+
+    def __init__(self):
+        self.pid        = None
+        self.seq        = 0           # n-th build of its worker
+        self.returncode = None
+        self.stdout     = None
+        self.error      = ""
+        self.started    = threading.Event()
+        self._done      = threading.Event()
+
+    def _exited(self, code: int):
+        self.returncode = code
+        self._done.set()
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if not self._done.wait(timeout):
+            raise subprocess.TimeoutExpired("warm build", timeout)
+        return self.returncode
+
+    def kill(self):
+        _signal_tree(self, signal.SIGKILL)
+
+
+class WarmWorker:
+    """One warm fork server for one interpreter."""
+
+    def __init__(self, python_exe: str):
+        self.python   = python_exe
+        self.builds   = 0
+        self.rss_kb   = 0
+        self.version  = ""
+        self.ready    = threading.Event()
+        self._lock    = threading.Lock()
+        self._ids     = itertools.count(1)
+        self._waiting = {}            # request id -> WarmBuild
+        self._running = {}            # pid -> WarmBuild
+        self.proc = subprocess.Popen(
+            [python_exe, "-u", warm_worker_path()],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, start_new_session=True)
+        threading.Thread(target=self._read, daemon=True).start()
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def worn(self) -> bool:
+        return self.builds >= WARM_BUILDS or self.rss_kb > WARM_RSS_MB * 1024
+
+    def launch(self, argv: list, env: dict) -> WarmBuild:
+        """Fork a build of `PyInstaller argv`; raises OSError if it cannot."""
+        if not self.ready.wait(WARM_START_TIMEOUT) or not self.alive:
+            raise OSError("warm worker did not start")
+        build = WarmBuild()
+        tmp   = tempfile.mkdtemp(prefix="pytoexe-warm-")
+        fifo  = os.path.join(tmp, "out")
+        try:
+            os.mkfifo(fifo, 0o600)
+            # Opened before the request so the worker's open() does not block
+            fd = os.open(fifo, os.O_RDONLY | os.O_NONBLOCK)
+            try:
+                with self._lock:
+                    rid = next(self._ids)
+                    self._waiting[rid] = build
+                    self.builds += 1
+                    build.seq    = self.builds
+                    self.proc.stdin.write((json.dumps(
+                        {"id": rid, "argv": argv, "env": env, "fifo": fifo,
+                         "cwd": os.getcwd()}) + "\n").encode("utf-8"))
+                    self.proc.stdin.flush()
+                if not build.started.wait(WARM_START_TIMEOUT) or not build.pid:
+                    raise OSError(build.error or "warm worker did not answer")
+                os.set_blocking(fd, True)
+            except (OSError, ValueError):
+                os.close(fd)
+                raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        build.stdout = open(fd, "r", buffering=1, errors="replace")
+        return build
+
+    def retire(self):
+        """No new builds; the server exits once its children are done."""
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+
+    def _read(self):
+        for line in self.proc.stdout:
+            try:
+                msg = json.loads(line.decode("utf-8"))
+            except ValueError:
+                continue
+            with self._lock:
+                if "ready" in msg:
+                    self.version = msg["version"]
+                    self.ready.set()
+                elif "id" in msg:
+                    build = self._waiting.pop(msg["id"], None)
+                    if build is not None:
+                        build.pid   = msg.get("pid")
+                        build.error = msg.get("error", "")
+                        if build.pid:
+                            self._running[build.pid] = build
+                        build.started.set()
+                elif "exit" in msg:
+                    self.rss_kb = msg["rss_kb"]
+                    build = self._running.pop(msg["pid"], None)
+                    if build is not None:
+                        build._exited(msg["exit"])
+        self.proc.wait()
+        self.ready.set()
+        with self._lock:
+            for build in self._waiting.values():
+                build.started.set()
+            for build in self._running.values():
+                build._exited(-signal.SIGKILL)
+            self._waiting, self._running = {}, {}
+
+
+class WarmPool:
+    """One WarmWorker per interpreter, replaced when worn out."""
+
+    def __init__(self):
+        self._workers = {}
+        self._failed  = {}            # interpreter -> time its worker died
+        self._lock    = threading.Lock()
+
+    def _worker(self, python_exe: str, fresh: bool = False):
+        key = os.path.realpath(python_exe)
+        with self._lock:
+            worker = self._workers.get(key)
+            if worker is not None and worker.ready.is_set() and \
+                    not worker.alive and not worker.builds:
+                self._failed[key] = time.time()       # e.g. no PyInstaller
+            if time.time() - self._failed.get(key, 0) < WARM_RETRY_SECONDS:
+                return None
+            if fresh or worker is None or not worker.alive or \
+                    worker.worn() or self._stale(worker):
+                if worker is not None:
+                    worker.retire()
+                worker = self._workers[key] = WarmWorker(python_exe)
+            return worker
+
+    @staticmethod
+    def _stale(worker) -> bool:
+        """PyInstaller was upgraded under a running worker."""
+        if not worker.version:
+            return False
+        try:
+            return worker.version != pyinstaller_status(worker.python)["version"]
+        except OSError:
+            return False
+
+    def prewarm(self, python_exe: str):
+        try:
+            self._worker(python_exe)
+        except OSError:
+            pass
+
+    def launch(self, python_exe: str, argv: list, env: dict) -> WarmBuild:
+        worker = self._worker(python_exe)
+        if worker is None:
+            raise OSError("no warm worker for this interpreter")
+        build = worker.launch(argv, env)
+        if worker.worn():
+            self._worker(python_exe, fresh=True)    # replacement warms now
+        return build
+
+    def shutdown(self):
+        with self._lock:
+            workers, self._workers = list(self._workers.values()), {}
+        for worker in workers:
+            worker.retire()
+
+
+_warm_pool = None
+
+
+def warm_pool() -> WarmPool:
+    global _warm_pool
+    if _warm_pool is None:
+        _warm_pool = WarmPool()
+        atexit.register(_warm_pool.shutdown)
+    return _warm_pool
+
+
+def _launch_pyinstaller(cmd: list, cfg: dict, python_exe: str,
+                        bytecode: str = ""):
+    """
+    The running build: forked by a warm worker when possible.  With
+    bytecode (a precompiled cache folder) PyInstaller takes code
+    objects from there — see BYTECODE CACHE.
+    """
+    env = build_env(cfg)
+    if bytecode:
+        env = dict(env or os.environ, PYTOEXE_PYC_PREFIX=bytecode)
+    if warm_enabled(cfg) and cmd[1:3] == ["-m", "PyInstaller"]:
+        try:
+            return warm_pool().launch(python_exe, cmd[3:],
+                                      env or dict(os.environ))
+        except OSError:
+            pass
+    if bytecode:
+        at  = cmd.index("-m")
+        cmd = cmd[:at] + [_hook_script("pytoexe_pyinstaller.py",
+                                       _PYINSTALLER_LAUNCHER)] + cmd[at + 2:]
+    return subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        env=env,
+        # NO cwd override — use absolute paths throughout
+        **_spawn_options(cfg)
+    )
+
+
+# ══════════════════════════════════════════════════════════
+#  HEADLESS  BUILD  RUNNER
+#  Shared by the GUI worker thread and the CLI process pool.
+#  All output goes through emit(text, tag) — the tags are the
+#  same ones the GUI log understands ("head", "dim", "cmd",
+#  "ok", "warn", "err" or "" for plain PyInstaller output).
+# ══════════════════════════════════════════════════════════
+def _emit_nothing(text: str, tag: str = ""):
+    pass
+
+
+def run_build(cfg: dict, python_exe: str, emit=None, cancel=None) -> dict:
+    """
+    Run one PyInstaller build for cfg and wait for it to finish.
+    Never raises — every failure is reported through emit and the
+    returned dict:
+      success  : True only if PyInstaller exited 0 AND the exe exists
+      exit_ok  : PyInstaller exit status was 0
+      abs_dist : resolved output folder ("" if the command failed)
+      exe      : expected executable path
+      cached   : the artifact came from the build cache
+      seconds  : wall-clock duration
+      trace    : Chrome trace file of the build phases ("" if none)
+      size     : bundle size in bytes (0 if not measured)
+      report   : <name>.size.json next to the artifact ("" if none)
+      cancelled: cancel (a threading.Event) was set and the build stopped
+      timed_out: the build ran longer than cfg["timeout"] and was stopped
+      startup  : startup_bench() stats ({} unless cfg["bench_runs"])
+    """
+    emit     = emit or _emit_nothing
+    started  = time.time()
+    result   = {"success": False, "exit_ok": False, "cached": False,
+                "abs_dist": "", "exe": "", "seconds": 0.0, "trace": "",
+                "size": 0, "report": "", "cancelled": False,
+                "timed_out": False, "startup": {}}
+    cancel   = cancel or threading.Event()
+    timeline = BuildTimeline()
+    try:
+        _build_steps(cfg, python_exe, emit, result, timeline, cancel)
+        if result["success"]:
+            with timeline.step("size report"):
+                _save_size_report(cfg, emit, result)
+            if cfg.get("bench_runs") and not cfg.get("_defer_bench"):
+                with timeline.step("startup bench"):
+                    _run_startup_bench(cfg, emit, result, cancel)
+            result["seconds"] = time.time() - started
+            try:
+                _record_build(cfg, python_exe, result)
+            except OSError as exc:
+                emit(f"Build history not saved: {exc}\n", "warn")
+    finally:
+        timeline.close()
+        result["seconds"] = time.time() - started
+        _save_timeline(cfg, emit, result, timeline)
+    return result
+
+
+def _save_size_report(cfg: dict, emit, result: dict, top: int = 8):
+    try:
+        report = bundle_report(cfg, result["exe"])
+        path   = size_report_path(cfg, result["abs_dist"])
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    except (OSError, ValueError, struct.error) as exc:
+        emit(f"\nSize report unavailable: {exc}\n", "warn")
+        return
+    result["size"], result["report"] = report["total_bytes"], path
+    cats = report["categories"]
+    emit(f"\nSize       : {format_bytes(report['total_bytes'])}  ("
+         + "  ·  ".join(f"{c} {format_bytes(cats[c])}" for c in cats)
+         + ")\n", "head")
+    for g in report["groups"][:top]:
+        emit(f"  {g['name']:<28}{format_bytes(g['bytes']):>10}"
+             f"{g['share'] * 100:>6.1f}%\n", "dim")
+    emit(f"Report     : {path}\n", "dim")
+
+
+def _save_timeline(cfg: dict, emit, result: dict, timeline: BuildTimeline):
+    stages = timeline.stage_seconds()
+    if stages:
+        emit("Phases     : " + "  ·  ".join(
+            f"{name} {secs:.1f}s" for name, secs in stages) + "\n", "dim")
+    try:
+        result["trace"] = timeline.save(
+            cfg.get("name") or Path(cfg["script"]).stem, script=cfg["script"],
+            success=result["success"], cached=result["cached"],
+            seconds=round(result["seconds"], 3))
+        emit(f"Timeline   : {result['trace']}\n", "dim")
+    except (OSError, KeyError) as exc:
+        emit(f"Timeline not saved: {exc}\n", "warn")
+
+
+def _emit_import_scan(scan: dict, emit, excludes: bool = False):
+    emit(f"Imports    : {len(scan['local'])} local module(s), "
+         f"{len(scan['modules'])} package(s)"
+         + (f"  ·  hidden: {', '.join(scan['hidden'])}" if scan["hidden"] else "")
+         + (f"  ·  excluded: {', '.join(scan['excludes'])}"
+            if excludes and scan["excludes"] else "") + "\n", "dim")
+    for where in scan["dynamic"]:
+        emit(f"Review     : dynamic import at {where}\n", "warn")
+
+
+def _drop_partial_artifact(cfg: dict, exe: str, since: float):
+    """Remove an exe / folder PyInstaller was writing when it was stopped."""
+    root = _artifact_root(cfg, exe)
+    try:
+        if os.path.lexists(root) and os.path.getmtime(root) >= since - 1:
+            _remove_path(root)
+    except OSError:
+        pass
+
+
+def _build_steps(cfg: dict, python_exe: str, emit, result: dict,
+                 timeline: BuildTimeline, cancel):
+    """The body of run_build(); fills result in place, may return early."""
+    spec = None
+    if cfg.get("spec"):
+        try:
+            with timeline.step("spec"):
+                spec = write_spec(cfg, python_exe)
+        except (OSError, ValueError) as exc:
+            emit(f"\nCannot write the spec file:\n{exc}\n", "err")
+            return
+
+    # Build command — get cmd list AND resolved dist dir
+    try:
+        with timeline.step("build_command"):
+            cmd, abs_dist = build_command(cfg, python_exe)
+    except Exception as exc:
+        emit(f"\nFailed to build command: {exc}\n", "err")
+        return
+    result["abs_dist"] = abs_dist
+    result["exe"]      = artifact_path(cfg, abs_dist)
+
+    ts = time.strftime("%H:%M:%S")
+    emit(f"[ {ts} ]  Build started\n", "head")
+    emit(f"Python     : {python_exe}\n", "dim")
+    emit(f"Script     : {cfg['script']}\n", "dim")
+    emit(f"Output dir : {abs_dist}\n", "dim")
+    emit(f"Work dir   : {work_dir_for(cfg, python_exe)}\n", "dim")
+    if cfg.get("timeout"):
+        emit(f"Timeout    : {cfg['timeout']:g}s\n", "dim")
+    if (cfg.get("profile") or "default") != "default":
+        name = cfg["profile"] if isinstance(cfg["profile"], str) else "custom"
+        emit(f"Profile    : {name}  ({describe_profile(cfg)})\n", "dim")
+        if profile_settings(cfg)["upx"] and not shutil.which("upx"):
+            emit("             UPX is not on PATH — the build will not be "
+                 "compressed\n", "warn")
+    if cfg.get("import_scan", True):
+        _emit_import_scan(scan_imports(cfg["script"]), emit,
+                          cfg.get("auto_exclude"))
+    if spec:
+        _emit_spec(spec, emit)
+    emit("\nCommand:\n  " + " ".join(cmd) + "\n\n", "cmd")
+
+    # Ensure dist folder exists
+    try:
+        with timeline.step("makedirs"):
+            os.makedirs(abs_dist, exist_ok=True)
+    except OSError as exc:
+        emit(f"\nCannot create output folder:\n{exc}\n", "err")
+        return
+
+    # Build cache — identical inputs reuse the previous artifact
+    key = ""
+    if cfg.get("use_cache", True):
+        try:
+            with timeline.step("cache lookup"):
+                key = build_cache_key(cfg, python_exe)
+                hit = cache_restore(key, cfg, result["exe"])
+            if hit:
+                emit(f"Cache      : HIT  {key[:16]}  (PyInstaller skipped)\n",
+                     "ok")
+                result["exit_ok"] = result["success"] = True
+                result["cached"]  = True
+                return
+            emit(f"Cache      : MISS {key[:16]}\n\n", "dim")
+        except Exception as exc:
+            key = ""
+            emit(f"Cache      : unavailable ({exc})\n\n", "warn")
+    try:
+        _detach_artifact(cfg, result["exe"])
+    except OSError:
+        pass
+
+    if cfg["extra_files"] and not spec:
+        try:
+            with timeline.step("stage assets"):
+                st = stage_assets(cfg, work_dir_for(cfg, python_exe))
+        except OSError as exc:
+            emit(f"\nCannot stage extra files:\n{exc}\n", "err")
+            return
+        emit(f"Assets     : {st['files']} file(s), {format_bytes(st['bytes'])}"
+             f"  ·  {st['staged']} staged, {st['unchanged']} unchanged, "
+             f"{st['removed']} removed\n\n", "dim")
+
+    bytecode = ""
+    if bytecode_enabled(cfg, python_exe):
+        try:
+            with timeline.step("precompile"):
+                st = precompile_modules(cfg, python_exe)
+            bytecode = st["prefix"]
+            emit(f"Bytecode   : {st['files']} module(s) at optimize "
+                 f"{','.join(map(str, st['levels']))}  ·  {st['compiled']} "
+                 f"compiled, {st['fresh']} cached  ·  {st['workers']} "
+                 f"process(es)\n", "dim")
+            for path in st["failed"]:
+                emit(f"             not compiled: {path} — PyInstaller will "
+                     "report why\n", "warn")
+            emit("\n")
+        except OSError as exc:
+            emit(f"Bytecode   : precompile skipped ({exc})\n\n", "warn")
+
+    if cancel.is_set():
+        result["cancelled"] = True
+        emit("\nBuild cancelled.\n", "warn")
+        return
+    stopped  = {}
+    launched = time.time()
+    proc     = None
+    try:
+        with timeline.step("pyinstaller"):
+            proc = _launch_pyinstaller(cmd, cfg, python_exe, bytecode)
+            with _live_lock:
+                _LIVE_BUILDS.add(proc)
+            if isinstance(proc, WarmBuild):
+                emit(f"Worker     : warm, build {proc.seq} of {WARM_BUILDS} "
+                     "on this worker\n", "dim")
+            notes = apply_limits(proc, cfg)
+            if notes:
+                tag = "warn" if any(t == "warn" for _, t in notes) else "dim"
+                emit("Limits     : " + "  ·  ".join(n for n, _ in notes)
+                     + "\n\n", tag)
+            threading.Thread(target=_supervise,
+                             args=(proc, cancel, cfg.get("timeout") or 0,
+                                   stopped),
+                             daemon=True).start()
+            timeline.begin("stage", "startup")
+            for line in proc.stdout:
+                timeline.feed(line)
+                emit(line)
+            proc.wait()
+            timeline.end("detail")
+            timeline.end("stage")
+        result["exit_ok"] = proc.returncode == 0
+        why = stopped.get("why") if proc.returncode != 0 else None
+        if why:
+            result["cancelled"] = why == "cancelled"
+            result["timed_out"] = why == "timed out"
+            emit("\nBuild cancelled.\n" if result["cancelled"] else
+                 f"\nBuild timed out after {cfg['timeout']:g}s — "
+                 "PyInstaller and its subprocesses were stopped.\n", "warn")
+            _drop_partial_artifact(cfg, result["exe"], launched)
+            # Watch mode: the next rebuild wants the incremental state;
+            # PyInstaller redoes any stage whose TOC was left half-written
+            n = 0 if result["cancelled"] and cfg.get("_keep_work") else \
+                _clean_work_dir(work_dir_for(cfg, python_exe), launched)
+            if n:
+                emit(f"Cleaned    : {n} partial file(s) from the work dir\n",
+                     "dim")
+    except FileNotFoundError:
+        emit(f"\nERROR: Could not launch:\n  {python_exe}\n\n"
+             "Make sure Python is installed and on PATH.\n", "err")
+    except Exception as exc:
+        emit(f"\nUnexpected error: {exc}\n", "err")
+    finally:
+        if proc is not None:
+            if proc.poll() is None:          # e.g. KeyboardInterrupt
+                kill_process_tree(proc)
+            with _live_lock:
+                _LIVE_BUILDS.discard(proc)
+
+    with timeline.step("exe check"):
+        result["success"] = result["exit_ok"] and os.path.isfile(result["exe"])
+    if result["success"] and cfg.get("dedupe") and not cfg["onefile"]:
+        try:
+            with timeline.step("dedupe"):
+                st = dedupe_artifact(os.path.dirname(result["exe"]),
+                                     _cached_links(result["exe"]))
+            emit(f"\nDedupe     : {st['files']} file(s), "
+                 f"{format_bytes(st['bytes'])}  ·  {st['shared']} shared "
+                 f"with earlier builds ({format_bytes(st['saved'])} saved)"
+                 f"  ·  {st['own']} used by this build only\n", "dim")
+            if st["unshared"]:
+                emit(f"             {st['unshared']} file(s) not shared — the "
+                     "store must be on the output's filesystem\n", "warn")
+            gc = maybe_gc_store()
+            if gc and gc["removed"]:
+                emit(f"Store GC   : {gc['removed']} unreferenced blob(s), "
+                     f"{format_bytes(gc['freed'])} freed\n", "dim")
+        except OSError as exc:
+            emit(f"\nDedupe     : skipped ({exc})\n", "warn")
+    if result["success"] and key:
+        try:
+            with timeline.step("cache store"):
+                cache_store(key, cfg, result["exe"])
+        except OSError as exc:
+            emit(f"\nCould not store build in cache: {exc}\n", "warn")
+
+
+# ══════════════════════════════════════════════════════════
+#  BUILD  MATRIX
+#  One script built as several variants at once — one-file /
+#  one-folder x console / windowed x interpreters.  Every
+#  variant gets its own dist folder (<dist>/matrix/<variant>)
+#  and therefore its own work folder.  BuildScheduler starts
+#  builds on threads (each run_build waits on a PyInstaller
+#  process) only while a CPU is free and there is memory for
+#  another PyInstaller, so a big matrix never swaps the box.
+# ══════════════════════════════════════════════════════════
+BUILD_MEMORY_MB = int(os.environ.get("PYTOEXE_BUILD_MEM_MB", "700") or 700)
+
+
+def available_memory() -> int:
+    """Bytes of physical memory free for new processes (0 if unknown)."""
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/meminfo", "r") as fh:
+                for line in fh:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError, IndexError):
+            pass
+    elif sys.platform == "win32":
+        import ctypes
+
+        class _MemoryStatus(ctypes.Structure):
+            _fields_ = [("dwLength", ctypes.c_ulong),
+                        ("dwMemoryLoad", ctypes.c_ulong)] + \
+                       [(f, ctypes.c_ulonglong) for f in (
+                           "ullTotalPhys", "ullAvailPhys", "ullTotalPageFile",
+                           "ullAvailPageFile", "ullTotalVirtual",
+                           "ullAvailVirtual", "ullAvailExtendedVirtual")]
+
+        status = _MemoryStatus()
+        status.dwLength = ctypes.sizeof(status)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullAvailPhys
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return 0
+
+
+def _status_or_missing(python_exe: str) -> dict:
+    try:
+        return pyinstaller_status(python_exe)
+    except OSError:
+        return {"available": False, "version": "", "python_version": "",
+                "packages": ""}
+
+
+def interpreter_choices(first: str = "") -> list:
+    """
+    [{"path", "python_version", "pyinstaller"}] for first (if given) and
+    every discovered interpreter; "pyinstaller" is its PyInstaller
+    version, "" if PyInstaller is missing.
+    """
+    paths, seen = [], set()
+    for path in ([first] if first else []) + \
+            [r["path"] for r in discover_pythons()]:
+        real = os.path.realpath(path)
+        if real not in seen:
+            seen.add(real)
+            paths.append(path)
+    with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as pool:
+        statuses = list(pool.map(_status_or_missing, paths))
+    return [{"path": p, "python_version": st["python_version"],
+             "pyinstaller": st["version"]}
+            for p, st in zip(paths, statuses)]
+
+
+def _failed_result(exc: Exception) -> dict:
+    return {"success": False, "exit_ok": False, "cached": False,
+            "abs_dist": "", "exe": "", "seconds": 0.0, "trace": "",
+            "size": 0, "report": "", "cancelled": False, "timed_out": False,
+            "startup": {}, "error": str(exc)}
+
+
+class BuildScheduler:
+    """
+    Run jobs on threads, starting the next one only while fewer than
+    `limit` run, the machine is not already loaded and at least
+    `memory_mb` of memory is available.  One job always runs.
+    """
+
+    POLL_SECONDS = 0.5
+
+    def __init__(self, limit: int = 0, memory_mb: int = BUILD_MEMORY_MB):
+        self.cpus   = os.cpu_count() or 1
+        self.limit  = max(1, limit or self.cpus)
+        self.memory = memory_mb << 20
+
+    def can_start(self, running: int) -> bool:
+        if running == 0:
+            return True
+        if running >= self.limit:
+            return False
+        if hasattr(os, "getloadavg") and os.getloadavg()[0] > self.cpus:
+            return False
+        free = available_memory()
+        return not free or free >= self.memory
+
+    def run(self, jobs: list, run_one, on_done=None) -> list:
+        """
+        Call run_one(job) for every job; returns the results in job
+        order.  on_done(job, result) is called from the job's thread.
+        """
+        results = [None] * len(jobs)
+        pending = list(range(len(jobs)))
+        running = set()
+        cond    = threading.Condition()
+
+        def work(i):
+            try:
+                res = run_one(jobs[i])
+            except Exception as exc:
+                res = _failed_result(exc)
+            results[i] = res
+            if on_done:
+                on_done(jobs[i], res)
+            with cond:
+                running.discard(i)
+                cond.notify()
+
+        with cond:
+            while pending or running:
+                if pending and self.can_start(len(running)):
+                    i = pending.pop(0)
+                    running.add(i)
+                    threading.Thread(target=work, args=(i,),
+                                     daemon=True).start()
+                else:
+                    cond.wait(self.POLL_SECONDS)
+        return results
+
+
+def matrix_variants(cfg: dict, pythons: list, modes=(True, False),
+                    windows=(False, True)) -> list:
+    """
+    Expand cfg into one cfg per (interpreter, onefile, windowed).
+    pythons is a list of interpreter paths; each variant carries its
+    interpreter in cfg["python"] and a label in cfg["name"].
+    """
+    stem  = Path(cfg["script"]).stem
+    base  = dist_dir(cfg)
+    multi = len(pythons) > 1
+    variants = []
+    for python in pythons:
+        version = ""
+        if multi:
+            try:
+                version = pyinstaller_status(python)["python_version"]
+            except FileNotFoundError:
+                pass
+            version = "-py" + (version or Path(python).name)
+        for onefile in modes:
+            for windowed in windows:
+                vid = (("onefile" if onefile else "onedir") + "-"
+                       + ("windowed" if windowed else "console") + version)
+                variants.append(dict(
+                    cfg, python=python, onefile=onefile, windowed=windowed,
+                    output_dir=os.path.join(base, "matrix", vid),
+                    name=f"{stem}-{vid}", spec=False))
+    return variants
+
+
+def summary_lines(results: list, width: int = 60) -> list:
+    """The result table shared by batch, matrix and GUI builds."""
+    lines = ["─" * width]
+    for r in results:
+        state = result_state(r).upper()
+        size  = format_bytes(r["size"]) if r.get("size") else "-"
+        lines.append(f"  {state:<9} {r['seconds']:7.1f}s  {size:>9}  "
+                     f"{r.get('label', ''):<28} {r['exe']}")
+    lines.append("─" * width)
+    return lines
+
+
+# ══════════════════════════════════════════════════════════
+#  AUTO-TUNE
+#  Builds one script once per profile — in parallel, like the
+#  matrix, each in <dist>/tune/<profile> — then benchmarks the
+#  artifacts one after another on an otherwise idle machine
+#  (startup numbers taken while other builds compile would be
+#  noise) and picks the profile that best meets the goal:
+#    size     smallest artifact
+#    latency  lowest warm time-to-main
+#  Results within TUNE_TOLERANCE of the best count as a tie,
+#  which goes to the milder profile (earlier in PROFILES).
+# ══════════════════════════════════════════════════════════
+AUTOTUNE_RUNS  = 3
+AUTOTUNE_GOALS = ("size", "latency")
+TUNE_TOLERANCE = 0.02
+
+
+def autotune_variants(cfg: dict, profiles=None) -> list:
+    """One cfg per profile; the benchmark is left to tune_measure()."""
+    stem = Path(cfg["script"]).stem
+    base = dist_dir(cfg)
+    runs = max(cfg.get("bench_runs") or 0, AUTOTUNE_RUNS)
+    return [dict(cfg, profile=name, name=f"{stem}-{name}",
+                 output_dir=os.path.join(base, "tune", name),
+                 bench_runs=runs, _defer_bench=True, spec=False)
+            for name in (profiles or PROFILES)]
+
+
+def tune_measure(variants: list, results: list, emit=None, cancel=None):
+    """Benchmark every built variant, one at a time (fills r["startup"])."""
+    emit = emit or _emit_nothing
+    for cfg, r in zip(variants, results):
+        if cancel is not None and cancel.is_set():
+            return
+        if r["success"]:
+            emit(f"Measuring startup of {cfg['name']} ...\n", "dim")
+            r["startup"] = startup_bench(cfg, r["exe"], cfg["bench_runs"],
+                                         cfg.get("bench_args"), cancel)
+
+
+def _latency(result: dict):
+    """Warm (else cold) p50 of time-to-main (else total runtime), in ms."""
+    for kind in ("warm", "cold"):
+        stats = (result.get("startup") or {}).get(kind, {})
+        for measure in ("to_main_ms", "total_ms"):
+            if measure in stats:
+                return stats[measure]["p50"]
+    return None
+
+
+def recommend_profile(variants: list, results: list, goal: str):
+    """The winning variant cfg for goal, or None if nothing qualifies."""
+    scored = []
+    for cfg, r in zip(variants, results):
+        value = r["size"] if goal == "size" else _latency(r)
+        if r["success"] and value:
+            scored.append((value, cfg))
+    if not scored:
+        return None
+    best = min(value for value, _cfg in scored)
+    return next(cfg for value, cfg in scored
+                if value <= best * (1.0 + TUNE_TOLERANCE))
+
+
+def tune_lines(variants: list, results: list, winner=None,
+               width: int = 60) -> list:
+    lines = ["─" * width,
+             f"    {'profile':<10}{'size':>10}{'to main':>11}  settings"]
+    for cfg, r in zip(variants, results):
+        lat  = _latency(r)
+        mark = "*" if cfg is winner else " "
+        size = format_bytes(r["size"]) if r["success"] else result_state(r)
+        lines.append(f"  {mark} {cfg['profile']:<10}{size:>10}"
+                     f"{f'{lat:.0f} ms' if lat else '-':>11}  "
+                     f"{describe_profile(cfg)}")
+    lines.append("─" * width)
+    return lines
+
+
+# ══════════════════════════════════════════════════════════
+#  JOB  QUEUE
+#  Builds submitted while others run wait in a queue instead
+#  of being refused.  Waiting jobs start in list order on
+#  their own threads while fewer than `limit` run and the
+#  BuildScheduler sees room for one more; they can be moved
+#  or removed until then.  Every job keeps its own log file,
+#  status and result (and so its own artifact).
+# ══════════════════════════════════════════════════════════
+JOB_FINISHED = ("ok", "cached", "no exe", "failed", "cancelled", "timed out")
+
+
+def result_state(result: dict) -> str:
+    """ok / cached / no exe / failed / cancelled / timed out of a result."""
+    if result.get("cancelled"):
+        return "cancelled"
+    if result.get("timed_out"):
+        return "timed out"
+    if result["success"]:
+        return "cached" if result["cached"] else "ok"
+    return "no exe" if result["exit_ok"] else "failed"
+
+
+class BuildJob:
+    """One queued build: its config, interpreter, log and result."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, cfg: dict, python_exe: str, client: str = ""):
+        self.id       = next(self._ids)
+        self.cfg      = cfg
+        self.python   = cfg.get("python") or python_exe
+        self.label    = _job_label(cfg)
+        self.client   = client        # who submitted it (daemon fairness)
+        self.work     = work_dir_for(cfg, self.python)
+        self.spec     = spec_path(cfg) if cfg.get("spec") else ""
+        self.state    = "queued"
+        self.result   = None
+        self.log      = None          # BuildLogFile, opened when it starts
+        self.lock     = threading.Lock()
+        self.cancel   = threading.Event()
+        self.started  = 0.0
+        self.finished = 0.0
+
+    @property
+    def seconds(self) -> float:
+        if not self.started:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+
+class BuildQueue:
+    """
+    Jobs run in list order, at most `limit` at a time.  A free slot
+    goes to the first waiting job of the client with the fewest
+    running builds, and never to a job whose work folder a running
+    build is using.
+
+    on_output(job, text, tag) gets every line a job emits, after it
+    has been written to job.log and while job.lock is held, so a
+    viewer that takes the same lock can switch jobs without losing
+    or doubling lines.  on_change(job) is called whenever a job is
+    added, started, moved, removed or finished.  Both are called
+    from worker threads.  The owner closes a finished job's log.
+    """
+
+    def __init__(self, limit: int = 0, on_output=None, on_change=None):
+        self.scheduler = BuildScheduler(limit)
+        self.jobs      = []
+        self.on_output = on_output or (lambda job, text, tag: None)
+        self.on_change = on_change or (lambda job: None)
+        self._lock     = threading.RLock()
+        self._retry    = None
+
+    @property
+    def limit(self) -> int:
+        return self.scheduler.limit
+
+    def set_limit(self, limit: int):
+        self.scheduler.limit = max(1, limit)
+        self._dispatch()
+
+    def add(self, cfg: dict, python_exe: str, client: str = "") -> BuildJob:
+        job = BuildJob(cfg, python_exe, client)
+        with self._lock:
+            self.jobs.append(job)
+        self.on_change(job)
+        self._dispatch()
+        return job
+
+    def get(self, job_id: int):
+        with self._lock:
+            return next((j for j in self.jobs if j.id == job_id), None)
+
+    def counts(self) -> tuple:
+        """(running, queued)."""
+        with self._lock:
+            states = [j.state for j in self.jobs]
+        return states.count("running"), states.count("queued")
+
+    def busy(self) -> bool:
+        return any(self.counts())
+
+    def move(self, job_id: int, delta: int) -> bool:
+        """Move a job up (-1) or down (+1) in the list."""
+        with self._lock:
+            job = self.get(job_id)
+            if job is None:
+                return False
+            i = self.jobs.index(job)
+            k = min(max(i + delta, 0), len(self.jobs) - 1)
+            if k == i:
+                return False
+            self.jobs.insert(k, self.jobs.pop(i))
+        self.on_change(job)
+        return True
+
+    def remove(self, job_id: int) -> bool:
+        """
+        Drop a waiting or finished job; a running one is cancelled
+        and stays listed until its build has stopped.
+        """
+        with self._lock:
+            job = self.get(job_id)
+            if job is None:
+                return False
+            if job.state == "running":
+                job.cancel.set()
+                return True
+            self.jobs.remove(job)
+            if job.state == "queued":
+                job.state = "cancelled"
+        self.on_change(job)
+        return True
+
+    def clear_finished(self) -> list:
+        with self._lock:
+            done = [j for j in self.jobs if j.state in JOB_FINISHED]
+            self.jobs = [j for j in self.jobs if j not in done]
+        for job in done:
+            self.on_change(job)
+        return done
+
+    def _dispatch(self):
+        started = []
+        with self._lock:
+            running = [j for j in self.jobs if j.state == "running"]
+            waiting = [j for j in self.jobs if j.state == "queued"]
+            while waiting:
+                job = self._next_job(waiting, running)
+                if job is None:
+                    break
+                if not self.scheduler.can_start(len(running)):
+                    self._retry_later()
+                    break
+                waiting.remove(job)
+                job.state   = "running"
+                job.started = time.time()
+                running.append(job)
+                started.append(job)
+        for job in started:
+            threading.Thread(target=self._work, args=(job,),
+                             daemon=True).start()
+            self.on_change(job)
+
+    @staticmethod
+    def _next_job(waiting: list, running: list):
+        busy  = {j.work for j in running} | \
+                {j.spec for j in running if j.spec}
+        load  = collections.Counter(j.client for j in running)
+        ready = [j for j in waiting
+                 if j.work not in busy and j.spec not in busy]
+        return min(ready, key=lambda j: load[j.client], default=None)
+
+    def _retry_later(self):
+        """Waiting only on memory / load: look again in a moment."""
+        if self._retry is None or not self._retry.is_alive():
+            self._retry = threading.Timer(self.scheduler.POLL_SECONDS,
+                                          self._dispatch)
+            self._retry.daemon = True
+            self._retry.start()
+
+    def _work(self, job: BuildJob):
+        try:
+            job.log = BuildLogFile(job.label)
+        except OSError:
+            job.log = None
+
+        def emit(text, tag=""):
+            with job.lock:
+                if job.log:
+                    job.log.write(text)
+                self.on_output(job, text, tag)
+
+        try:
+            result = run_build(job.cfg, job.python, emit, job.cancel)
+        except Exception as exc:
+            emit(f"\n  Unexpected error: {exc}\n", "err")
+            result = _failed_result(exc)
+        result["label"] = job.label
+        job.result      = result
+        job.finished    = time.time()
+        job.state       = result_state(result)
+        self.on_change(job)
+        self._dispatch()
+
+
+# ══════════════════════════════════════════════════════════
+#  WATCH  MODE
+#  Polls the inputs of one build — script, local imports,
+#  icon, extra files — and rebuilds when they change.  A burst
+#  of saves is debounced into one build; a build whose inputs
+#  change while it runs is cancelled right away and replaced.
+#  Rebuilds use the same per-config work folder, so
+#  PyInstaller only redoes the stages whose inputs changed;
+#  a cancelled watch build leaves it in place for that reason.
+#  Polling only stats files already known: the import
+#  closure is rescanned when one of its sources or their
+#  folders changes, an asset folder re-walked when one of its
+#  folders' mtime changes (a file was added or removed).
+# ══════════════════════════════════════════════════════════
+WATCH_POLL_SECONDS     = 0.25
+WATCH_DEBOUNCE_SECONDS = 0.5
+
+
+def watched_files(cfg: dict) -> list:
+    """Every file whose change should trigger a rebuild of cfg."""
+    files = [os.path.abspath(cfg["script"])]
+    try:
+        files += local_imports(cfg["script"])
+    except OSError:
+        pass
+    if cfg["icon"]:
+        files.append(os.path.abspath(cfg["icon"]))
+    files += [src for src, _dest in asset_files(cfg)]
+    return files
+
+
+def _snapshot(paths) -> dict:
+    snap = {}
+    for p in paths:
+        try:
+            st = os.stat(p)
+            snap[p] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            snap[p] = None
+    return snap
+
+
+class WatchedInputs:
+    """watched_files(cfg) with the import scan and folder walks cached."""
+
+    def __init__(self, cfg: dict):
+        self.cfg    = cfg
+        self._code  = None    # snapshot of script, closure, their folders
+        self._files = []      # script + closure
+        self._trees = {}      # asset folder -> (folders snapshot, files)
+
+    def snapshot(self) -> dict:
+        """_snapshot() of every watched file."""
+        code = _snapshot(self._code) if self._code is not None else None
+        if code is None or code != self._code:
+            self._files = [os.path.abspath(self.cfg["script"])]
+            try:
+                self._files += local_imports(self.cfg["script"])
+            except OSError:
+                pass
+            self._code = code = _snapshot(
+                set(self._files) | {os.path.dirname(f) for f in self._files})
+        snap = {f: code[f] for f in self._files}
+        if self.cfg["icon"]:
+            snap.update(_snapshot([os.path.abspath(self.cfg["icon"])]))
+        for item in self.cfg["extra_files"]:
+            src = os.path.abspath(item)
+            if not os.path.isdir(src):
+                snap.update(_snapshot([src]))
+                continue
+            tree = self._trees.get(src)
+            if tree is None or _snapshot(tree[0]) != tree[0]:
+                pairs, folders = _asset_folder(src, "")
+                tree = self._trees[src] = (_snapshot(folders),
+                                           [p for p, _dest in pairs])
+            snap.update(_snapshot(tree[1]))
+        return snap
+
+
+class BuildWatcher:
+    """
+    Rebuild cfg whenever its inputs change, until stop() is called.
+    on_result(result) is called from the build thread after every build.
+    """
+
+    def __init__(self, cfg: dict, python_exe: str, emit=None, on_result=None,
+                 debounce: float = WATCH_DEBOUNCE_SECONDS,
+                 poll: float = WATCH_POLL_SECONDS):
+        self.cfg        = cfg
+        self.python_exe = python_exe
+        self.emit       = emit or _emit_nothing
+        self.on_result  = on_result
+        self.debounce   = debounce
+        self.poll       = poll
+        self._stop      = threading.Event()
+        self._build     = None        # (thread, cancel event)
+
+    def stop(self):
+        self._stop.set()
+
+    def run(self):
+        """Blocks: builds once, then again after every settled change."""
+        inputs  = WatchedInputs(self.cfg)
+        snap    = inputs.snapshot()
+        changed = set()
+        since   = 0.0
+        self._start("initial build")
+        while not self._stop.wait(self.poll):
+            now  = inputs.snapshot()
+            diff = {p for p in set(now) | set(snap) if now.get(p) != snap.get(p)}
+            if diff:
+                snap, since = now, time.time()
+                changed |= diff
+                self._cancel("inputs changed")
+            elif changed and time.time() - since >= self.debounce:
+                self._start("changed: " + ", ".join(
+                    sorted(os.path.basename(p) for p in changed)))
+                changed = set()
+        self._cancel("watch stopped")
+
+    def _start(self, reason: str):
+        self._cancel("inputs changed")
+        cancel = threading.Event()
+        thread = threading.Thread(target=self._build_once,
+                                  args=(reason, cancel), daemon=True)
+        self._build = (thread, cancel)
+        thread.start()
+
+    def _cancel(self, why: str):
+        """Stop a running (now stale) build and wait for it."""
+        if self._build and self._build[0].is_alive():
+            if not self._build[1].is_set():
+                self.emit(f"\nCancelling running build — {why}.\n", "warn")
+                self._build[1].set()
+            self._build[0].join()
+
+    def _build_once(self, reason: str, cancel):
+        self.emit(f"\n── {time.strftime('%H:%M:%S')}  {reason} "
+                  f"{'─' * 20}\n", "head")
+        cfg    = dict(self.cfg, _keep_work=True)
+        result = run_build(cfg, self.python_exe, self.emit, cancel)
+        if self.on_result:
+            self.on_result(result)
+
+
+# ══════════════════════════════════════════════════════════
+#  BUILD  DAEMON
+#  One long-running BuildQueue shared by every GUI and script
+#  on the machine, over HTTP on localhost (JSON both ways):
+#    GET    /status                  limit, running / queued
+#    GET    /jobs[?client=C]         job summaries, queue order
+#    POST   /jobs                    {"cfg", "python", "client", "cwd"}
+#    GET    /jobs/<id>               summary + result
+#    GET    /jobs/<id>/log?since=N&wait=S
+#                                    log from line N on; waits up
+#                                    to S seconds for new output
+#    POST   /jobs/<id>/move          {"delta": -1 | 1}
+#    DELETE /jobs/<id>               cancel (running) / drop
+#    POST   /clear?client=C          drop C's finished jobs
+#  The global limit and the scheduler's memory / load check
+#  hold across all clients, free slots go to the client with
+#  the fewest running builds, and no two builds share a work
+#  folder.  Only a running job's newest lines are held in
+#  memory; older and finished output is read back from the
+#  job's log file (untagged).  Requests must carry the token
+#  from daemon.json (or $PYTOEXE_DAEMON_TOKEN) in an
+#  X-PyToExe-Token header.
+#  RemoteQueue is the client side: a BuildQueue look-alike
+#  whose jobs run in the daemon, which is all the GUI needs.
+# ══════════════════════════════════════════════════════════
+DAEMON_PORT         = 47613
+DAEMON_KEEP         = 200         # finished jobs the daemon remembers
+DAEMON_TAIL_LINES   = 2000        # lines of a running job kept in memory
+DAEMON_MAX_WAIT     = 25.0        # longest log long-poll, seconds
+DAEMON_POLL         = 0.5         # RemoteQueue refresh interval, seconds
+DAEMON_LOST_POLLS   = 20          # failed refreshes before jobs are lost
+DAEMON_PRIVATE_KEYS = ("_defer_bench",)
+
+
+def daemon_file() -> str:
+    return os.path.join(state_dir(), "daemon.json")
+
+
+def daemon_address() -> dict:
+    """
+    {"url", "token"} of the daemon to talk to: $PYTOEXE_DAEMON (if it
+    is a URL) and $PYTOEXE_DAEMON_TOKEN, else what the daemon wrote to
+    daemon.json when it started.
+    """
+    info = {}
+    try:
+        with open(daemon_file(), "r", encoding="utf-8") as fh:
+            info = json.load(fh)
+    except (OSError, ValueError):
+        pass
+    env = os.environ.get("PYTOEXE_DAEMON", "")
+    return {"url":   env if env.startswith("http") else
+                     info.get("url") or f"http://127.0.0.1:{DAEMON_PORT}",
+            "token": os.environ.get("PYTOEXE_DAEMON_TOKEN") or
+                     info.get("token", "")}
+
+
+def client_name() -> str:
+    """Fairness is per user, however many windows they have open."""
+    import getpass
+    try:
+        return getpass.getuser()
+    except (KeyError, OSError, ImportError):
+        return "anonymous"
+
+
+def _job_info(job, result: bool = False) -> dict:
+    info = {"id": job.id, "label": job.label, "client": job.client,
+            "state": job.state, "script": job.cfg["script"],
+            "python": job.python, "seconds": round(job.seconds, 1)}
+    if result:
+        info["result"] = job.result
+    return info
+
+
+class _LogTail:
+    """
+    The newest output of one running job as (start, end, text, tag)
+    chunks, where [start, end) are the log lines a chunk completes.
+    Lines before `first` have been dropped.
+    """
+
+    def __init__(self, keep: int = DAEMON_TAIL_LINES):
+        self.keep   = keep
+        self.lines  = 0
+        self.first  = 0
+        self.chunks = collections.deque()
+
+    def add(self, text: str, tag: str):
+        if not text:
+            return
+        start = self.lines
+        self.lines += text.count("\n")
+        self.chunks.append((start, self.lines, text, tag))
+        while self.chunks[0][1] < self.lines - self.keep:
+            _start, end, text, _tag = self.chunks.popleft()
+            # a dropped partial line is gone too
+            self.first = end if text.endswith("\n") else end + 1
+
+    def since(self, line: int, done: bool):
+        """
+        ([(text, tag)], next line) from `line` on.  A trailing partial
+        line is held back until it is complete or the job is done.
+        """
+        events, nxt = [], line
+        for start, end, text, tag in self.chunks:
+            if start < line:
+                if end <= line:
+                    continue
+                text = "".join(text.splitlines(True)[line - start:])
+            events.append((text, tag))
+            if text.endswith("\n"):
+                nxt = end
+        if not done:
+            while events and not events[-1][0].endswith("\n"):
+                events.pop()
+        elif events and not events[-1][0].endswith("\n"):
+            nxt = self.lines + 1
+        return events, nxt
+
+
+class BuildDaemon:
+    """A BuildQueue served over HTTP (see the section comment)."""
+
+    def __init__(self, limit: int, host: str = "127.0.0.1",
+                 port: int = DAEMON_PORT, token: str = ""):
+        import secrets
+        import socketserver
+        from http.server import HTTPServer
+
+        class Server(socketserver.ThreadingMixIn, HTTPServer):
+            daemon_threads = True
+
+        self.queue  = BuildQueue(limit, self._output, self._changed)
+        self.token  = token or secrets.token_hex(16)
+        self.tails  = {}                  # job id -> _LogTail, running jobs
+        self.cond   = threading.Condition()
+        self.server = Server((host, port), _daemon_handler(self))
+        self.url    = f"http://{host}:{self.server.server_address[1]}"
+
+    def serve(self):
+        """Blocks until Ctrl+C; then cancels every job."""
+        path = daemon_file()
+        # Private from the first byte: the token lets its holder run
+        # any interpreter as this user.  0o600 also resets the mode
+        # of a daemon.json left behind by an older version.
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        if sys.platform != "win32":
+            os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump({"url": self.url, "token": self.token,
+                       "pid": os.getpid()}, fh)
+        try:
+            self.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.server.server_close()
+            self.stop()
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def stop(self, wait: float = TERM_GRACE_SECONDS + 5):
+        for job in list(self.queue.jobs):
+            if job.state in ("queued", "running"):
+                self.queue.remove(job.id)
+        deadline = time.time() + wait
+        while self.queue.counts()[0] and time.time() < deadline:
+            time.sleep(0.1)
+
+    # ── queue callbacks (worker threads) ─────────────────
+    def _output(self, job, text: str, tag: str):
+        with self.cond:
+            self.tails.setdefault(job.id, _LogTail()).add(text, tag)
+            self.cond.notify_all()
+
+    def _changed(self, job):
+        with self.cond:
+            if job.result is not None and job.log:
+                job.log.close()             # its output is all on disk
+                self.tails.pop(job.id, None)
+            self.cond.notify_all()
+        done = [j for j in self.queue.jobs if j.state in JOB_FINISHED]
+        for old in done[:max(0, len(done) - DAEMON_KEEP)]:
+            self.queue.remove(old.id)
+            with self.cond:
+                self.tails.pop(old.id, None)
+
+    # ── requests ─────────────────────────────────────────
+    def handle(self, method: str, parts: list, query: dict, body: dict):
+        """(HTTP status, JSON reply) for one request."""
+        q = self.queue
+        if parts == ["status"] and method == "GET":
+            running, queued = q.counts()
+            return 200, {"limit": q.limit, "running": running,
+                         "queued": queued, "pid": os.getpid()}
+        if parts == ["jobs"] and method == "GET":
+            client = query.get("client")
+            return 200, [_job_info(j) for j in list(q.jobs)
+                         if client in (None, j.client)]
+        if parts == ["jobs"] and method == "POST":
+            return 201, _job_info(self.submit(body))
+        if parts == ["clear"] and method == "POST":
+            client = query.get("client")
+            done = [j for j in list(q.jobs) if j.state in JOB_FINISHED
+                    and client in (None, j.client)]
+            for job in done:
+                q.remove(job.id)
+            return 200, {"cleared": len(done)}
+        if len(parts) in (2, 3) and parts[0] == "jobs" and parts[1].isdigit():
+            job = q.get(int(parts[1]))
+            if job is None:
+                return 404, {"error": f"no job {parts[1]}"}
+            tail = parts[2:]
+            if not tail and method == "GET":
+                return 200, _job_info(job, result=True)
+            if not tail and method == "DELETE":
+                q.remove(job.id)
+                return 200, _job_info(job)
+            if tail == ["log"] and method == "GET":
+                return 200, self.log(job, int(query.get("since", 0)),
+                                     float(query.get("wait", 0)))
+            if tail == ["move"] and method == "POST":
+                return 200, {"moved": self.move(job, int(body.get("delta", 0)))}
+        return 404, {"error": f"no such endpoint: {method} /{'/'.join(parts)}"}
+
+    def submit(self, body: dict):
+        spec = body.get("cfg")
+        if not isinstance(spec, dict):
+            raise ValueError("request has no 'cfg' object")
+        private = {k: spec[k] for k in DAEMON_PRIVATE_KEYS if k in spec}
+        cfg = make_config({k: v for k, v in spec.items() if k not in private},
+                          body.get("cwd") or "")
+        cfg.update(private)
+        python = cfg.get("python") or body.get("python")
+        if not (python and os.path.isfile(python)):
+            raise ValueError(f"interpreter not found: {python}")
+        if not os.path.isfile(cfg["script"]):
+            raise ValueError(f"script not found: {cfg['script']}")
+        return self.queue.add(cfg, python, str(body.get("client") or
+                                               "anonymous"))
+
+    def log(self, job, since: int, wait: float) -> dict:
+        """
+        Output from line `since` on: from the in-memory tail while it
+        reaches back that far, else up to DAEMON_TAIL_LINES lines from
+        the log file, with "more" set if the file holds further lines.
+        """
+        deadline = time.time() + min(max(wait, 0.0), DAEMON_MAX_WAIT)
+        with self.cond:
+            while True:
+                done = job.result is not None
+                tail = self.tails.get(job.id)
+                left = deadline - time.time()
+                if done or left <= 0 or (tail and tail.lines > since):
+                    break
+                self.cond.wait(left)
+            events = None
+            if tail is not None and (tail.first <= since or not job.log):
+                events, nxt = tail.since(max(since, tail.first), done)
+        more = False
+        if events is None:
+            events, nxt = [], since
+            if job.log:
+                stop = min(job.log.lines, since + DAEMON_TAIL_LINES)
+                text = job.log.read_lines(since, stop)
+                if text:
+                    events, nxt = [(text, "")], stop
+                more = stop < job.log.lines
+        return {"events": events, "next": nxt, "more": more,
+                "state": job.state, "done": done}
+
+    def move(self, job, delta: int) -> bool:
+        """Swap places with the client's previous / next job."""
+        mine = [j for j in list(self.queue.jobs) if j.client == job.client]
+        k = mine.index(job) + (1 if delta > 0 else -1)
+        if not delta or not 0 <= k < len(mine):
+            return False
+        jobs = self.queue.jobs
+        return self.queue.move(job.id, jobs.index(mine[k]) - jobs.index(job))
+
+
+def _daemon_handler(daemon: BuildDaemon):
+    """The request handler class, bound to one BuildDaemon."""
+    import hmac
+    import urllib.parse
+    from http.server import BaseHTTPRequestHandler
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "PyToExeDaemon/1"
+
+        def log_message(self, fmt, *args):
+            pass
+
+        def _reply(self, code: int, reply):
+            data = json.dumps(reply, default=str).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _route(self, method: str):
+            token = self.headers.get("X-PyToExe-Token", "")
+            if not hmac.compare_digest(token.encode(), daemon.token.encode()):
+                return self._reply(403, {"error": "missing or wrong token"})
+            url   = urllib.parse.urlsplit(self.path)
+            query = dict(urllib.parse.parse_qsl(url.query))
+            parts = [p for p in url.path.split("/") if p]
+            try:
+                size = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(size) or b"{}") \
+                    if method == "POST" else {}
+                if not isinstance(body, dict):
+                    raise ValueError("request body is not a JSON object")
+                code, reply = daemon.handle(method, parts, query, body)
+            except (ValueError, KeyError, OSError) as exc:
+                code, reply = 400, {"error": str(exc)}
+            self._reply(code, reply)
+
+        def do_GET(self):
+            self._route("GET")
+
+        def do_POST(self):
+            self._route("POST")
+
+        def do_DELETE(self):
+            self._route("DELETE")
+
+    return Handler
+
+
+def _client_query(client: str) -> str:
+    import urllib.parse
+    return "?" + urllib.parse.urlencode({"client": client})
+
+
+class DaemonClient:
+    """
+    Talks to a BuildDaemon.  Connection problems raise OSError, a
+    request the daemon refuses raises ValueError with its message.
+    """
+
+    def __init__(self, url: str = "", token: str = "",
+                 timeout: float = 10.0):
+        import urllib.request
+        found        = daemon_address()
+        self.url     = (url or found["url"]).rstrip("/")
+        self.token   = token or found["token"]
+        self.timeout = timeout
+        # Never send localhost traffic through $http_proxy
+        self._opener = urllib.request.build_opener(
+            urllib.request.ProxyHandler({}))
+
+    def _call(self, method: str, path: str, body=None, wait: float = 0.0):
+        import http.client
+        import urllib.error
+        import urllib.request
+        req = urllib.request.Request(
+            self.url + path, method=method,
+            data=None if body is None else json.dumps(body).encode("utf-8"),
+            headers={"X-PyToExe-Token": self.token,
+                     "Content-Type": "application/json"})
+        try:
+            with self._opener.open(req, timeout=self.timeout + wait) as resp:
+                return json.loads(resp.read().decode("utf-8"))
+        except urllib.error.HTTPError as exc:
+            try:
+                msg = json.loads(exc.read().decode("utf-8"))["error"]
+            except (ValueError, KeyError):
+                msg = str(exc)
+            raise ValueError(f"build daemon: {msg}")
+        except (urllib.error.URLError, http.client.HTTPException,
+                OSError) as exc:
+            raise OSError(f"build daemon at {self.url} not reachable: "
+                          f"{getattr(exc, 'reason', exc)}")
+
+    def status(self) -> dict:
+        return self._call("GET", "/status")
+
+    def jobs(self, client: str = "") -> list:
+        return self._call("GET", "/jobs" + (_client_query(client)
+                                            if client else ""))
+
+    def submit(self, cfg: dict, python_exe: str, client: str) -> dict:
+        return self._call("POST", "/jobs", {"cfg": cfg, "python": python_exe,
+                                            "client": client,
+                                            "cwd": os.getcwd()})
+
+    def job(self, job_id: int) -> dict:
+        return self._call("GET", f"/jobs/{job_id}")
+
+    def log(self, job_id: int, since: int = 0, wait: float = 0.0) -> dict:
+        return self._call("GET", f"/jobs/{job_id}/log?since={since}"
+                                 f"&wait={wait}", wait=wait)
+
+    def move(self, job_id: int, delta: int) -> bool:
+        return self._call("POST", f"/jobs/{job_id}/move",
+                          {"delta": delta})["moved"]
+
+    def remove(self, job_id: int) -> dict:
+        return self._call("DELETE", f"/jobs/{job_id}")
+
+    def clear(self, client: str) -> int:
+        return self._call("POST", "/clear" + _client_query(client),
+                          {})["cleared"]
+
+
+class RemoteQueue(BuildQueue):
+    """
+    BuildQueue whose jobs run in a BuildDaemon.  Jobs, states,
+    callbacks and per-job log files behave as for a local queue; a
+    poll thread mirrors the daemon's state, output and results.
+    The limit is the daemon's and cannot be changed from here.
+    """
+
+    def __init__(self, client: DaemonClient, on_output=None,
+                 on_change=None, name: str = ""):
+        super().__init__(client.status()["limit"], on_output, on_change)
+        self.client = client
+        self.name   = name or client_name()
+        self._wake  = threading.Event()
+        self._fails = 0
+        threading.Thread(target=self._poll, daemon=True).start()
+
+    def set_limit(self, limit: int):
+        pass
+
+    def add(self, cfg: dict, python_exe: str, client: str = "") -> BuildJob:
+        info = self.client.submit(cfg, cfg.get("python") or python_exe,
+                                  self.name)
+        job = BuildJob(cfg, python_exe, self.name)
+        job.id, job.label, job.next = info["id"], info["label"], 0
+        with self._lock:
+            self.jobs.append(job)
+        self.on_change(job)
+        self._wake.set()
+        return job
+
+    def move(self, job_id: int, delta: int) -> bool:
+        return self.client.move(job_id, delta) and \
+            super().move(job_id, delta)
+
+    def remove(self, job_id: int) -> bool:
+        job = self.get(job_id)
+        if job is not None and job.result is None:
+            try:
+                self.client.remove(job_id)
+            except ValueError:              # already gone on the daemon
+                pass
+        return super().remove(job_id)
+
+    def clear_finished(self) -> list:
+        self.client.clear(self.name)
+        return super().clear_finished()
+
+    def _dispatch(self):
+        pass                                # the daemon schedules
+
+    def _poll(self):
+        while True:
+            self._wake.wait(DAEMON_POLL)
+            self._wake.clear()
+            with self._lock:
+                live = [j for j in self.jobs if j.result is None
+                        and j.state in ("queued", "running")]
+            if not live:
+                continue
+            try:
+                infos = {i["id"]: i for i in self.client.jobs(self.name)}
+                for job in live:
+                    self._sync(job, infos.get(job.id))
+                self._fails = 0
+            except (OSError, ValueError) as exc:
+                self._fails += 1
+                if self._fails >= DAEMON_LOST_POLLS:
+                    for job in live:
+                        self._write(job, [(f"\n  Lost the build daemon: "
+                                           f"{exc}\n", "err")])
+                        self._finish(job, _failed_result(exc))
+
+    def _sync(self, job, info):
+        if info is None:                    # dropped on the daemon
+            self._finish(job, dict(_failed_result("removed"),
+                                   cancelled=True))
+            return
+        if info["state"] != "queued" and not job.started:
+            job.started = time.time() - info["seconds"]
+            job.state   = "running"
+            try:
+                job.log = BuildLogFile(job.label)
+            except OSError:
+                job.log = None
+            self.on_change(job)
+        if job.started:
+            self._pull_log(job)
+        if info["state"] in JOB_FINISHED:
+            self._pull_log(job)
+            self._finish(job, self.client.job(job.id)["result"])
+
+    def _pull_log(self, job):
+        while True:
+            data = self.client.log(job.id, job.next)
+            self._write(job, data["events"])
+            job.next = data["next"]
+            if not data.get("more"):
+                break
+
+    def _write(self, job, events: list):
+        with job.lock:
+            for text, tag in events:
+                if job.log:
+                    job.log.write(text)
+                self.on_output(job, text, tag)
+
+    def _finish(self, job, result: dict):
+        result["label"] = job.label
+        job.result      = result
+        job.finished    = time.time()
+        job.state       = result_state(result)
+        self.on_change(job)
+
+
+# ══════════════════════════════════════════════════════════
+#  COMMAND  LINE  /  BATCH  MODE
+#  No tkinter import anywhere on this path.
+# ══════════════════════════════════════════════════════════
+def make_config(entry: dict, base_dir: str = "") -> dict:
+    """
+    Return a complete cfg dict from a (possibly partial) job entry.
+    Relative paths are resolved against base_dir — the manifest's
+    folder, or the current directory for command-line jobs.
+    """
+    unknown = set(entry) - set(DEFAULT_CONFIG) - {"name"}
+    if unknown:
+        raise ValueError("unknown job key(s): " + ", ".join(sorted(unknown)))
+    cfg = dict(DEFAULT_CONFIG)
+    cfg.update(entry)
+    if not cfg["script"]:
+        raise ValueError("job has no 'script'")
+
+    def _abs(p):
+        return os.path.abspath(os.path.join(base_dir, p)) if p else p
+
+    cfg["script"]      = _abs(cfg["script"])
+    cfg["output_dir"]  = _abs(cfg["output_dir"]) or None
+    cfg["icon"]        = _abs(cfg["icon"]) or None
+    cfg["extra_files"] = [_abs(f) for f in cfg["extra_files"]]
+    cfg["onefile"]     = bool(cfg["onefile"])
+    cfg["windowed"]    = bool(cfg["windowed"])
+    cfg["timeout"]     = float(cfg["timeout"] or 0)
+    cfg["nice"]        = int(cfg["nice"] or 0)
+    cfg["cpus"]        = parse_cpus(cfg["cpus"]) or None
+    cfg["memory_mb"]   = int(cfg["memory_mb"] or 0)
+    cfg["bench_runs"]  = int(cfg["bench_runs"] or 0)
+    if isinstance(cfg["bench_args"], str):
+        cfg["bench_args"] = shlex.split(cfg["bench_args"])
+    profile_settings(cfg)                    # raises on an unknown name
+    if cfg["python"] and os.sep in cfg["python"]:
+        cfg["python"]  = _abs(os.path.expanduser(cfg["python"]))
+    return cfg
+
+
+def load_manifest(path: str) -> list:
+    """
+    Read a JSON or TOML job manifest and return a list of cfg dicts.
+
+    Either a bare list of jobs, or a table with optional "defaults"
+    applied to every entry of "jobs":
+
+        {"defaults": {"windowed": true},
+         "jobs": [{"script": "tools/a.py"}, {"script": "b.py", "icon": "b.ico"}]}
+
+    TOML needs Python 3.11+ (tomllib) or the tomli package.
+    """
+    if path.lower().endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError(
+                    "TOML manifests need Python 3.11+ or 'pip install tomli'")
+        with open(path, "rb") as fh:
+            data = tomllib.load(fh)
+    else:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+
+    if isinstance(data, list):
+        defaults, jobs = {}, data
+    else:
+        defaults, jobs = data.get("defaults", {}), data.get("jobs", [])
+    base = os.path.dirname(os.path.abspath(path))
+    return [make_config(dict(defaults, **job), base) for job in jobs]
+
+
+def _job_label(cfg: dict) -> str:
+    return cfg.get("name") or Path(cfg["script"]).stem
+
+
+def _prefixed_emit(label: str, quiet: bool):
+    """An emit() that prints each line as '[label] line'."""
+    def emit(text, tag=""):
+        if quiet and tag not in ("err", "warn"):
+            return
+        for line in text.splitlines():
+            if line.strip():
+                sys.stdout.write(f"[{label}] {line}\n")
+        sys.stdout.flush()
+    return emit
+
+
+# Set in a pool worker by Ctrl+C: its later jobs end as cancelled
+_cli_interrupted = threading.Event()
+
+
+def _cli_worker(cfg: dict, python_exe: str, quiet: bool) -> dict:
+    """Process-pool entry point: run one job, prefix its output lines."""
+    label  = _job_label(cfg)
+    emit   = _prefixed_emit(label, quiet)
+    try:
+        result = run_build(cfg, cfg.get("python") or python_exe, emit,
+                           _cli_interrupted)
+    except KeyboardInterrupt:
+        _cli_interrupted.set()
+        raise
+    result["label"] = label
+    return result
+
+
+def _parse_args(argv):
+    p = argparse.ArgumentParser(
+        prog="py2exe_converter",
+        description="Convert Python scripts to executables with PyInstaller. "
+                    "Without scripts or --manifest the GUI is opened.",
+    )
+    p.add_argument("scripts", nargs="*", metavar="SCRIPT",
+                   help="script(s) to build, one job each")
+    p.add_argument("-m", "--manifest",
+                   help="JSON or TOML file listing build jobs")
+    p.add_argument("-o", "--output", dest="output_dir",
+                   help="output folder (default: <script dir>/dist)")
+    p.add_argument("--icon", help=".ico file embedded in every job")
+    p.add_argument("--onedir", action="store_true",
+                   help="one-folder build instead of a single file")
+    p.add_argument("--windowed", action="store_true",
+                   help="no console window")
+    p.add_argument("--add-data", dest="extra_files", action="append",
+                   default=[], metavar="PATH",
+                   help="extra file, or folder (structure kept), to bundle "
+                        "(repeatable)")
+    p.add_argument("--python", dest="python_exe",
+                   help="interpreter used to run PyInstaller")
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                   help="maximum concurrent builds (default: CPU count)")
+    p.add_argument("--matrix", action="store_true",
+                   help="build every job as 4 variants: one-file/one-folder "
+                        "x console/windowed, each in dist/matrix/<variant>")
+    p.add_argument("--matrix-python", action="append", default=[],
+                   metavar="PYTHON",
+                   help="also vary the interpreter (repeatable; 'all' = "
+                        "every discovered Python with PyInstaller)")
+    p.add_argument("--watch", action="store_true",
+                   help="keep running and rebuild whenever a script, local "
+                        "import, icon or extra file changes (Ctrl+C stops)")
+    p.add_argument("--debounce", type=float, default=WATCH_DEBOUNCE_SECONDS,
+                   metavar="SECONDS",
+                   help="watch: quiet time after the last change before "
+                        "rebuilding (default %(default)s)")
+    p.add_argument("--timeout", type=float, metavar="SECONDS",
+                   help="stop a build (PyInstaller and its subprocesses) "
+                        "that runs longer than this")
+    p.add_argument("--nice", type=int, metavar="N",
+                   help="run PyInstaller at lower priority (POSIX niceness; "
+                        "on Windows >0 = below normal, >=15 = idle)")
+    p.add_argument("--cpus", type=parse_cpus, metavar="LIST",
+                   help="Linux: CPUs PyInstaller may use, e.g. 0-3,6")
+    p.add_argument("--memory-mb", dest="memory_mb", type=int, metavar="MIB",
+                   help="Linux: address-space cap for PyInstaller and its "
+                        "subprocesses")
+    p.add_argument("--bench-runs", type=int, metavar="N",
+                   help="after a successful build, launch the artifact N "
+                        "times cold and N times warm and report "
+                        "time-to-main / total runtime")
+    p.add_argument("--bench-args", metavar="ARGS",
+                   help="benchmark by running the program to completion "
+                        "with these arguments (default: stop it at main)")
+    p.add_argument("--profile", choices=list(PROFILES),
+                   help="optimisation profile: " + ", ".join(
+                       f"{n} ({describe_profile({'profile': n})})"
+                       for n in PROFILES))
+    p.add_argument("--autotune", choices=AUTOTUNE_GOALS,
+                   help="build every profile in parallel, benchmark them "
+                        "and recommend the best one for this goal")
+    p.add_argument("--apply", action="store_true",
+                   help="autotune: also build the job with the winner")
+    p.add_argument("--daemon", action="store_true",
+                   help="run the local build daemon: builds jobs sent by "
+                        "GUIs and --remote clients, at most -j at a time "
+                        "(Ctrl+C stops)")
+    p.add_argument("--listen", default=f"127.0.0.1:{DAEMON_PORT}",
+                   metavar="HOST:PORT",
+                   help="daemon: address to serve on (default %(default)s)")
+    p.add_argument("--remote", action="store_true",
+                   help="send the jobs to the build daemon instead of "
+                        "building here ($PYTOEXE_DAEMON / daemon.json); "
+                        "with --gui, attach the window to it")
+    p.add_argument("-q", "--quiet", action="store_true",
+                   help="only print warnings, errors and the summary")
+    p.add_argument("--auto-exclude", action="store_true",
+                   help="exclude tkinter, matplotlib, Qt, IPython and pytest "
+                        "unless the script's own code imports them")
+    p.add_argument("--no-import-scan", action="store_true",
+                   help="leave module discovery entirely to PyInstaller "
+                        "(no --hidden-import / --exclude-module)")
+    p.add_argument("--no-warm", action="store_true",
+                   help="spawn a fresh PyInstaller for every build instead "
+                        "of forking it from a warm worker")
+    p.add_argument("--no-bytecode-cache", action="store_true",
+                   help="let PyInstaller compile every module itself instead "
+                        "of precompiling the local ones in parallel")
+    p.add_argument("--no-cache", action="store_true",
+                   help="always run PyInstaller, ignore the build cache")
+    p.add_argument("--spec", action="store_true",
+                   help="build from <script>.spec, generated from the options "
+                        "and rewritten only when they change")
+    p.add_argument("--dedupe", action="store_true",
+                   help="keep one-folder output files once in the artifact "
+                        "store and hard-link them into dist")
+    p.add_argument("--store-gc", action="store_true",
+                   help="delete artifact-store blobs no output uses any more")
+    p.add_argument("--clear-cache", action="store_true",
+                   help="delete every cached build before starting")
+    p.add_argument("--list-pythons", action="store_true",
+                   help="list discovered interpreters and exit")
+    p.add_argument("--gui", action="store_true",
+                   help="open the GUI even if other arguments are given")
+    p.add_argument("--no-splash", action="store_true",
+                   help="GUI: skip the splash screen and show the window "
+                        "immediately (or set PYTOEXE_NO_SPLASH=1)")
+    p.add_argument("--startup-trace", metavar="FILE",
+                   default=os.environ.get("PYTOEXE_STARTUP_TRACE", ""),
+                   help="GUI: write startup phase timings as JSON to FILE "
+                        "('-' = stderr; or set PYTOEXE_STARTUP_TRACE)")
+    return p.parse_args(argv)
+
+
+def _matrix_pythons(specs: list, default: str) -> list:
+    """Interpreter paths for --matrix-python values ('all' expands)."""
+    pythons = []
+    for spec in specs or [default]:
+        if spec == "all":
+            pythons += [c["path"] for c in interpreter_choices(default)
+                        if c["pyinstaller"]]
+        else:
+            path = spec if os.sep in spec else shutil.which(spec)
+            if not path:
+                raise ValueError(f"interpreter not found: {spec}")
+            pythons.append(os.path.abspath(path))
+    return list(dict.fromkeys(pythons))
+
+
+def _run_matrix_cli(args, jobs: list, python_exe: str) -> int:
+    try:
+        pythons = _matrix_pythons(args.matrix_python, python_exe)
+    except ValueError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+    variants = []
+    for cfg in jobs:
+        if args.matrix:
+            variants += matrix_variants(cfg, pythons)
+        else:
+            variants += matrix_variants(cfg, pythons, (cfg["onefile"],),
+                                        (cfg["windowed"],))
+    scheduler = BuildScheduler(limit=args.jobs)
+    print(f"Building {len(variants)} variant(s), up to {scheduler.limit} at "
+          f"a time while CPU and memory allow "
+          f"({BUILD_MEMORY_MB} MB per build)")
+    started = time.time()
+    results = scheduler.run(
+        variants, lambda cfg: _cli_worker(cfg, python_exe, args.quiet))
+    for cfg, r in zip(variants, results):
+        r.setdefault("label", _job_label(cfg))
+    failed = [r for r in results if not r["success"]]
+    print("\n" + "\n".join(summary_lines(results)))
+    print(f"  {len(results) - len(failed)}/{len(results)} "
+          f"succeeded in {time.time() - started:.1f}s")
+    return 1 if failed else 0
+
+
+def _run_autotune_cli(args, jobs: list, python_exe: str) -> int:
+    scheduler = BuildScheduler(limit=args.jobs)
+    status    = 0
+    for cfg in jobs:
+        variants = autotune_variants(cfg)
+        print(f"Auto-tune {Path(cfg['script']).name} for {args.autotune}: "
+              f"{len(variants)} profiles, up to {scheduler.limit} builds at "
+              "a time")
+        results = scheduler.run(
+            variants, lambda v: _cli_worker(v, python_exe, args.quiet))
+        tune_measure(variants, results,
+                     _prefixed_emit(_job_label(cfg), args.quiet))
+        winner = recommend_profile(variants, results, args.autotune)
+        print("\n" + "\n".join(tune_lines(variants, results, winner, 72)))
+        if winner is None:
+            print("  No profile produced a working artifact.")
+            status = 1
+            continue
+        print(f"  Recommended for {args.autotune}: --profile "
+              f"{winner['profile']}   ({winner['output_dir']})")
+        if args.apply:
+            final = dict(cfg, profile=winner["profile"])
+            result = _cli_worker(final, python_exe, args.quiet)
+            print(f"  Applied: {result_state(result).upper()}  "
+                  f"{result['exe']}")
+            status |= 0 if result["success"] else 1
+    return status
+
+
+def _run_daemon_cli(args) -> int:
+    host, _sep, port = args.listen.rpartition(":")
+    try:
+        daemon = BuildDaemon(args.jobs, host or "127.0.0.1", int(port),
+                             os.environ.get("PYTOEXE_DAEMON_TOKEN", ""))
+    except (OSError, ValueError) as exc:
+        print(f"ERROR: cannot serve on {args.listen}: {exc}", file=sys.stderr)
+        return 2
+    def terminate(signum, frame):           # service managers send TERM
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, terminate)
+    print(f"Build daemon on {daemon.url}, up to {daemon.queue.limit} builds "
+          f"at a time — Ctrl+C to stop\n  token in {daemon_file()}",
+          flush=True)
+    daemon.serve()
+    print("Build daemon stopped.")
+    return 0
+
+
+def _run_remote_cli(args, jobs: list, python_exe: str) -> int:
+    if args.watch or args.autotune:
+        print("ERROR: --watch and --autotune build locally; drop --remote.",
+              file=sys.stderr)
+        return 2
+    def output(job, text, tag):
+        _prefixed_emit(job.label, args.quiet)(text, tag)
+
+    try:
+        queue = RemoteQueue(DaemonClient(), on_output=output)
+        variants = []
+        if args.matrix or args.matrix_python:
+            pythons = _matrix_pythons(args.matrix_python, python_exe)
+            for cfg in jobs:
+                variants += matrix_variants(cfg, pythons)
+        else:
+            variants = jobs
+        submitted = []
+        for cfg in variants:
+            submitted.append(queue.add(cfg, python_exe))
+    except (OSError, ValueError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+    print(f"Sent {len(submitted)} job(s) to the build daemon at "
+          f"{queue.client.url} (up to {queue.limit} builds at a time)")
+    started = time.time()
+    try:
+        while queue.busy():
+            time.sleep(0.2)
+    except KeyboardInterrupt:
+        for job in submitted:
+            queue.remove(job.id)
+        print("\nInterrupted — jobs cancelled on the daemon.", file=sys.stderr)
+        return 130
+    results = [job.result for job in submitted if job.result]
+    failed  = [r for r in results if not r["success"]]
+    print("\n" + "\n".join(summary_lines(results)))
+    print(f"  {len(results) - len(failed)}/{len(results)} "
+          f"succeeded in {time.time() - started:.1f}s")
+    return 1 if failed else 0
+
+
+def _run_watch_cli(args, jobs: list, python_exe: str) -> int:
+    watchers = []
+    for cfg in jobs:
+        label = _job_label(cfg)
+
+        def report(r, label=label):
+            state = "OK" if r["success"] else \
+                    "CANCELLED" if r["cancelled"] else "FAILED"
+            print(f"[{label}] >> {state} in {r['seconds']:.1f}s — "
+                  "watching for changes", flush=True)
+
+        watchers.append(BuildWatcher(
+            cfg, cfg.get("python") or python_exe,
+            _prefixed_emit(label, args.quiet), report, args.debounce))
+    print(f"Watching {len(jobs)} job(s) — Ctrl+C to stop")
+    threads = [threading.Thread(target=w.run, daemon=True) for w in watchers]
+    for t in threads:
+        t.start()
+    try:
+        while any(t.is_alive() for t in threads):
+            time.sleep(0.2)
+    except KeyboardInterrupt:
+        print("\nStopping ...")
+        for w in watchers:
+            w.stop()
+        for t in threads:
+            t.join()
+    return 0
+
+
+def run_cli(args) -> int:
+    """Run every requested job headlessly. Returns the process exit code."""
+    if args.daemon:
+        return _run_daemon_cli(args)
+    if args.list_pythons:
+        for rec in discover_pythons(refresh=True):
+            print(f"  {rec['version']:<10} {rec['path']}")
+        return 0
+
+    python_exe = args.python_exe or find_python()
+    if not python_exe:
+        print("ERROR: no Python 3 interpreter found — use --python.",
+              file=sys.stderr)
+        return 2
+    try:
+        if not pyinstaller_available(python_exe):
+            print(f"ERROR: PyInstaller is not installed for {python_exe}\n"
+                  f"  {python_exe} -m pip install pyinstaller",
+                  file=sys.stderr)
+            return 2
+    except FileNotFoundError:
+        print(f"ERROR: could not run {python_exe}", file=sys.stderr)
+        return 2
+
+    if args.clear_cache:
+        print(f"Build cache cleared ({clear_build_cache()} entries).")
+        if not (args.scripts or args.manifest or args.store_gc):
+            return 0
+    if args.store_gc:
+        gc = gc_store()
+        print(f"Artifact store: {gc['removed']} unreferenced blob(s) removed, "
+              f"{format_bytes(gc['freed'])} freed, {gc['kept']} in use.")
+        if not (args.scripts or args.manifest):
+            return 0
+
+    try:
+        jobs = load_manifest(args.manifest) if args.manifest else []
+        for script in args.scripts:
+            jobs.append(make_config({
+                "script":      script,
+                "output_dir":  args.output_dir,
+                "icon":        args.icon,
+                "onefile":     not args.onedir,
+                "windowed":    args.windowed,
+                "extra_files": args.extra_files,
+            }, os.getcwd()))
+    except (OSError, ValueError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+
+    if args.no_cache:
+        for cfg in jobs:
+            cfg["use_cache"] = False
+    if args.auto_exclude:
+        for cfg in jobs:
+            cfg["auto_exclude"] = True
+    if args.no_import_scan:
+        for cfg in jobs:
+            cfg["import_scan"] = False
+    if args.no_warm:
+        for cfg in jobs:
+            cfg["warm"] = False
+    if args.no_bytecode_cache:
+        for cfg in jobs:
+            cfg["bytecode_cache"] = False
+    if args.dedupe:
+        for cfg in jobs:
+            cfg["dedupe"] = True
+    if args.spec:
+        for cfg in jobs:
+            cfg["spec"] = True
+    for key in ("timeout", "nice", "cpus", "memory_mb", "bench_runs",
+                "profile"):
+        if getattr(args, key) is not None:
+            for cfg in jobs:
+                cfg[key] = getattr(args, key)
+    if args.bench_args is not None:
+        for cfg in jobs:
+            cfg["bench_args"] = shlex.split(args.bench_args)
+
+    missing = [c["script"] for c in jobs if not os.path.isfile(c["script"])]
+    if missing:
+        print("ERROR: script(s) not found:\n  " + "\n  ".join(missing),
+              file=sys.stderr)
+        return 2
+    if args.remote:
+        return _run_remote_cli(args, jobs, python_exe)
+    if args.watch:
+        return _run_watch_cli(args, jobs, python_exe)
+    if args.autotune:
+        return _run_autotune_cli(args, jobs, python_exe)
+    if args.matrix or args.matrix_python:
+        return _run_matrix_cli(args, jobs, python_exe)
+
+    workers = max(1, min(args.jobs, len(jobs)))
+    print(f"Building {len(jobs)} job(s) with {workers} worker(s) "
+          f"using {python_exe}")
+    started = time.time()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_cli_worker, cfg, python_exe, args.quiet)
+                   for cfg in jobs]
+        try:
+            for fut in as_completed(futures):
+                results.append(fut.result())
+        except KeyboardInterrupt:
+            # Workers got the Ctrl+C too and stopped their build trees;
+            # jobs that have not started yet must not start now
+            for fut in futures:
+                fut.cancel()
+            print("\nInterrupted — remaining jobs cancelled.", file=sys.stderr)
+            return 130
+
+    failed = [r for r in results if not r["success"]]
+    print("\n" + "\n".join(summary_lines(
+        sorted(results, key=lambda r: r["label"]))))
+    print(f"  {len(results) - len(failed)}/{len(results)} "
+          f"succeeded in {time.time() - started:.1f}s")
+    return 1 if failed else 0
+
+
+# ══════════════════════════════════════════════════════════
+#  ENTRY  POINT
+# ══════════════════════════════════════════════════════════
+def main(argv=None) -> int:
+    timer = PhaseTimer()
+    args  = _parse_args(sys.argv[1:] if argv is None else argv)
+    if args.gui or not (args.scripts or args.manifest or args.clear_cache
+                        or args.store_gc or args.list_pythons or args.daemon):
+        # The only place tkinter gets imported
+        with timer.phase("import_tkinter"):
+            import tkinter  # noqa: F401
+        with timer.phase("import_gui"):
+            from py2exe_gui import run_gui
+        run_gui(splash=not args.no_splash, timer=timer,
+                trace=args.startup_trace, remote=args.remote)
+        return 0
+    return run_cli(args)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    # py2exe_gui imports "py2exe_converter": make that this module,
+    # not a second copy with its own live-build set, pools and atexit
+    sys.modules.setdefault("py2exe_converter", sys.modules[__name__])
+    sys.exit(main())
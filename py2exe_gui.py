@@ -0,0 +1,1756 @@
+"""
+PyToExe Converter  v2.1  —  tkinter GUI
+Author  : Instagram @x404ctl  |  GitHub @MAliX
+
+Splash screen and main window.  Imported lazily by
+py2exe_converter.main() so headless builds never load tkinter.
+"""
+
+import os
+import sys
+import time
+import shlex
+import threading
+import subprocess
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox, scrolledtext
+from pathlib import Path
+
+from py2exe_converter import (
+    find_python, pyinstaller_available, pyinstaller_status,
+    open_folder, state_dir, PhaseTimer,
+    clear_build_cache, LogBuffer, BuildLogFile, format_bytes, LOG_PAGE_LINES,
+    BuildQueue, BuildWatcher, interpreter_choices, matrix_variants,
+    RemoteQueue, DaemonClient, warm_enabled, warm_pool,
+    PROFILES, describe_profile, autotune_variants, tune_measure,
+    recommend_profile, tune_lines,
+)
+
+# ══════════════════════════════════════════════════════════
+#  THEME
+# ══════════════════════════════════════════════════════════
+T = {
+    "bg":         "#0d1117",
+    "panel":      "#161b22",
+    "border":     "#30363d",
+    "accent":     "#238636",
+    "accent_hov": "#2ea043",
+    "accent_dim": "#1a5c28",
+    "blue":       "#1f6feb",
+    "blue_hov":   "#388bfd",
+    "text":       "#e6edf3",
+    "text_dim":   "#8b949e",
+    "danger":     "#da3633",
+    "warn":       "#d29922",
+    "ok":         "#3fb950",
+    "log_bg":     "#010409",
+    "log_fg":     "#c9d1d9",
+    "entry_bg":   "#21262d",
+    "entry_fg":   "#e6edf3",
+    "select_bg":  "#1f6feb",
+    "btn_bg":     "#21262d",
+    "btn_fg":     "#e6edf3",
+    "btn_hov":    "#30363d",
+    "splash_bg":  "#010409",
+    "splash_fg":  "#3fb950",
+}
+
+FONT_UI    = ("Consolas", 9)
+FONT_MONO  = ("Consolas", 9)
+FONT_HEAD  = ("Consolas", 10, "bold")
+FONT_SPLASH = ("Consolas", 11)
+PAD = 10
+
+# Build output is rendered on a fixed frame clock, never per line
+LOG_FRAME_MS    = 33            # ~30 refreshes per second
+LOG_FRAME_CHARS = 256 * 1024    # max text inserted in one frame
+LOG_MAX_LINES   = int(os.environ.get("PYTOEXE_LOG_LINES", "5000"))
+
+# Builds from CONVERT / Build Matrix wait in the queue card
+QUEUE_PARALLEL  = int(os.environ.get("PYTOEXE_QUEUE_PARALLEL",
+                                     min(4, os.cpu_count() or 1)))
+QUEUE_TICK_MS   = 1000          # refresh of running jobs' elapsed time
+PREWARM_MS      = 2000          # warm worker starts once the UI has settled
+JOB_COLORS      = {"queued": "text_dim", "running": "blue", "ok": "ok",
+                   "cached": "ok", "no exe": "warn", "failed": "danger",
+                   "cancelled": "warn", "timed out": "danger"}
+
+
+def _duration(seconds: float) -> str:
+    return f"{seconds / 60:g} min" if seconds >= 60 else f"{seconds:g}s"
+
+
+# ══════════════════════════════════════════════════════════
+#  PYINSTALLER  CHECK  (interactive — offers to install)
+# ══════════════════════════════════════════════════════════
+def ensure_pyinstaller(python_exe: str) -> bool:
+    """Check PyInstaller is importable via python_exe; offer to install."""
+    try:
+        if pyinstaller_available(python_exe):
+            return True
+    except FileNotFoundError:
+        messagebox.showerror(
+            "Python Not Found",
+            f"Could not run:\n{python_exe}\n\n"
+            "Make sure Python 3 is installed and added to PATH.",
+        )
+        return False
+
+    if not messagebox.askyesno(
+        "PyInstaller Missing",
+        "PyInstaller is not installed.\n\nInstall it now via pip?",
+    ):
+        return False
+
+    try:
+        subprocess.check_call(
+            [python_exe, "-m", "pip", "install", "pyinstaller"],
+            timeout=120,
+        )
+        return True
+    except Exception as exc:
+        messagebox.showerror(
+            "Install Failed",
+            f"Could not install PyInstaller automatically.\n\n"
+            f"Run this manually in a terminal:\n"
+            f"  pip install pyinstaller\n\nError: {exc}",
+        )
+        return False
+
+
+# ══════════════════════════════════════════════════════════
+#  SPLASH  SCREEN
+# ══════════════════════════════════════════════════════════
+class SplashScreen(tk.Toplevel):
+    LINES = [
+        ("",                                                             0.00),
+        ("  ██████╗ ██╗   ██╗    ██████╗     ███████╗██╗  ██╗███████╗", 0.03),
+        ("  ██╔══██╗╚██╗ ██╔╝    ╚════██╗    ██╔════╝╚██╗██╔╝██╔════╝", 0.03),
+        ("  ██████╔╝ ╚████╔╝      █████╔╝    █████╗   ╚███╔╝ █████╗  ", 0.03),
+        ("  ██╔═══╝   ╚██╔╝       ╚═══██╗    ██╔══╝   ██╔██╗ ██╔══╝  ", 0.03),
+        ("  ██║        ██║        ██████╔╝    ███████╗██╔╝ ██╗███████╗", 0.03),
+        ("  ╚═╝        ╚═╝        ╚═════╝     ╚══════╝╚═╝  ╚═╝╚══════╝",0.05),
+        ("",                                                             0.03),
+        ("  Python  -->  EXE  Converter   v2.1",                        0.04),
+        ("  Author  :  Instagram @x404ctl   |   GitHub @MAliX",         0.04),
+        ("",                                                             0.02),
+        ("  " + "─" * 62,                                               0.02),
+        ("",                                                             0.03),
+    ]
+    # Typed once App reports that startup work has finished
+    FOOTER = [
+        ("",                                                             0.04),
+        ("  " + "─" * 62,                                               0.02),
+        ("",                                                             0.05),
+        ("        Press any key to continue ...",                        0.00),
+    ]
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.master    = master
+        self._done     = False
+        self._finished = False
+        # (text, delay, tag) still to type; tag None = pick by content
+        self._script   = [(t, d, None) for t, d in self.LINES]
+        self._typing   = True
+
+        sw, sh = self.winfo_screenwidth(), self.winfo_screenheight()
+        w, h   = 740, 490
+        self.geometry(f"{w}x{h}+{(sw-w)//2}+{(sh-h)//2}")
+        self.configure(bg=T["splash_bg"])
+        self.overrideredirect(True)
+        self.lift()
+        self.focus_force()
+
+        border = tk.Frame(self, bg=T["splash_fg"], padx=2, pady=2)
+        border.pack(fill="both", expand=True, padx=6, pady=6)
+        inner  = tk.Frame(border, bg=T["splash_bg"])
+        inner.pack(fill="both", expand=True)
+
+        self._txt = tk.Text(
+            inner,
+            bg=T["splash_bg"], fg=T["splash_fg"],
+            font=FONT_SPLASH,
+            relief="flat", bd=0,
+            state="disabled", cursor="none",
+            wrap="none", highlightthickness=0,
+        )
+        self._txt.pack(fill="both", expand=True, padx=10, pady=10)
+        self._txt.tag_configure("logo",  foreground="#58d68d",
+                                font=("Consolas", 11, "bold"))
+        self._txt.tag_configure("info",  foreground="#aed6f1")
+        self._txt.tag_configure("dim",   foreground=T["text_dim"])
+        self._txt.tag_configure("ready", foreground="#f0e68c",
+                                font=("Consolas", 11, "bold"))
+        self._txt.tag_configure("press", foreground="#ffffff",
+                                font=("Consolas", 11, "bold"))
+        self._txt.tag_configure("ok",    foreground=T["ok"])
+        self._txt.tag_configure("fail",  foreground=T["danger"])
+
+        self.bind("<Key>",    self._dismiss)
+        self.bind("<Button>", self._dismiss)
+        self.after(250, self._type_line)
+
+    def _write(self, text, tag=""):
+        self._txt.configure(state="normal")
+        if tag:
+            self._txt.insert("end", text, tag)
+        else:
+            self._txt.insert("end", text)
+        self._txt.see("end")
+        self._txt.configure(state="disabled")
+
+    # ── Real progress (called on the Tk thread by App) ──
+    def report(self, text: str, tag: str = "dim"):
+        """Append one startup-progress line below the banner."""
+        self._script.append(("  " + text, 0.0, tag))
+        self._resume()
+
+    def finish(self):
+        """Startup work is done — type the footer and wait for a key."""
+        if not self._finished:
+            self._finished = True
+            self._script += [(t, d, None) for t, d in self.FOOTER]
+            self._resume()
+
+    def _resume(self):
+        if not self._typing and not self._done:
+            self._typing = True
+            self._type_line()
+
+    def _type_line(self):
+        if self._done:
+            return
+        if not self._script:
+            self._typing = False
+            if self._finished:
+                self._blink(True)
+            return
+        text, delay, tag = self._script.pop(0)
+        if tag is None:
+            tag = self._tag_for(text)
+        self._write(text + "\n", tag)
+        self.after(max(int(delay * 1000), 10), self._type_line)
+
+    @staticmethod
+    def _tag_for(text: str) -> str:
+        if "██" in text:
+            return "logo"
+        if "Python  -->" in text or "Author" in text:
+            return "info"
+        if "Press any key" in text:
+            return "press"
+        return ""
+
+    def _blink(self, state: bool):
+        if self._done:
+            return
+        self._txt.configure(state="normal")
+        idx = self._txt.index("end-1c")
+        last = self._txt.get("end-2c", "end-1c")
+        if last in ("_", " "):
+            self._txt.delete("end-2c", "end-1c")
+        self._txt.insert("end-1c", "_" if state else " ", "press")
+        self._txt.configure(state="disabled")
+        self.after(500, self._blink, not state)
+
+    def _dismiss(self, event=None):
+        if self._done:
+            return
+        self._done = True
+        self.destroy()
+        self.master.deiconify()
+        self.master.lift()
+        self.master.focus_force()
+
+
+# ══════════════════════════════════════════════════════════
+#  BUILD  MATRIX  DIALOG
+#  Picks the variants (bundle mode x window mode x
+#  interpreters) that App._start_matrix adds to the queue.
+# ══════════════════════════════════════════════════════════
+class MatrixDialog(tk.Toplevel):
+    def __init__(self, app):
+        super().__init__(app)
+        self.app = app
+        self.title("Build Matrix")
+        self.configure(bg=T["panel"])
+        self.resizable(False, False)
+        self.transient(app)
+
+        self.onefile_var  = tk.BooleanVar(value=True)
+        self.onedir_var   = tk.BooleanVar(value=True)
+        self.console_var  = tk.BooleanVar(value=True)
+        self.windowed_var = tk.BooleanVar(value=True)
+        self._pythons     = []          # [(path, BooleanVar)]
+
+        body = tk.Frame(self, bg=T["panel"])
+        body.pack(fill="both", padx=PAD * 2, pady=PAD)
+        self._heading(body, "Bundle")
+        row = tk.Frame(body, bg=T["panel"])
+        row.pack(anchor="w", pady=(0, 8))
+        self._check(row, "One-File",   self.onefile_var).pack(side="left", padx=(0, 30))
+        self._check(row, "One-Folder", self.onedir_var ).pack(side="left")
+        self._heading(body, "Window")
+        row = tk.Frame(body, bg=T["panel"])
+        row.pack(anchor="w", pady=(0, 8))
+        self._check(row, "Console",  self.console_var ).pack(side="left", padx=(0, 30))
+        self._check(row, "Windowed", self.windowed_var).pack(side="left")
+        self._heading(body, "Interpreters")
+        self._py_frame = tk.Frame(body, bg=T["panel"])
+        self._py_frame.pack(anchor="w", fill="x", pady=(0, 8))
+        self._searching = tk.Label(
+            self._py_frame, text="  Searching for Python installations ...",
+            bg=T["panel"], fg=T["text_dim"], font=FONT_UI)
+        self._searching.pack(anchor="w")
+
+        bar = tk.Frame(body, bg=T["panel"])
+        bar.pack(fill="x", pady=(8, 0))
+        self._count_lbl = tk.Label(bar, bg=T["panel"], fg=T["text_dim"],
+                                   font=FONT_UI)
+        self._count_lbl.pack(side="left")
+        tk.Button(bar, text="Cancel", command=self.destroy,
+                  bg=T["btn_bg"], fg=T["text_dim"],
+                  activebackground=T["btn_hov"], activeforeground=T["text"],
+                  relief="flat", font=FONT_UI, cursor="hand2",
+                  padx=10, pady=3).pack(side="right")
+        self._build_btn = tk.Button(
+            bar, text="Build", command=self._build,
+            bg=T["accent"], fg="white",
+            activebackground=T["accent_hov"], activeforeground="white",
+            relief="flat", font=FONT_HEAD, cursor="hand2", padx=14, pady=3)
+        self._build_btn.pack(side="right", padx=(0, 6))
+
+        for var in (self.onefile_var, self.onedir_var,
+                    self.console_var, self.windowed_var):
+            var.trace_add("write", self._update_count)
+        self._update_count()
+        threading.Thread(target=self._discover, daemon=True).start()
+
+    def _heading(self, parent, text: str):
+        tk.Label(parent, text=text, bg=T["panel"], fg=T["blue_hov"],
+                 font=FONT_HEAD, anchor="w").pack(anchor="w", pady=(4, 2))
+
+    def _check(self, parent, text: str, var, **kw) -> tk.Checkbutton:
+        return tk.Checkbutton(
+            parent, text=text, variable=var,
+            bg=T["panel"], fg=T["text"],
+            activebackground=T["panel"], activeforeground=T["accent_hov"],
+            selectcolor=T["entry_bg"], font=FONT_UI, cursor="hand2",
+            relief="flat", bd=0, **kw)
+
+    def _discover(self):
+        choices = interpreter_choices(self.app._python_exe)
+        self.after(0, self._show_pythons, choices)
+
+    def _show_pythons(self, choices: list):
+        if not self.winfo_exists():
+            return
+        self._searching.destroy()
+        for c in choices:
+            usable = bool(c["pyinstaller"])
+            var    = tk.BooleanVar(value=c["path"] == self.app._python_exe
+                                   and usable)
+            info   = f"PyInstaller {c['pyinstaller']}" if usable else \
+                     "no PyInstaller"
+            self._check(
+                self._py_frame,
+                f"Python {c['python_version'] or '?':<9} {info:<20} {c['path']}",
+                var, state="normal" if usable else "disabled",
+            ).pack(anchor="w")
+            var.trace_add("write", self._update_count)
+            self._pythons.append((c["path"], var))
+        self._update_count()
+
+    def _selection(self) -> tuple:
+        modes   = [m for m, v in ((True, self.onefile_var),
+                                  (False, self.onedir_var)) if v.get()]
+        windows = [w for w, v in ((False, self.console_var),
+                                  (True, self.windowed_var)) if v.get()]
+        pythons = [p for p, v in self._pythons if v.get()]
+        return pythons, modes, windows
+
+    def _update_count(self, *_):
+        pythons, modes, windows = self._selection()
+        n = len(pythons) * len(modes) * len(windows)
+        self._count_lbl.configure(text=f"{n} variant(s)")
+        self._build_btn.configure(state="normal" if n else "disabled")
+
+    def _build(self):
+        pythons, modes, windows = self._selection()
+        if pythons and modes and windows:
+            self.destroy()
+            self.app._start_matrix(pythons, modes, windows)
+
+
+# ══════════════════════════════════════════════════════════
+#  MAIN  APPLICATION
+# ══════════════════════════════════════════════════════════
+class App(tk.Tk):
+    def __init__(self, splash: bool = True, timer=None, trace: str = "",
+                 remote: bool = False):
+        self._timer = timer or PhaseTimer()
+        self._trace = trace            # startup-trace target ("" = off)
+        with self._timer.phase("tk_init"):
+            super().__init__()
+        self.withdraw()
+
+        self.title("PyToExe Converter  //  @x404ctl  |  @MAliX")
+        w, h = 820, 740
+        sw, sh = self.winfo_screenwidth(), self.winfo_screenheight()
+        self.geometry(f"{w}x{h}+{(sw-w)//2}+{(sh-h)//2}")
+        self.minsize(750, 640)
+        self.configure(bg=T["bg"])
+        self.resizable(True, True)
+
+        # Real Python is located by _startup_tasks in the background
+        self._python_exe = ""
+        self._starting   = True
+
+        # State
+        self.script_var   = tk.StringVar()
+        self.output_var   = tk.StringVar()
+        self.icon_var     = tk.StringVar()
+        self.onefile_var  = tk.BooleanVar(value=True)
+        self.windowed_var = tk.BooleanVar(value=False)
+        self.cache_var    = tk.BooleanVar(value=True)
+        self.scan_var     = tk.BooleanVar(value=True)
+        self.autoex_var   = tk.BooleanVar(value=False)
+        self.watch_var    = tk.BooleanVar(value=False)
+        self.dedupe_var   = tk.BooleanVar(value=False)
+        self.spec_var     = tk.BooleanVar(value=False)
+        self.timeout_var  = tk.IntVar(value=0)       # minutes, 0 = none
+        self.lowprio_var  = tk.BooleanVar(value=False)
+        self.memcap_var   = tk.IntVar(value=0)       # MiB, 0 = none
+        self.bench_var    = tk.IntVar(value=0)       # startup runs, 0 = off
+        self.bargs_var    = tk.StringVar()           # "" = stop at main
+        self.profile_var  = tk.StringVar(value="default")
+        self._watcher     = None          # BuildWatcher while watching
+        self.parallel_var = tk.IntVar(value=QUEUE_PARALLEL)
+        self._remote      = ""            # build daemon URL when attached
+        self._remote_err  = ""
+        self._queue       = self._make_queue(
+            remote or bool(os.environ.get("PYTOEXE_DAEMON")))
+        self._batch       = []            # jobs since the queue was last idle
+        self._reported    = set()         # ids of finished jobs handled
+        self._tunes       = []            # auto-tune runs still building
+        self._shown       = None          # job whose log is in the widget
+        self._queue_rows  = []            # job id per listbox row
+        self._ticking     = False
+        self.extra_files  = []
+        self._thread      = None
+        self._last_out    = ""
+        self._open_visible = False
+        self._logq        = LogBuffer()   # build thread -> log widget
+        self._logfile     = None          # full log of the shown build
+        self._log_first   = 0             # file line shown at widget top
+        self._log_paged   = 0             # older lines paged back in
+        self._pi_status   = {}            # python_exe -> PyInstaller status
+
+        with self._timer.phase("apply_style"):
+            self._apply_style()
+        with self._timer.phase("build_ui"):
+            self._build_ui()
+        self._pump_log()
+
+        if splash:
+            with self._timer.phase("splash"):
+                self._splash = SplashScreen(self)
+        else:
+            # Fast start — usable window now, detection fills in later
+            self._splash = None
+            self.deiconify()
+        threading.Thread(target=self._startup_tasks, daemon=True).start()
+        self.after(0, self._first_frame)
+
+    # ══════════════════════════════════════════
+    #  STARTUP  (background thread -> Tk thread)
+    # ══════════════════════════════════════════
+    def _startup_tasks(self):
+        """Slow init work, reported step by step to the splash."""
+        def step(text, tag="dim"):
+            self.after(0, self._startup_step, text, tag)
+
+        step("[ * ]  Locating Python interpreter ...")
+        with self._timer.phase("find_python"):
+            exe = find_python()
+        self.after(0, self._python_found, exe)
+        if not exe:
+            step("[ !! ]  No Python 3 interpreter found", "fail")
+        else:
+            step(f"[ ok ]  {exe}", "ok")
+            step("[ * ]  Loading PyInstaller interface ...")
+            try:
+                with self._timer.phase("pyinstaller_check"):
+                    status = pyinstaller_status(exe)
+            except OSError:
+                status = None
+            self.after(0, self._pyinstaller_checked, exe, status)
+            if status and status["available"]:
+                step(f"[ ok ]  PyInstaller {status['version']}", "ok")
+            else:
+                step("[ !! ]  PyInstaller missing — offered on first build",
+                     "fail")
+
+        step("[ * ]  Configuring build workspace ...")
+        try:
+            step(f"[ ok ]  {state_dir('logs')}", "ok")
+        except OSError as exc:
+            step(f"[ !! ]  {exc}", "fail")
+        step("[ * ]  All systems ready.", "ready")
+        self.after(0, self._startup_finished)
+
+    def _first_frame(self):
+        """First pass of the event loop — the visible window can take input."""
+        self.update_idletasks()
+        self._timer.mark("first_interactive_frame")
+        self._startup_trace()
+
+    def _startup_trace(self):
+        """Emit timings once both the first frame and background work are in."""
+        marks = self._timer.marks
+        if "first_interactive_frame" not in marks or \
+                "background_ready" not in marks or "_emitted" in marks:
+            return
+        self._timer.mark("_emitted")
+        if self._trace:
+            try:
+                self._timer.emit(self._trace, splash=self._splash is not None)
+            except OSError:
+                pass
+        if os.environ.get("PYTOEXE_EXIT_AFTER_STARTUP") == "1":
+            self.after(0, self.destroy)
+
+    def _startup_step(self, text: str, tag: str):
+        if self._splash is not None and self._splash.winfo_exists():
+            self._splash.report(text, tag)
+        elif tag != "ok":
+            self._set_status(text.split("]", 1)[-1].strip(), T["text_dim"])
+
+    def _python_found(self, exe: str):
+        if self._python_exe:       # user already picked one via Change
+            return
+        self._python_exe = exe
+        if exe:
+            self._py_lbl.configure(text=f"  {exe}", fg=T["ok"])
+        else:
+            self._py_lbl.configure(
+                text="  NOT FOUND — install Python 3 and add it to PATH",
+                fg=T["danger"])
+            # Warn early if Python not found
+            self.after(800, self._warn_no_python)
+
+    def _startup_finished(self):
+        self._starting = False
+        self._timer.mark("background_ready")
+        self._startup_trace()
+        if self._splash is not None and self._splash.winfo_exists():
+            self._splash.finish()
+        else:
+            self._set_status(
+                "Ready.   Select a Python script then press CONVERT.")
+        if self._remote_err:
+            self._set_status(f"Building locally — {self._remote_err}",
+                             T["warn"])
+        self.after(PREWARM_MS, self._prewarm)
+
+    def _prewarm(self):
+        """Start the warm PyInstaller worker before the first build."""
+        if self._python_exe and not self._remote and warm_enabled({}):
+            threading.Thread(target=warm_pool().prewarm,
+                             args=(self._python_exe,), daemon=True).start()
+
+    def _warn_no_python(self):
+        messagebox.showerror(
+            "Python Not Found",
+            "PyToExe could not locate a Python 3 interpreter.\n\n"
+            "Make sure Python 3 is installed and added to your system PATH.\n\n"
+            "Download from: https://python.org/downloads\n"
+            "(Check 'Add Python to PATH' during installation)",
+        )
+
+    # ══════════════════════════════════════════
+    #  STYLE
+    # ══════════════════════════════════════════
+    def _apply_style(self):
+        s = ttk.Style(self)
+        s.theme_use("clam")
+        s.configure(".",
+                    background=T["bg"], foreground=T["text"],
+                    font=FONT_UI, borderwidth=0)
+        s.configure("TFrame",       background=T["bg"])
+        s.configure("TLabel",       background=T["bg"],
+                    foreground=T["text"], font=FONT_UI)
+        s.configure("TCheckbutton", background=T["bg"],
+                    foreground=T["text"], font=FONT_UI,
+                    focuscolor=T["bg"])
+        s.map("TCheckbutton",
+              background=[("active", T["bg"])],
+              foreground=[("active", T["accent_hov"])])
+        s.configure("TEntry",
+                    fieldbackground=T["entry_bg"],
+                    foreground=T["entry_fg"],
+                    insertcolor=T["text"],
+                    bordercolor=T["border"],
+                    font=FONT_MONO)
+        s.map("TEntry", bordercolor=[("focus", T["blue"])])
+        s.configure("TProgressbar",
+                    troughcolor=T["panel"],
+                    background=T["accent"],
+                    bordercolor=T["border"],
+                    lightcolor=T["accent"],
+                    darkcolor=T["accent"])
+        s.configure("TScrollbar",
+                    background=T["border"],
+                    troughcolor=T["panel"],
+                    arrowcolor=T["text_dim"])
+
+    # ══════════════════════════════════════════
+    #  UI LAYOUT
+    # ══════════════════════════════════════════
+    def _build_ui(self):
+        self._make_titlebar()
+
+        wrap   = tk.Frame(self, bg=T["bg"])
+        wrap.pack(fill="both", expand=True)
+
+        canvas = tk.Canvas(wrap, bg=T["bg"], highlightthickness=0)
+        vsb    = ttk.Scrollbar(wrap, orient="vertical", command=canvas.yview)
+        canvas.configure(yscrollcommand=vsb.set)
+        vsb.pack(side="right", fill="y")
+        canvas.pack(side="left", fill="both", expand=True)
+
+        self._sf = tk.Frame(canvas, bg=T["bg"])
+        wid = canvas.create_window((0, 0), window=self._sf, anchor="nw")
+
+        def _resize(e):
+            canvas.configure(scrollregion=canvas.bbox("all"))
+            canvas.itemconfig(wid, width=canvas.winfo_width())
+
+        self._sf.bind("<Configure>", _resize)
+        canvas.bind("<Configure>",
+                    lambda e: canvas.itemconfig(wid, width=e.width))
+        canvas.bind_all("<MouseWheel>",
+                        lambda e: canvas.yview_scroll(
+                            -1 * (e.delta // 120), "units"))
+
+        for section in (self._section_files,
+                        self._section_options,
+                        self._section_extras,
+                        self._section_python_info,   # shows detected Python path
+                        self._section_convert,
+                        self._section_queue,
+                        self._section_log):
+            with self._timer.phase(section.__name__.lstrip("_")):
+                section(self._sf)
+        self._make_statusbar()
+
+    # ── Title bar ─────────────────────────────
+    def _make_titlebar(self):
+        bar = tk.Frame(self, bg=T["blue"], height=54)
+        bar.pack(fill="x")
+        bar.pack_propagate(False)
+        tk.Label(bar, text=" PY ",
+                 bg=T["accent"], fg="#fff",
+                 font=("Consolas", 13, "bold"),
+                 padx=4).pack(side="left", padx=(14, 0), pady=12)
+        tk.Label(bar, text="  PyToExe  Converter",
+                 bg=T["blue"], fg="#ffffff",
+                 font=("Consolas", 15, "bold")).pack(side="left")
+        tk.Label(bar, text="Instagram @x404ctl   |   GitHub @MAliX   ",
+                 bg=T["blue"], fg="#93c5fd",
+                 font=("Consolas", 8)).pack(side="right", padx=14)
+
+    # ── Status bar ────────────────────────────
+    def _make_statusbar(self):
+        sb = tk.Frame(self, bg=T["panel"], height=28)
+        sb.pack(fill="x", side="bottom")
+        sb.pack_propagate(False)
+        tk.Frame(sb, bg=T["border"], width=1).pack(side="left", fill="y")
+        self._dot = tk.Label(sb, text="  ●  ",
+                             bg=T["panel"], fg=T["text_dim"],
+                             font=("Consolas", 9, "bold"))
+        self._dot.pack(side="left")
+        self._status = tk.Label(
+            sb,
+            text="Ready.   Select a Python script then press CONVERT.",
+            bg=T["panel"], fg=T["text_dim"],
+            font=("Consolas", 8), anchor="w",
+        )
+        self._status.pack(side="left", fill="x", expand=True)
+        tk.Label(sb, text="  PyToExe v2.1  by @x404ctl   ",
+                 bg=T["panel"], fg=T["border"],
+                 font=("Consolas", 8)).pack(side="right")
+
+    # ── Card helper ───────────────────────────
+    def _card(self, parent, title: str) -> tk.Frame:
+        outer = tk.Frame(parent, bg=T["border"], padx=1, pady=1)
+        outer.pack(fill="x", padx=PAD, pady=(0, PAD))
+        hdr = tk.Frame(outer, bg="#1c2128")
+        hdr.pack(fill="x")
+        tk.Label(hdr, text=f"  {title}",
+                 bg="#1c2128", fg=T["blue_hov"],
+                 font=FONT_HEAD, anchor="w").pack(
+            side="left", padx=8, pady=6)
+        tk.Frame(outer, bg=T["border"], height=1).pack(fill="x")
+        body = tk.Frame(outer, bg=T["panel"])
+        body.pack(fill="x")
+        return body
+
+    # ── File-row helper ───────────────────────
+    def _file_row(self, parent, label, row, var, cmd):
+        tk.Label(parent, text=label,
+                 bg=T["panel"], fg=T["text_dim"],
+                 font=FONT_UI, width=17, anchor="e"
+                 ).grid(row=row, column=0, padx=(PAD, 6), pady=6, sticky="e")
+        e = tk.Entry(parent,
+                     textvariable=var,
+                     bg=T["entry_bg"], fg=T["entry_fg"],
+                     insertbackground=T["text"],
+                     relief="flat", font=FONT_MONO,
+                     highlightthickness=1,
+                     highlightbackground=T["border"],
+                     highlightcolor=T["blue"])
+        e.grid(row=row, column=1, sticky="ew", pady=6)
+        tk.Button(parent, text="Browse",
+                  bg=T["btn_bg"], fg=T["btn_fg"],
+                  activebackground=T["btn_hov"],
+                  activeforeground=T["text"],
+                  relief="flat", font=FONT_UI,
+                  cursor="hand2", padx=10,
+                  command=cmd).grid(
+            row=row, column=2, padx=(6, PAD), pady=6)
+
+    # ── Sections ─────────────────────────────
+    def _section_files(self, p):
+        tk.Frame(p, bg=T["bg"], height=PAD).pack()
+        body = self._card(p, "01  /  Select Files")
+        body.columnconfigure(1, weight=1)
+        self._file_row(body, "Python Script  *", 0,
+                       self.script_var, self._browse_script)
+        self._file_row(body, "Output Folder",    1,
+                       self.output_var, self._browse_output)
+        self._file_row(body, "Icon  (.ico)",      2,
+                       self.icon_var,   self._browse_icon)
+        tk.Frame(body, bg=T["panel"], height=6).grid(
+            row=3, column=0, columnspan=3)
+
+    def _section_options(self, p):
+        body = self._card(p, "02  /  Build Options")
+        row  = tk.Frame(body, bg=T["panel"])
+        row.pack(anchor="w", padx=PAD, pady=10)
+
+        def cb(txt, var, parent=None):
+            return tk.Checkbutton(
+                parent or row, text=txt, variable=var,
+                bg=T["panel"], fg=T["text"],
+                activebackground=T["panel"],
+                activeforeground=T["accent_hov"],
+                selectcolor=T["entry_bg"],
+                font=FONT_UI, cursor="hand2",
+                relief="flat", bd=0,
+            )
+
+        cb("One-File  ( single .exe )",       self.onefile_var ).pack(side="left", padx=(0, 30))
+        cb("Windowed  ( no console window )", self.windowed_var).pack(side="left", padx=(0, 30))
+        cb("Reuse cached build",              self.cache_var   ).pack(side="left", padx=(0, 30))
+        cb("Pre-scan imports",                self.scan_var    ).pack(side="left", padx=(0, 30))
+        cb("Auto-exclude unused",             self.autoex_var  ).pack(side="left")
+
+        mrow = tk.Frame(body, bg=T["panel"])
+        mrow.pack(anchor="w", padx=PAD, pady=(0, 10))
+        cb("Watch & rebuild on save", self.watch_var, mrow).pack(side="left", padx=(0, 30))
+        cb("Share one-folder files", self.dedupe_var, mrow).pack(side="left", padx=(0, 30))
+        cb("Build from .spec", self.spec_var, mrow).pack(side="left", padx=(0, 30))
+        tk.Button(mrow, text="Build Matrix ...",
+                  bg=T["btn_bg"], fg=T["text"],
+                  activebackground=T["btn_hov"],
+                  activeforeground=T["text"],
+                  relief="flat", font=FONT_UI,
+                  cursor="hand2", padx=10, pady=3,
+                  command=self._open_matrix).pack(side="left")
+        tk.Label(mrow, text="  several bundle / window / interpreter "
+                            "variants at once",
+                 bg=T["panel"], fg=T["text_dim"], font=FONT_UI).pack(side="left")
+
+        lrow = tk.Frame(body, bg=T["panel"])
+        lrow.pack(anchor="w", padx=PAD, pady=(0, 10))
+
+        def spin(label, var, to, unit, parent=lrow):
+            tk.Label(parent, text=label, bg=T["panel"], fg=T["text"],
+                     font=FONT_UI).pack(side="left")
+            tk.Spinbox(parent, from_=0, to=to, width=5, textvariable=var,
+                       bg=T["entry_bg"], fg=T["entry_fg"],
+                       buttonbackground=T["btn_bg"],
+                       relief="flat", font=FONT_UI).pack(side="left", padx=4)
+            tk.Label(parent, text=unit, bg=T["panel"], fg=T["text_dim"],
+                     font=FONT_UI).pack(side="left", padx=(0, 30))
+
+        spin("Timeout", self.timeout_var, 600, "min")
+        cb("Low priority", self.lowprio_var, lrow).pack(side="left", padx=(0, 30))
+        if sys.platform.startswith("linux"):
+            spin("Memory cap", self.memcap_var, 1 << 20, "MiB  (0 = none)")
+
+        brow = tk.Frame(body, bg=T["panel"])
+        brow.pack(anchor="w", padx=PAD, pady=(0, 10))
+        spin("Startup benchmark", self.bench_var, 100, "runs", brow)
+        tk.Label(brow, text="Args", bg=T["panel"], fg=T["text"],
+                 font=FONT_UI).pack(side="left")
+        tk.Entry(brow, textvariable=self.bargs_var, width=18,
+                 bg=T["entry_bg"], fg=T["entry_fg"],
+                 insertbackground=T["text"],
+                 relief="flat", font=FONT_MONO,
+                 highlightthickness=1,
+                 highlightbackground=T["border"],
+                 highlightcolor=T["blue"]).pack(side="left", padx=4)
+        tk.Label(brow, text="empty = stop the program at main",
+                 bg=T["panel"], fg=T["text_dim"], font=FONT_UI).pack(side="left")
+
+        prow = tk.Frame(body, bg=T["panel"])
+        prow.pack(anchor="w", padx=PAD, pady=(0, 10))
+        tk.Label(prow, text="Profile", bg=T["panel"], fg=T["text"],
+                 font=FONT_UI).pack(side="left")
+        menu = tk.OptionMenu(prow, self.profile_var, *PROFILES)
+        menu.configure(bg=T["btn_bg"], fg=T["text"],
+                       activebackground=T["btn_hov"],
+                       activeforeground=T["text"],
+                       highlightthickness=0, relief="flat",
+                       font=FONT_UI, width=9)
+        menu["menu"].configure(bg=T["btn_bg"], fg=T["text"], font=FONT_UI)
+        menu.pack(side="left", padx=(4, 30))
+        tk.Label(prow, text="Auto-tune for", bg=T["panel"], fg=T["text"],
+                 font=FONT_UI).pack(side="left")
+        for goal, label in (("size", "Size"), ("latency", "Startup")):
+            tk.Button(prow, text=label,
+                      bg=T["btn_bg"], fg=T["text"],
+                      activebackground=T["btn_hov"],
+                      activeforeground=T["text"],
+                      relief="flat", font=FONT_UI,
+                      cursor="hand2", padx=10, pady=3,
+                      command=lambda g=goal: self._start_autotune(g)
+                      ).pack(side="left", padx=(4, 0))
+        self._profile_hint = tk.Label(prow, bg=T["panel"], fg=T["text_dim"],
+                                      font=FONT_UI)
+        self._profile_hint.pack(side="left", padx=(12, 0))
+        self.profile_var.trace_add("write", lambda *_: self._profile_changed())
+        self._profile_changed()
+
+    def _profile_changed(self):
+        self._profile_hint.configure(
+            text=describe_profile({"profile": self.profile_var.get()}))
+
+    def _section_extras(self, p):
+        body  = self._card(p, "03  /  Additional Files  ( optional )")
+        inner = tk.Frame(body, bg=T["panel"])
+        inner.pack(fill="x", padx=PAD, pady=10)
+
+        lbf = tk.Frame(inner, bg=T["border"], padx=1, pady=1)
+        lbf.pack(side="left", fill="both", expand=True)
+
+        self._extras_lb = tk.Listbox(
+            lbf, height=3,
+            bg=T["log_bg"], fg=T["log_fg"],
+            selectbackground=T["select_bg"],
+            selectforeground="#fff",
+            font=FONT_MONO,
+            relief="flat", bd=0, activestyle="none",
+        )
+        self._extras_lb.pack(side="left", fill="both", expand=True)
+        sb = tk.Scrollbar(lbf, orient="vertical",
+                          command=self._extras_lb.yview,
+                          bg=T["border"], troughcolor=T["panel"])
+        sb.pack(side="right", fill="y")
+        self._extras_lb.configure(yscrollcommand=sb.set)
+
+        bcol = tk.Frame(inner, bg=T["panel"])
+        bcol.pack(side="left", padx=(8, 0))
+        for txt, fn in [("+ Add", self._add_extra),
+                        ("+ Folder", self._add_extra_dir),
+                        ("- Remove", self._remove_extra)]:
+            tk.Button(bcol, text=txt,
+                      bg=T["btn_bg"], fg=T["btn_fg"],
+                      activebackground=T["btn_hov"],
+                      activeforeground=T["text"],
+                      relief="flat", font=FONT_UI,
+                      cursor="hand2", width=10,
+                      command=fn).pack(pady=2)
+
+    def _section_python_info(self, p):
+        """Shows which Python will be used — critical for transparency."""
+        body = self._card(p, "04  /  Python Interpreter  ( detected automatically )")
+        row  = tk.Frame(body, bg=T["panel"])
+        row.pack(fill="x", padx=PAD, pady=8)
+
+        self._py_lbl = tk.Label(
+            row,
+            text="  Detecting Python interpreter ...",
+            bg=T["panel"], fg=T["text_dim"],
+            font=FONT_MONO, anchor="w",
+        )
+        self._py_lbl.pack(side="left", fill="x", expand=True)
+
+        tk.Button(row, text="Change",
+                  bg=T["btn_bg"], fg=T["btn_fg"],
+                  activebackground=T["btn_hov"],
+                  activeforeground=T["text"],
+                  relief="flat", font=FONT_UI,
+                  cursor="hand2", padx=8,
+                  command=self._browse_python).pack(side="right")
+
+    def _section_convert(self, p):
+        wrapper = tk.Frame(p, bg=T["bg"])
+        wrapper.pack(fill="x", padx=PAD, pady=(0, PAD))
+
+        self._conv_btn = tk.Button(
+            wrapper,
+            text="  CONVERT   .py  -->  .exe  ",
+            font=("Consolas", 14, "bold"),
+            bg=T["accent"],
+            fg="#ffffff",
+            activebackground=T["accent_hov"],
+            activeforeground="#ffffff",
+            relief="flat", cursor="hand2",
+            pady=16, bd=0,
+            command=self._start_build,
+        )
+        self._conv_btn.pack(fill="x")
+
+        prow = tk.Frame(wrapper, bg=T["bg"])
+        prow.pack(fill="x", pady=(6, 0))
+        self._progress = ttk.Progressbar(prow, mode="indeterminate")
+        self._progress.pack(side="left", fill="x", expand=True, padx=(0, 6))
+        tk.Button(prow, text="Clear Log",
+                  bg=T["btn_bg"], fg=T["text_dim"],
+                  activebackground=T["btn_hov"],
+                  activeforeground=T["text"],
+                  relief="flat", font=FONT_UI,
+                  cursor="hand2", padx=10, pady=3,
+                  command=self._clear_log).pack(side="right")
+        tk.Button(prow, text="Clear Cache",
+                  bg=T["btn_bg"], fg=T["text_dim"],
+                  activebackground=T["btn_hov"],
+                  activeforeground=T["text"],
+                  relief="flat", font=FONT_UI,
+                  cursor="hand2", padx=10, pady=3,
+                  command=self._clear_cache).pack(side="right", padx=(0, 6))
+
+        # Hidden until success
+        self._open_btn = tk.Button(
+            wrapper,
+            text="  Open Output Folder  ",
+            font=("Consolas", 10, "bold"),
+            bg="#0d3321", fg=T["ok"],
+            activebackground="#1a5c38",
+            activeforeground="#fff",
+            relief="flat", cursor="hand2",
+            pady=8, bd=0,
+            command=self._open_output,
+        )
+
+    def _section_queue(self, p):
+        body = self._card(p, "05  /  Build Queue")
+        row  = tk.Frame(body, bg=T["panel"])
+        row.pack(fill="x", padx=PAD, pady=(8, 4))
+
+        self._queue_lb = tk.Listbox(
+            row, height=5,
+            bg=T["log_bg"], fg=T["log_fg"],
+            selectbackground=T["select_bg"],
+            selectforeground="#fff",
+            font=FONT_MONO,
+            relief="flat", bd=0, activestyle="none",
+            exportselection=False,
+        )
+        self._queue_lb.pack(side="left", fill="x", expand=True)
+        self._queue_lb.bind("<<ListboxSelect>>", self._job_selected)
+
+        col = tk.Frame(row, bg=T["panel"])
+        col.pack(side="right", padx=(8, 0))
+        for txt, cmd in (("Up",         lambda: self._move_job(-1)),
+                         ("Down",       lambda: self._move_job(+1)),
+                         ("Cancel",     self._cancel_job),
+                         ("Remove",     self._remove_job),
+                         ("Clear Done", self._clear_finished)):
+            tk.Button(col, text=txt, width=10,
+                      bg=T["btn_bg"], fg=T["btn_fg"],
+                      activebackground=T["btn_hov"],
+                      activeforeground=T["text"],
+                      relief="flat", font=FONT_UI,
+                      cursor="hand2",
+                      command=cmd).pack(fill="x", pady=(0, 3))
+
+        prow = tk.Frame(body, bg=T["panel"])
+        prow.pack(fill="x", padx=PAD, pady=(0, 8))
+        tk.Label(prow, text="Parallel builds",
+                 bg=T["panel"], fg=T["text"],
+                 font=FONT_UI).pack(side="left")
+        tk.Spinbox(prow, from_=1, to=max(8, os.cpu_count() or 1), width=3,
+                   textvariable=self.parallel_var,
+                   bg=T["entry_bg"], fg=T["entry_fg"],
+                   buttonbackground=T["btn_bg"],
+                   relief="flat", font=FONT_UI,
+                   state="disabled" if self._remote else "normal",
+                   command=self._set_parallel).pack(side="left", padx=6)
+        tk.Label(prow,
+                 text=f"on the build daemon at {self._remote}  ·  shared "
+                      "with every client" if self._remote else
+                      "jobs start in list order  ·  select one to see its log",
+                 bg=T["panel"], fg=T["text_dim"],
+                 font=("Consolas", 8)).pack(side="left", padx=(6, 0))
+
+    def _section_log(self, p):
+        body = self._card(p, "06  /  Build Log")
+        bar  = tk.Frame(body, bg=T["panel"])
+        bar.pack(fill="x", padx=PAD, pady=4)
+        self._logpath_lbl = tk.Label(
+            bar, text=f"  Showing the newest {LOG_MAX_LINES} lines",
+            bg=T["panel"], fg=T["text_dim"],
+            font=("Consolas", 8), anchor="w",
+        )
+        self._logpath_lbl.pack(side="left", fill="x", expand=True)
+        tk.Button(bar, text="Load Earlier",
+                  bg=T["btn_bg"], fg=T["text_dim"],
+                  activebackground=T["btn_hov"],
+                  activeforeground=T["text"],
+                  relief="flat", font=FONT_UI,
+                  cursor="hand2", padx=8,
+                  command=self._load_earlier).pack(side="right")
+        self._log = scrolledtext.ScrolledText(
+            body,
+            font=FONT_MONO,
+            bg=T["log_bg"], fg=T["log_fg"],
+            insertbackground=T["text"],
+            selectbackground=T["select_bg"],
+            relief="flat", bd=0,
+            state="disabled", wrap="none",
+            height=14,
+        )
+        self._log.pack(fill="both", expand=True, padx=1, pady=(0, 1))
+        self._log.tag_configure("ok",   foreground=T["ok"])
+        self._log.tag_configure("err",  foreground=T["danger"])
+        self._log.tag_configure("warn", foreground=T["warn"])
+        self._log.tag_configure("cmd",  foreground="#79c0ff")
+        self._log.tag_configure("head", foreground="#e3b341",
+                                font=("Consolas", 9, "bold"))
+        self._log.tag_configure("dim",  foreground=T["text_dim"])
+        tk.Frame(p, bg=T["bg"], height=PAD).pack()
+
+    # ══════════════════════════════════════════
+    #  BROWSE  DIALOGS
+    # ══════════════════════════════════════════
+    def _browse_script(self):
+        p = filedialog.askopenfilename(
+            title="Select Python Script",
+            filetypes=[("Python files", "*.py *.pyw"), ("All files", "*.*")],
+        )
+        if p:
+            self.script_var.set(p)
+            if not self.output_var.get():
+                self.output_var.set(str(Path(p).parent / "dist"))
+
+    def _browse_output(self):
+        p = filedialog.askdirectory(title="Select Output Folder")
+        if p:
+            self.output_var.set(p)
+
+    def _browse_icon(self):
+        p = filedialog.askopenfilename(
+            title="Select Icon File",
+            filetypes=[("Icon files", "*.ico"), ("All files", "*.*")],
+        )
+        if p:
+            self.icon_var.set(p)
+
+    def _browse_python(self):
+        p = filedialog.askopenfilename(
+            title="Select python.exe",
+            filetypes=[("Python executable", "python*.exe"), ("All files", "*.*")],
+        )
+        if p:
+            self._python_exe = p
+            self._py_lbl.configure(text=f"  {p}", fg=T["ok"])
+            self._check_pyinstaller()
+
+    # ══════════════════════════════════════════
+    #  BACKGROUND  PYINSTALLER  CHECK
+    #  Runs at startup and whenever the interpreter changes, so
+    #  CONVERT normally finds the answer already waiting.
+    # ══════════════════════════════════════════
+    def _check_pyinstaller(self):
+        exe = self._python_exe
+        if exe and exe not in self._pi_status:
+            threading.Thread(target=self._probe_pyinstaller,
+                             args=(exe,), daemon=True).start()
+
+    def _probe_pyinstaller(self, exe: str):
+        try:
+            status = pyinstaller_status(exe)
+        except OSError:
+            status = None
+        self.after(0, self._pyinstaller_checked, exe, status)
+
+    def _pyinstaller_checked(self, exe: str, status):
+        if status is None:
+            return
+        self._pi_status[exe] = status
+        if exe != self._python_exe:
+            return
+        if status["available"]:
+            self._py_lbl.configure(
+                text=f"  {exe}   ·   PyInstaller {status['version']}",
+                fg=T["ok"])
+        else:
+            self._py_lbl.configure(
+                text=f"  {exe}   ·   PyInstaller not installed",
+                fg=T["warn"])
+
+    def _add_extra(self):
+        for p in filedialog.askopenfilenames(title="Select Files to Bundle"):
+            if p not in self.extra_files:
+                self.extra_files.append(p)
+                self._extras_lb.insert("end", f"  {os.path.basename(p)}")
+
+    def _add_extra_dir(self):
+        p = filedialog.askdirectory(title="Select a Folder to Bundle")
+        if p and p not in self.extra_files:
+            self.extra_files.append(p)
+            self._extras_lb.insert("end", f"  {os.path.basename(p)}{os.sep}  "
+                                          "(folder, structure kept)")
+
+    def _remove_extra(self):
+        for i in reversed(self._extras_lb.curselection()):
+            self._extras_lb.delete(i)
+            self.extra_files.pop(i)
+
+    # ══════════════════════════════════════════
+    #  LOG  UTILITIES
+    # ══════════════════════════════════════════
+    def _log_write(self, text: str, tag: str = ""):
+        """Append from the UI thread — keeps order with queued build output."""
+        if self._logfile:
+            self._logfile.write(text)
+        self._logq.put(text, tag)
+        self._flush_log()
+
+    def _log_insert(self, runs: list):
+        """One widget update for a whole batch of (text, tag) runs."""
+        if not runs:
+            return
+        args = []
+        for text, tag in runs:
+            args += [text, tag or ()]
+        follow = self._log.yview()[1] >= 0.999
+        self._log.configure(state="normal")
+        self._log.insert("end", *args)
+        # Ring buffer — the complete log is on disk (_logfile)
+        total  = int(self._log.index("end-1c").split(".")[0])
+        excess = total - (LOG_MAX_LINES + self._log_paged)
+        if excess > 0:
+            self._log.delete("1.0", f"{excess + 1}.0")
+            self._log_first += excess
+        if follow:
+            self._log.see("end")
+        self._log.configure(state="disabled")
+
+    def _load_earlier(self):
+        """Page the previous LOG_PAGE_LINES lines back in from the log file."""
+        if not self._logfile or self._log_first <= 0:
+            self._set_status("Nothing earlier — the whole log is shown.")
+            return
+        start = max(0, self._log_first - LOG_PAGE_LINES)
+        text  = self._logfile.read_lines(start, self._log_first)
+        self._log.configure(state="normal")
+        self._log.insert("1.0", text, "dim")
+        self._log.configure(state="disabled")
+        self._log.see("1.0")
+        self._log_paged += self._log_first - start
+        self._log_first  = start
+
+    def _pump_log(self):
+        """Frame clock: render whatever the build thread queued since last tick."""
+        self._log_insert(self._logq.drain(LOG_FRAME_CHARS))
+        self.after(LOG_FRAME_MS, self._pump_log)
+
+    def _flush_log(self):
+        self._log_insert(self._logq.drain())
+
+    def _clear_log(self):
+        self._logq.clear()
+        self._log_first = self._log_paged = 0
+        self._log.configure(state="normal")
+        self._log.delete("1.0", "end")
+        self._log.configure(state="disabled")
+
+    def _clear_cache(self):
+        n = clear_build_cache()
+        self._log_write(f"Build cache cleared  ({n} entries removed)\n", "dim")
+
+    def _set_status(self, text: str, dot: str = T["text_dim"]):
+        self._status.configure(text=f"  {text}")
+        self._dot.configure(fg=dot)
+
+    def _unlock_ui(self):
+        """Always re-enable the convert button — called on any build exit."""
+        self._progress.stop()
+        self._conv_btn.configure(
+            state="normal",
+            text="  CONVERT   .py  -->  .exe  ",
+            bg=T["accent"],
+            command=self._start_build,
+        )
+
+    # ══════════════════════════════════════════
+    #  VALIDATION
+    # ══════════════════════════════════════════
+    def _validate(self) -> bool:
+        if not self._python_exe and self._starting:
+            messagebox.showinfo(
+                "Please Wait",
+                "Still locating the Python interpreter — try again in a moment.",
+            )
+            return False
+        if not self._python_exe:
+            messagebox.showerror(
+                "Python Not Found",
+                "No Python interpreter was detected.\n\n"
+                "Use the 'Change' button in section 04 to manually\n"
+                "locate your python.exe file.",
+            )
+            return False
+        s = self.script_var.get().strip()
+        if not s:
+            messagebox.showwarning("No Script",
+                                   "Please select a .py file first.")
+            return False
+        if not os.path.isfile(s):
+            messagebox.showerror("Not Found", f"File not found:\n{s}")
+            return False
+        ico = self.icon_var.get().strip()
+        if ico and not os.path.isfile(ico):
+            messagebox.showerror("Icon Not Found",
+                                 f"Icon file not found:\n{ico}")
+            return False
+        try:
+            shlex.split(self.bargs_var.get())
+        except ValueError as exc:
+            messagebox.showerror("Benchmark Arguments",
+                                 f"Cannot read the startup benchmark "
+                                 f"arguments:\n{exc}")
+            return False
+        return True
+
+    # ══════════════════════════════════════════
+    #  BUILD  PIPELINE
+    # ══════════════════════════════════════════
+    def _ready(self) -> bool:
+        """Form valid and PyInstaller installed (offers to install it)."""
+        if not self._validate():
+            return False
+        status = self._pi_status.get(self._python_exe)
+        if not (status and status["available"]):
+            if not ensure_pyinstaller(self._python_exe):
+                return False
+            self._pi_status.pop(self._python_exe, None)
+            self._check_pyinstaller()
+        return True
+
+    def _start_build(self):
+        if not self._ready():
+            return
+        cfg = self._options()
+        if self.watch_var.get():
+            self._start_watch(cfg)
+            return
+        self._enqueue([cfg])
+
+    # ── Watch mode: CONVERT becomes STOP WATCHING until pressed ──
+    def _start_watch(self, cfg: dict):
+        if self._queue.busy():
+            messagebox.showinfo(
+                "Busy",
+                "Watch mode starts once the Build Queue is empty.\n"
+                "Untick 'Watch & rebuild on save' to queue this build.")
+            return
+        self._shown   = None
+        self._logfile = None
+        self._lock_ui("  STOP  WATCHING  ",
+                      "Watching  ...  first build running.",
+                      Path(cfg["script"]).stem + "-watch")
+        self._conv_btn.configure(state="normal", bg=T["warn"],
+                                 command=self._stop_watch)
+        self._watcher = BuildWatcher(
+            cfg, self._python_exe, self._emitter(),
+            lambda r: self.after(0, self._watch_result, r))
+        self._thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self._thread.start()
+
+    def _watch_loop(self):
+        self._watcher.run()
+        self.after(0, self._watch_stopped)
+
+    def _stop_watch(self):
+        self._conv_btn.configure(state="disabled", text="  Stopping  ...  ")
+        self._watcher.stop()
+
+    def _watch_result(self, result: dict):
+        ts = time.strftime("%H:%M:%S")
+        if result["success"]:
+            self._show_open(result["abs_dist"])
+            self._set_status(f"Watching  ...  built at {ts} in "
+                             f"{result['seconds']:.1f}s.", T["ok"])
+        elif result["cancelled"]:
+            self._set_status("Watching  ...  change detected, rebuilding.",
+                             T["blue"])
+        else:
+            self._set_status(f"Watching  ...  build FAILED at {ts}.  "
+                             "Fix the script and save again.", T["danger"])
+
+    def _watch_stopped(self):
+        self._watcher = None
+        self._flush_log()
+        self._unlock_ui()
+        self._close_logfile()
+        self._set_status("Stopped watching.")
+
+    def _open_matrix(self):
+        if self._watcher:
+            messagebox.showinfo("Busy", "Stop watching first.")
+            return
+        if self._validate():
+            MatrixDialog(self)
+
+    def _start_matrix(self, pythons: list, modes: list, windows: list):
+        self._enqueue(matrix_variants(self._options(), pythons, modes, windows))
+
+    def _start_autotune(self, goal: str):
+        """Build once per profile, then benchmark and recommend one."""
+        if self._watcher:
+            messagebox.showinfo("Busy", "Stop watching first.")
+            return
+        if not self._ready():
+            return
+        variants = autotune_variants(self._options())
+        jobs     = self._enqueue(variants)
+        if len(jobs) == len(variants):
+            self._tunes.append({"goal": goal, "variants": variants,
+                                "jobs": jobs})
+
+    def _options(self) -> dict:
+        """The cfg dict described by the form."""
+        return {
+            "script":      self.script_var.get().strip(),
+            "output_dir":  self.output_var.get().strip() or None,
+            "icon":        self.icon_var.get().strip() or None,
+            "onefile":     self.onefile_var.get(),
+            "windowed":    self.windowed_var.get(),
+            "extra_files": list(self.extra_files),
+            "use_cache":   self.cache_var.get(),
+            "import_scan": self.scan_var.get(),
+            "auto_exclude": self.autoex_var.get(),
+            "timeout":     60 * self._int_option(self.timeout_var),
+            "nice":        10 if self.lowprio_var.get() else 0,
+            "memory_mb":   self._int_option(self.memcap_var),
+            "bench_runs":  self._int_option(self.bench_var),
+            "bench_args":  shlex.split(self.bargs_var.get())
+                           if self.bargs_var.get().strip() else None,
+            "profile":     self.profile_var.get(),
+            "dedupe":      self.dedupe_var.get(),
+            "spec":        self.spec_var.get(),
+        }
+
+    @staticmethod
+    def _int_option(var) -> int:
+        try:
+            return max(0, int(var.get()))
+        except (ValueError, tk.TclError):
+            return 0
+
+    def _lock_ui(self, button: str, status: str, log_name: str):
+        """Busy state + a fresh log (widget and file) for a new run."""
+        self._show_open("")
+        self._conv_btn.configure(
+            state="disabled",
+            text=button,
+            bg=T["accent_dim"],
+        )
+        self._progress.start(8)
+        self._set_status(status, T["blue"])
+        self._clear_log()
+        if self._logfile:
+            self._logfile.close()
+        try:
+            self._logfile = BuildLogFile(log_name)
+            self._logpath_lbl.configure(
+                text=f"  Newest {LOG_MAX_LINES} lines  ·  full log: "
+                     f"{self._logfile.path}")
+        except OSError as exc:
+            self._logfile = None
+            self._log_write(f"Full log not saved: {exc}\n", "warn")
+
+    def _emitter(self):
+        """emit() for build threads: log file + queue, never Tk directly."""
+        logfile = self._logfile
+
+        def emit(text, tag=""):
+            if logfile:
+                logfile.write(text)
+            self._logq.put(text, tag)
+        return emit
+
+    def _show_open(self, folder: str):
+        """Show the Open Output Folder button for folder, or hide it."""
+        if folder:
+            self._last_out = folder
+        if folder and not self._open_visible:
+            self._open_btn.pack(fill="x", pady=(8, 0))
+        elif not folder and self._open_visible:
+            self._open_btn.pack_forget()
+        self._open_visible = bool(folder)
+
+    # ══════════════════════════════════════════
+    #  BUILD  QUEUE
+    #  Worker threads only write job logs and _logq (for the
+    #  job on screen); everything else happens here via after().
+    # ══════════════════════════════════════════
+    def _make_queue(self, remote: bool):
+        """A local BuildQueue, or a thin client of the build daemon."""
+        def on_change(job):
+            self.after(0, self._queue_changed, job)
+
+        if remote:
+            try:
+                queue = RemoteQueue(DaemonClient(timeout=3.0),
+                                    self._job_output, on_change)
+                self._remote = queue.client.url
+                self.parallel_var.set(queue.limit)
+                return queue
+            except (OSError, ValueError) as exc:
+                self._remote_err = str(exc)
+        return BuildQueue(QUEUE_PARALLEL, self._job_output, on_change)
+
+    def _enqueue(self, cfgs: list) -> list:
+        if not self._queue.busy():
+            self._batch = []
+            self._progress.start(8)
+        jobs = []
+        for cfg in cfgs:
+            try:
+                jobs.append(self._queue.add(cfg, self._python_exe))
+            except (OSError, ValueError) as exc:     # daemon refused / gone
+                if not self._queue.busy():
+                    self._progress.stop()
+                self._set_status("Not queued.", T["danger"])
+                messagebox.showerror("Build Daemon", str(exc))
+                break
+        self._batch += jobs
+        if len(jobs) > 1:
+            self._set_status(f"Queued {len(jobs)} builds.", T["blue"])
+        return jobs
+
+    def _job_output(self, job, text: str, tag: str):
+        """Worker thread, job.lock held: forward if the job is on screen."""
+        if job is self._shown:
+            self._logq.put(text, tag)
+
+    def _job_write(self, job, text: str, tag: str = ""):
+        with job.lock:
+            if job.log:
+                job.log.write(text)
+            self._job_output(job, text, tag)
+        self._flush_log()
+
+    def _show_job(self, job):
+        """Put a job's log in the Build Log card — its tail from disk."""
+        if job is self._shown or self._watcher:
+            return
+        with job.lock:
+            self._shown   = job
+            self._logfile = job.log
+            self._clear_log()
+            if job.log:
+                first = max(0, job.log.lines - LOG_MAX_LINES)
+                self._logq.put(job.log.read_lines(first, job.log.lines), "")
+                self._log_first = first
+        self._flush_log()
+        where = f"full log: {job.log.path}" if job.log else "waiting to start"
+        self._logpath_lbl.configure(text=f"  #{job.id}  {job.label}  ·  {where}")
+        done = job.result and job.result["success"]
+        self._show_open(job.result["abs_dist"] if done else "")
+
+    def _job_selected(self, event=None):
+        sel = self._queue_lb.curselection()
+        if sel and sel[0] < len(self._queue_rows):
+            job = self._queue.get(self._queue_rows[sel[0]])
+            if job:
+                self._show_job(job)
+
+    def _selected_job(self):
+        sel = self._queue_lb.curselection()
+        if sel and sel[0] < len(self._queue_rows):
+            return self._queue_rows[sel[0]]
+        return None
+
+    def _move_job(self, delta: int):
+        job_id = self._selected_job()
+        if job_id is not None:
+            self._queue.move(job_id, delta)
+
+    def _remove_job(self):
+        job_id = self._selected_job()
+        if job_id is None:
+            return
+        job = self._queue.get(job_id)
+        if job and job.state == "running":
+            self._job_write(job, "\nCancelling ...\n", "warn")
+        self._queue.remove(job_id)
+
+    def _cancel_job(self):
+        job = self._queue.get(self._selected_job() or 0)
+        if job and job.state in ("queued", "running"):
+            self._remove_job()
+
+    def _clear_finished(self):
+        for job in self._queue.clear_finished():
+            if job is self._shown:
+                self._shown = self._logfile = None
+                self._clear_log()
+                self._show_open("")
+
+    def _set_parallel(self):
+        try:
+            self._queue.set_limit(int(self.parallel_var.get()))
+        except (ValueError, tk.TclError):
+            self.parallel_var.set(self._queue.limit)
+
+    def _queue_changed(self, job):
+        if job.result and job.id not in self._reported:
+            self._reported.add(job.id)
+            self._job_finished(job)
+        elif job.state == "running" and \
+                (self._shown is None or self._shown.state != "running"):
+            self._show_job(job)
+        self._refresh_queue()
+        running, queued = self._queue.counts()
+        if running or queued:
+            self._set_status(f"Building  ...  {running} running, "
+                             f"{queued} queued.", T["blue"])
+            if not self._ticking:
+                self._ticking = True
+                self.after(QUEUE_TICK_MS, self._tick_queue)
+
+    def _tick_queue(self):
+        """Keep the elapsed time of running jobs current."""
+        self._refresh_queue()
+        if self._queue.busy():
+            self.after(QUEUE_TICK_MS, self._tick_queue)
+        else:
+            self._ticking = False
+
+    def _refresh_queue(self):
+        jobs = list(self._queue.jobs)
+        keep = self._selected_job()
+        self._queue_rows = [j.id for j in jobs]
+        self._queue_lb.delete(0, "end")
+        for i, j in enumerate(jobs):
+            took = f"{j.seconds:6.1f}s" if j.started else ""
+            size = format_bytes(j.result["size"]) \
+                if j.result and j.result.get("size") else ""
+            self._queue_lb.insert(
+                "end", f" #{j.id:<3} {j.label[:28]:<28} {j.state.upper():<9} "
+                       f"{took:>8} {size:>9}")
+            self._queue_lb.itemconfigure(i, fg=T[JOB_COLORS[j.state]])
+            if j.id == keep:
+                self._queue_lb.selection_set(i)
+
+    def _job_finished(self, job):
+        r    = job.result
+        ts   = time.strftime("%H:%M:%S")
+        exe  = r["exe"]
+        if r["cancelled"]:
+            self._job_write(job, f"\n[ {ts} ]  Build cancelled.\n", "warn")
+        elif r["timed_out"]:
+            self._job_write(job, f"\n[ {ts} ]  Build stopped — it ran longer "
+                                 f"than {_duration(job.cfg['timeout'])}.\n",
+                            "err")
+        elif r["exit_ok"] and os.path.isfile(exe):
+            self._job_write(job, f"\n[ {ts} ]  Build succeeded\n", "ok")
+            self._job_write(job, f"  Executable : {exe}\n", "ok")
+        elif r["exit_ok"]:
+            # PyInstaller said OK but no file found — common with antivirus
+            self._job_write(
+                job, f"\n[ {ts} ]  PyInstaller finished OK but .exe was NOT "
+                     f"found.\n  Expected: {exe}\n", "warn")
+            self._job_write(
+                job,
+                "\n  Most likely causes:\n"
+                "  1. Antivirus deleted the .exe immediately after creation\n"
+                "     --> Add your output folder to antivirus exclusions\n"
+                "  2. The output folder was changed mid-build\n"
+                "  3. A previous .spec file conflict (delete __pybuild_tmp__)\n",
+                "warn")
+        else:
+            self._job_write(job, f"\n[ {ts} ]  Build FAILED.  See log above.\n",
+                            "err")
+        if job.log:
+            # Runs once the lines above are written (the message boxes
+            # below spin the event loop) so the log file is complete
+            self.after_idle(job.log.close)
+        if job is self._shown and r["success"]:
+            self._show_open(r["abs_dist"])
+        for tune in list(self._tunes):
+            if all(j.result for j in tune["jobs"]):
+                self._tunes.remove(tune)
+                self._measure_tune(tune)
+        if not self._queue.busy():
+            self._batch_finished()
+
+    def _measure_tune(self, tune: dict):
+        """All variants built: benchmark them off the Tk thread."""
+        results = [j.result for j in tune["jobs"]]
+        if any(r["cancelled"] for r in results):
+            return
+        self._set_status(f"Auto-tune: measuring startup of "
+                         f"{len(results)} profiles ...", T["blue"])
+
+        def work():
+            tune_measure(tune["variants"], results)
+            self.after(0, self._tune_finished, tune, results)
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def _tune_finished(self, tune: dict, results: list):
+        goal   = tune["goal"]
+        winner = recommend_profile(tune["variants"], results, goal)
+        table  = tune_lines(tune["variants"], results, winner, width=56)
+        job    = tune["jobs"][-1]
+        self._job_write(job, f"\nAuto-tune ({goal}):\n" +
+                        "\n".join(table) + "\n", "head")
+        if winner is None:
+            self._set_status("Auto-tune: no profile built.", T["danger"])
+            messagebox.showerror("Auto-tune",
+                                 "No profile produced a usable build.\n"
+                                 "Select a job in the Build Queue to see why.")
+            return
+        name = winner["profile"]
+        self._set_status(f"Auto-tune: '{name}' is best for {goal}.", T["ok"])
+        if messagebox.askyesno(
+                "Auto-tune",
+                f"Best profile for {goal}:  {name}\n"
+                f"({describe_profile(winner)})\n\n" +
+                "\n".join(table[1:-1]) +
+                f"\n\nUse '{name}' for the next builds?"):
+            self.profile_var.set(name)
+
+    def _batch_finished(self):
+        """The queue ran dry: one popup for the whole batch."""
+        self._progress.stop()
+        done, self._batch = [j for j in self._batch if j.result], []
+        if any(j.cfg.get("_defer_bench") for j in done):
+            done = [j for j in done if not j.cfg.get("_defer_bench")]
+            if not done:                        # auto-tune reports itself
+                return
+        if len(done) == 1:
+            self._build_popup(done[0])
+            return
+        ok = sum(1 for j in done if j.result["success"])
+        if not done:
+            self._set_status("Build queue is empty.")
+        elif ok == len(done):
+            self._set_status(f"Done.   {ok} builds succeeded.", T["ok"])
+            messagebox.showinfo(
+                "Builds Successful",
+                f"All {ok} queued builds were created successfully.\n\n"
+                "Select a job in the Build Queue to see its log.")
+        else:
+            failed = [j.label for j in done if not j.result["success"]]
+            self._set_status(f"{len(failed)} of {len(done)} builds failed.  "
+                             "See the Build Queue.", T["danger"])
+            messagebox.showerror(
+                "Build Queue",
+                f"{ok} of {len(done)} builds succeeded.  Failed:\n\n  " +
+                "\n  ".join(failed[:10]) +
+                "\n\nSelect a job in the Build Queue to see its log.")
+
+    def _build_popup(self, job):
+        r    = job.result
+        exe  = r["exe"]
+        name = os.path.basename(exe) or job.label
+
+        if r["cancelled"]:
+            self._set_status("Build cancelled.", T["warn"])
+
+        elif r["timed_out"]:
+            self._set_status("Build stopped by the timeout.", T["danger"])
+            messagebox.showerror(
+                "Build Timed Out",
+                f"'{job.label}' ran longer than "
+                f"{_duration(job.cfg['timeout'])} and was stopped.\n\n"
+                "A hook may be hanging — check the end of the Build Log,\n"
+                "or raise the Timeout in Section 02.")
+
+        elif r["exit_ok"] and os.path.isfile(exe):
+            # Real success — exe exists on disk
+            size = ""
+            if r["size"]:
+                size = f"\n\nSize: {format_bytes(r['size'])}  " \
+                       f"(breakdown in {os.path.basename(r['report'])})"
+            warm = r["startup"].get("warm", {}).get("to_main_ms")
+            if warm:
+                size += f"\nStartup: {warm['p50']:.0f} ms to main (warm p50)"
+            self._set_status(f"Done.   {name}  -->  {r['abs_dist']}", T["ok"])
+            messagebox.showinfo(
+                "Build Successful",
+                f"'{name}' was created successfully.\n\n"
+                f"Location:\n{exe}{size}",
+            )
+
+        elif r["exit_ok"]:
+            self._set_status(
+                "Build finished but .exe not found.  Antivirus?", T["warn"])
+            messagebox.showwarning(
+                "EXE Not Found",
+                f"PyInstaller finished without errors but\n"
+                f"'{name}' was not found at:\n{exe}\n\n"
+                "Most likely cause: Antivirus deleted it.\n\n"
+                "Fix: Add your output folder to antivirus exclusions,\n"
+                "then build again.",
+            )
+
+        else:
+            # Real failure
+            self._set_status(
+                "Build failed.  See the Build Log for details.", T["danger"])
+            messagebox.showerror(
+                "Build Failed",
+                "PyInstaller encountered errors.\n"
+                "Read the Build Log carefully — the first red line\n"
+                "is usually the root cause.",
+            )
+
+    def _close_logfile(self):
+        if self._logfile:
+            self._logfile.close()
+
+    def _open_output(self):
+        if self._last_out and os.path.isdir(self._last_out):
+            open_folder(self._last_out)
+        else:
+            messagebox.showwarning("Not Found",
+                                   "Output folder no longer exists.")
+
+
+# ══════════════════════════════════════════════════════════
+#  ENTRY  POINT
+# ══════════════════════════════════════════════════════════
+def run_gui(splash: bool = True, timer=None, trace: str = "",
+            remote: bool = False):
+    if os.environ.get("PYTOEXE_NO_SPLASH") == "1":
+        splash = False
+    timer = timer or PhaseTimer()
+    with timer.phase("app_init"):
+        app = App(splash=splash, timer=timer, trace=trace, remote=remote)
+    app.mainloop()
+
+
+if __name__ == "__main__":
+    run_gui()